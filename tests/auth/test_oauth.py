@@ -1,6 +1,8 @@
 import json
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
@@ -98,6 +100,31 @@ class TestOAuth:
             assert token.expires_in == 604799
             assert not hasattr(token, "refresh_token_expires_in")
 
+    def test_refreshing_token_refreshes_once(self):
+        credentials = mock.Mock(spec=OAuthCredentials)
+        barrier = threading.Barrier(8)
+
+        def refresh_token(refresh_token):
+            time.sleep(0.05)  # let the other threads find the token expiring
+            return {"access_token": "fresh_access_token", "expires_in": 3600}
+
+        credentials.refresh_token.side_effect = refresh_token
+        token = RefreshingToken(
+            credentials=credentials,
+            scope="https://www.googleapis.com/auth/youtube",
+            token_type="Bearer",
+            access_token="expired_access_token",
+            refresh_token="test_refresh_token",
+        )
+
+        def access_token(_):
+            barrier.wait()
+            return token.access_token
+
+        with ThreadPoolExecutor(8) as executor:
+            assert set(executor.map(access_token, range(8))) == {"fresh_access_token"}
+        credentials.refresh_token.assert_called_once_with("test_refresh_token")
+
     def test_oauth_token_dict_ignores_unexpected_fields(self):
         """Regression for #887 / #921: a saved oauth.json may contain extra
         fields like ``refresh_token_expires_in`` (added to Google's device-flow
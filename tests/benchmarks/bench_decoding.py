@@ -0,0 +1,52 @@
+"""
+Benchmark of the JSON decoders on the largest recorded responses
+
+Run with ``python -m tests.benchmarks.bench_decoding``. Backends that are not installed are skipped.
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi.decoder import BACKENDS, get_decoder
+
+DATA = Path(__file__).parent.parent / "data"
+FIXTURES = 4
+REPEAT = 5
+
+
+def decoders() -> dict[str, Callable[[bytes], Any]]:
+    """the previous str-based decoding, followed by all installed backends"""
+    result: dict[str, Callable[[bytes], Any]] = {
+        "json.loads(str)": lambda content: json.loads(content.decode())
+    }
+    for backend in BACKENDS:
+        try:
+            result[backend] = get_decoder(backend)
+        except ImportError:
+            print(f"{backend} is not installed")
+    return result
+
+
+def main() -> None:
+    paths = sorted(DATA.glob("*.json"), key=lambda path: path.stat().st_size, reverse=True)[:FIXTURES]
+    candidates = decoders()
+    print(f"{'':<40}" + "".join(f"{name:>18}" for name in candidates))
+    for path in paths:
+        content = path.read_bytes()
+        number = max(1, 20_000_000 // len(content))
+        timings = [
+            min(timeit.repeat(partial(decode, content), number=number, repeat=REPEAT)) / number
+            for decode in candidates.values()
+        ]
+        print(
+            f"{path.stem} ({len(content) // 1024} KiB)".ljust(40)
+            + "".join(f"{seconds * 1e3:>15.2f} ms" for seconds in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
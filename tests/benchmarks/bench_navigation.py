@@ -0,0 +1,54 @@
+"""
+Micro-benchmark of compiled navigation paths and the parsers using them
+
+Run with ``python -m tests.benchmarks.bench_navigation``
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi.navigation import *
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.parsers.search import parse_search_results
+from ytmusicapi.parsers.songs import parse_song_runs
+
+DATA = Path(__file__).parent.parent / "data"
+REPEAT = 5
+
+
+def best_of(fn: Callable[[], Any], number: int) -> float:
+    """fastest time of a single call in seconds"""
+    return min(timeit.repeat(fn, number=number, repeat=REPEAT)) / number
+
+
+def playlist_items() -> list[dict]:
+    with open(DATA / "2024_03_get_playlist.json", encoding="utf8") as f:
+        response = json.load(f)
+    section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
+    return nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer", "contents"])
+
+
+def main() -> None:
+    items = playlist_items()
+    data = items[0][MRLIR]
+    path = [*PLAY_BUTTON, "playNavigationEndpoint", *WATCH_VIDEO_ID]
+    getter = compile_path(path, True)
+    runs = data["flexColumns"][1]["musicResponsiveListItemFlexColumnRenderer"]["text"]["runs"]
+
+    results = {
+        "nav()": best_of(lambda: nav(data, path, True), 100_000),
+        "compiled path": best_of(lambda: getter(data), 100_000),
+        "parse_playlist_items": best_of(lambda: parse_playlist_items(items), 20) / len(items),
+        "parse_search_results": best_of(lambda: parse_search_results(items, "song", "Songs"), 20)
+        / len(items),
+        "parse_song_runs": best_of(lambda: parse_song_runs(runs, skip_type_spec=True), 10_000),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<24}{seconds * 1e6:>10.2f} µs per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Benchmark of the parsers on the hot paths, fed with the recorded responses in ``tests/data``
+and with synthetic large pages built from them.
+
+Reports items parsed per second and the memory allocated while parsing, as measured by
+:mod:`tracemalloc`. Results can be saved and compared against a previous run,
+which exits with status 1 if a case became slower than the threshold::
+
+    python -m tests.benchmarks.bench_parsers --save baseline.json
+    python -m tests.benchmarks.bench_parsers --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import copy
+import gettext
+import json
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+from tests.fixtures import section_list, shelf_items
+from ytmusicapi.models.results import Track, item_parser
+from ytmusicapi.navigation import *
+from ytmusicapi.parsers.albums import parse_album_header_2024
+from ytmusicapi.parsers.browsing import parse_mixed_content
+from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.parsers.search import parse_search_results
+from ytmusicapi.type_alias import JsonDict, JsonList
+
+DATA = Path(__file__).parent.parent / "data"
+LOCALES = Path(__file__).parent.parent.parent / "ytmusicapi" / "locales"
+SYNTHETIC_SIZE = 2000
+
+
+@dataclass
+class Case:
+    """a parser call on a fixed input. ``items`` is the number of entities in the input"""
+
+    name: str
+    parse: "partial[Any]"
+    items: int
+
+
+@dataclass
+class Result:
+    name: str
+    items: int
+    items_per_second: float
+    peak_kib: float
+    allocated_blocks: int
+
+
+def load(name: str) -> JsonDict:
+    with open(DATA / name, encoding="utf8") as f:
+        response: JsonDict = json.load(f)
+    return response
+
+
+def fixtures(pattern: str) -> Iterator[tuple[str, JsonDict]]:
+    for path in sorted(DATA.glob(pattern)):
+        yield path.stem, load(path.name)
+
+
+def carousel_items(sections: JsonList) -> int:
+    return sum(len(nav(section, CAROUSEL_CONTENTS)) for section in sections if CAROUSEL[0] in section)
+
+
+def synthetic_page(items: JsonList, size: int) -> JsonList:
+    """a page of ``size`` distinct copies of the given items"""
+    return [copy.deepcopy(item) for item in islice(cycle(items), size)]
+
+
+def lazy_video_ids(results: JsonList) -> list[str | None]:
+    """the common case of reading a single field of each track, with lazy results"""
+    return [track.videoId for track in parse_playlist_items(results, parse_item=Track.parse)]
+
+
+def cases(synthetic_size: int = SYNTHETIC_SIZE) -> list[Case]:
+    parser = Parser(gettext.translation("base", localedir=LOCALES, languages=["en"]))
+    result: list[Case] = []
+    shelf_rows = []
+    for name, response in fixtures("*.json"):
+        is_album = "get_album" in name
+        if rows := shelf_items(response):
+            result.append(
+                Case(
+                    f"parse_playlist_items[{name}]", partial(parse_playlist_items, rows, is_album), len(rows)
+                )
+            )
+            if not is_album:  # album tracks lack the artist column of search results
+                shelf_rows.extend(rows)
+                result.append(
+                    Case(
+                        f"parse_search_results[{name}]",
+                        partial(parse_search_results, rows, "song"),
+                        len(rows),
+                    )
+                )
+        if is_album:
+            result.append(
+                Case(f"parse_album_header_2024[{name}]", partial(parse_album_header_2024, response), 1)
+            )
+        sections = section_list(response) or []
+        if count := carousel_items(sections):
+            if "get_artist" in name:  # same split as get_artist and get_home
+                channel = partial(parser.parse_channel_contents, sections)
+                result.append(Case(f"Parser.parse_channel_contents[{name}]", channel, count))
+            else:
+                result.append(
+                    Case(f"parse_mixed_content[{name}]", partial(parse_mixed_content, sections), count)
+                )
+
+    page = synthetic_page(shelf_rows, synthetic_size)
+    result.extend(
+        [
+            Case(
+                f"parse_playlist_items[synthetic {synthetic_size}]",
+                partial(parse_playlist_items, page),
+                len(page),
+            ),
+            Case(
+                f"parse_playlist_items[synthetic {synthetic_size}, lazy videoId]",
+                partial(lazy_video_ids, page),
+                len(page),
+            ),
+            Case(
+                f"parse_playlist_items[synthetic {synthetic_size}, fields videoId title]",
+                partial(
+                    parse_playlist_items,
+                    page,
+                    parse_item=item_parser(Track.parse, fields=["videoId", "title"]),
+                ),
+                len(page),
+            ),
+            Case(
+                f"parse_search_results[synthetic {synthetic_size}]",
+                partial(parse_search_results, page, "song"),
+                len(page),
+            ),
+            Case(
+                f"parse_search_results[synthetic {synthetic_size}, untyped]",
+                partial(parse_search_results, page),
+                len(page),
+            ),
+        ]
+    )
+    return result
+
+
+def measure(case: Case, number: int, repeat: int) -> Result:
+    """times the fastest of ``repeat`` runs of ``number`` calls, then traces the allocations of one call"""
+    seconds = min(timeit.repeat(case.parse, number=number, repeat=repeat)) / number
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        parsed = case.parse()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del parsed
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return Result(case.name, case.items, case.items / seconds, peak / 1024, blocks)
+
+
+def run(
+    selected: list[Case], number: int, repeat: int, report: Callable[[Result], None] = lambda result: None
+) -> list[Result]:
+    results = []
+    for case in selected:
+        result = measure(case, number, repeat)
+        report(result)
+        results.append(result)
+    return results
+
+
+def print_result(result: Result, baseline: Result | None = None) -> None:
+    line = (
+        f"{result.name:<64}{result.items:>6} items{result.items_per_second:>12,.0f} items/s"
+        f"{result.peak_kib:>10.1f} KiB peak{result.allocated_blocks:>8} blocks"
+    )
+    if baseline is not None:
+        line += f"{result.items_per_second / baseline.items_per_second - 1:>+9.1%}"
+    print(line)
+
+
+def regressions(results: list[Result], baseline: dict[str, Result], threshold: float) -> list[str]:
+    """names of cases which parse fewer items per second than ``(1 - threshold)`` times the baseline"""
+    return [
+        result.name
+        for result in results
+        if result.name in baseline
+        and result.items_per_second < baseline[result.name].items_per_second * (1 - threshold)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-k", "--filter", default="", help="only run cases containing this string")
+    parser.add_argument("-n", "--number", type=int, default=20, help="calls per timing run")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timing runs per case, the fastest counts"
+    )
+    parser.add_argument("--size", type=int, default=SYNTHETIC_SIZE, help="items of the synthetic pages")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, Result] = {}
+    if args.compare:
+        baseline = {entry["name"]: Result(**entry) for entry in json.loads(args.compare.read_text("utf8"))}
+
+    selected = [case for case in cases(args.size) if args.filter in case.name]
+    results = run(
+        selected, args.number, args.repeat, lambda result: print_result(result, baseline.get(result.name))
+    )
+
+    if args.save:
+        args.save.write_text(json.dumps([asdict(result) for result in results], indent=2), "utf8")
+    if slower := regressions(results, baseline, args.threshold):
+        print(f"\n{len(slower)} regression(s) slower than {args.threshold:.0%}:\n  " + "\n  ".join(slower))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import json
+
+from tests.benchmarks.bench_parsers import Result, cases, main, measure, regressions
+
+
+def test_cases_run_without_modifying_their_input():
+    selected = cases(synthetic_size=50)
+    assert {case.name.split("[")[0] for case in selected} == {
+        "parse_playlist_items",
+        "parse_search_results",
+        "parse_album_header_2024",
+        "parse_mixed_content",
+        "Parser.parse_channel_contents",
+    }
+    for case in selected:
+        arguments = json.dumps(case.parse.args)
+        result = measure(case, number=1, repeat=1)
+        assert result.items_per_second > 0
+        assert json.dumps(case.parse.args) == arguments, case.name
+
+
+def test_regressions(tmp_path):
+    baseline = {"a": Result("a", 10, 1000, 1, 1), "b": Result("b", 10, 1000, 1, 1)}
+    results = [Result("a", 10, 800, 1, 1), Result("b", 10, 700, 1, 1), Result("c", 10, 1, 1, 1)]
+    assert regressions(results, baseline, threshold=0.25) == ["b"]
+
+    saved = tmp_path / "baseline.json"
+    assert main(["-k", "2024_03_get_album", "-n", "1", "-r", "1", "--save", str(saved)]) == 0
+    entries = json.loads(saved.read_text("utf8"))
+    for entry in entries:
+        entry["items_per_second"] *= 100
+    saved.write_text(json.dumps(entries), "utf8")
+    assert main(["-k", "2024_03_get_album", "-n", "1", "-r", "1", "--compare", str(saved)]) == 1
@@ -1,8 +1,25 @@
 """Test fixtures to make life easier."""
 
+import copy
+import json
 from pathlib import Path
 
 import pytest
+import requests
+
+from ytmusicapi.navigation import (
+    CONTENT,
+    MRLIR,
+    MUSIC_SHELF,
+    SECTION,
+    SECTION_LIST,
+    SINGLE_COLUMN_TAB,
+    TAB_CONTENT,
+    TWO_COLUMN_RENDERER,
+    nav,
+)
+
+DATA_PATH = Path(__file__).parent / "data"
 
 
 @pytest.fixture(name="repo_path")
@@ -18,3 +35,148 @@ def fixture_tests_base_path(request: pytest.FixtureRequest) -> Path:
 @pytest.fixture(name="data_path")
 def fixture_data_path(tests_base_path: Path) -> Path:
     return tests_base_path / "data"
+
+
+@pytest.fixture(name="playlist_response")
+def fixture_playlist_response(data_path: Path) -> dict:
+    """first page of a playlist with 25 tracks"""
+    with open(data_path / "2024_03_get_playlist.json", encoding="utf8") as f:
+        return json.load(f)
+
+
+def section_list(response: dict) -> list[dict] | None:
+    """sections of the single or two column layout of a browse response"""
+    return nav(response, SINGLE_COLUMN_TAB + SECTION_LIST, True) or nav(
+        response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST], True
+    )
+
+
+def shelf_items(response: dict) -> list[dict]:
+    """musicResponsiveListItemRenderers of the playlist, album or artist song shelf of a response"""
+    secondary = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION], True)
+    for shelf in ["musicPlaylistShelfRenderer", "musicShelfRenderer"]:
+        if contents := nav(secondary, [*CONTENT, shelf, "contents"], True):
+            return [item for item in contents if MRLIR in item]
+    sections = section_list(response) or []
+    shelves = [nav(section, MUSIC_SHELF, True) for section in sections]
+    return [item for shelf in shelves if shelf for item in shelf.get("contents", []) if MRLIR in item]
+
+
+def recorded_shelves() -> dict[str, list[dict]]:
+    """shelf items of the recorded responses in tests/data which have any, by file name"""
+    shelves = {}
+    for path in sorted(DATA_PATH.glob("*.json")):
+        with open(path, encoding="utf8") as f:
+            if rows := shelf_items(json.load(f)):
+                shelves[path.stem] = rows
+    return shelves
+
+
+class FakeTransport:
+    """serves a fixed response and records requests"""
+
+    def __init__(self, body: dict):
+        self.body = body
+        self.requests: list[tuple[str, str]] = []
+        self.bodies: list[dict] = []
+
+    def _response(self, text: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = text.encode("utf-8")
+        return response
+
+    def post(self, url, body, headers, cookies, proxies):
+        self.requests.append(("POST", url))
+        self.bodies.append(body)
+        return self._response(json.dumps(self.body))
+
+    def get(self, url, params, headers, cookies, proxies):
+        self.requests.append(("GET", url))
+        return self._response('ytcfg.set({"VISITOR_DATA": "visitor"});')
+
+    def upload(self, url, data, headers, proxies):
+        self.requests.append(("UPLOAD", url))
+        return self._response("")
+
+
+class ThrottledTransport(FakeTransport):
+    """answers POSTs with 429 until ``throttled`` responses were sent"""
+
+    def __init__(self, body: dict, throttled: int, headers: dict | None = None):
+        super().__init__(body)
+        self.throttled = throttled
+        self.headers = headers or {}
+
+    def post(self, url, body, headers, cookies, proxies):
+        response = super().post(url, body, headers, cookies, proxies)
+        if self.throttled:
+            self.throttled -= 1
+            response.status_code = 429
+            response.reason = "Too Many Requests"
+            response.headers.update(self.headers)
+            response._content = json.dumps({"error": {"message": "Quota exceeded"}}).encode("utf-8")
+        return response
+
+
+PLAYLIST_ID = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+
+
+class PlaylistServer(FakeTransport):
+    """serves a playlist of ``items`` in pages of ``page_size``, built from the rows of a recorded playlist"""
+
+    def __init__(self, body: dict, items: list[tuple[str, str]], page_size: int = 10):
+        super().__init__(body)
+        self.items = items
+        self.page_size = page_size
+        shelf = self._shelf(body)
+        self.template = json.dumps(shelf["contents"][0])
+        track = json.loads(self.template)[MRLIR]
+        self.template_ids = (
+            track["playlistItemData"]["videoId"],
+            track["playlistItemData"]["playlistSetVideoId"],
+        )
+
+    @staticmethod
+    def _shelf(body: dict) -> dict:
+        section_list = nav(body, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
+        return nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
+
+    def _page(self, start: int) -> list[dict]:
+        rows = []
+        for videoId, setVideoId in self.items[start : start + self.page_size]:
+            row = self.template.replace(self.template_ids[0], videoId).replace(
+                self.template_ids[1], setVideoId
+            )
+            rows.append(json.loads(row))
+        if start + self.page_size < len(self.items):
+            command = {"continuationCommand": {"token": str(start + self.page_size)}}
+            rows.append({"continuationItemRenderer": {"continuationEndpoint": command}})
+        return rows
+
+    def post(self, url, body, headers, cookies, proxies):
+        self.requests.append(("POST", url))
+        self.bodies.append(body)
+        if "continuation" in body:
+            actions = [
+                {
+                    "appendContinuationItemsAction": {
+                        "continuationItems": self._page(int(body["continuation"]))
+                    }
+                }
+            ]
+            return self._response(json.dumps({"onResponseReceivedActions": actions}))
+        response = copy.deepcopy(self.body)
+        shelf = self._shelf(response)
+        shelf["contents"] = self._page(0)
+        del shelf["continuations"]
+        text = json.dumps(response).replace('"245 tracks"', f'"{len(self.items)} tracks"')
+        return self._response(text)
+
+    @property
+    def pages(self) -> int:
+        return sum(method == "POST" for method, _ in self.requests)
+
+
+def make_items(start: int, stop: int) -> list[tuple[str, str]]:
+    return [(f"video{i:06d}", f"SET{i:013d}") for i in range(start, stop)]
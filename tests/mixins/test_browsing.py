@@ -1,4 +1,5 @@
 import json
+import time
 import warnings
 from unittest import mock
 
@@ -184,6 +185,27 @@ class TestBrowsing:
                     assert "name" in artist
                     assert isinstance(artist["name"], str) and artist["name"]
 
+    def test_get_albums(self, yt, data_path):
+        with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+            mock_response = json.load(f)
+        running = []
+        max_running = 0
+
+        def send_request(*args):
+            nonlocal max_running
+            running.append(None)
+            max_running = max(max_running, len(running))
+            time.sleep(0.02)
+            running.pop()
+            return mock_response
+
+        with mock.patch("ytmusicapi.YTMusic._send_request", side_effect=send_request):
+            albums = yt.get_albums(["MPREabc", "asdf", *["MPREabc"] * 8], concurrency=3)
+            assert albums[0] == yt.get_album("MPREabc")
+        assert isinstance(albums[1], YTMusicUserError)
+        assert all(album == albums[0] for album in albums[2:])
+        assert max_running == 3
+
     def test_get_album(self, yt, yt_auth, sample_album):
         album = yt_auth.get_album(sample_album)
         assert len(album) >= 9
@@ -26,6 +26,8 @@ class TestLibrary:
         assert len(songs) >= config.getint("limits", "library_songs")
         songs = yt_oauth.get_library_songs(order="a_to_z")
         assert len(songs) >= 25
+        lazy_songs = yt_oauth.get_library_songs(order="a_to_z", lazy=True)
+        assert [song.videoId for song in lazy_songs] == [song["videoId"] for song in songs]
         songs = yt_empty.get_library_songs()
         assert len(songs) == 0
 
@@ -11,6 +11,7 @@ from ytmusicapi.constants import SUPPORTED_LANGUAGES
 from ytmusicapi.enums import ResponseStatus
 from ytmusicapi.exceptions import YTMusicGatedError, YTMusicServerError, YTMusicUserError
 from ytmusicapi.models.content.enums import PlaylistSortOrder, PlaylistVoteEditOptions, VoteStatus
+from ytmusicapi.models.results import Track
 
 
 def create_playlist(yt: YTMusic, *args: Any, **kwargs: Any) -> str:
@@ -80,6 +81,115 @@ class TestPlaylists:
                     assert isinstance(vote_status["netVoteValue"], int)
                     assert vote_status["status"] in VoteStatus
 
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist.json", "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"),
+            ("2025_10_get_playlist_collaborative.json", "PLxyTaDz8f5PBc-8kE36gvB-eflhODG2dw"),
+            ("2025_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+            ("2025_01_get_playlist_chart.json", "OLAK5uy_mzYnlaHgFOvLaxqIPnnouEr-idiUn4NIM"),
+        ],
+    )
+    def test_iter_playlist(self, yt, test_file, playlist_id, data_path):
+        with open(data_path / test_file, encoding="utf8") as f:
+            mock_response = json.load(f)
+
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            tracks = list(yt.iter_playlist(playlist_id))
+            assert tracks == yt.get_playlist(playlist_id, limit=None)["tracks"]
+
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist.json", "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"),
+            ("2025_10_get_playlist_collaborative.json", "PLxyTaDz8f5PBc-8kE36gvB-eflhODG2dw"),
+            ("2025_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+        ],
+    )
+    def test_get_playlist_lazy(self, yt, test_file, playlist_id, data_path):
+        with open(data_path / test_file, encoding="utf8") as f:
+            mock_response = json.load(f)
+
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            expected = yt.get_playlist(playlist_id)
+            playlist = yt.get_playlist(playlist_id, lazy=True)
+            tracks = list(yt.iter_playlist(playlist_id, lazy=True))
+
+        assert all(isinstance(track, Track) for track in playlist["tracks"] + tracks)
+        assert playlist == expected
+        assert [track.to_dict() for track in tracks] == expected["tracks"]
+
+    def test_get_playlist_fields(self, yt, data_path):
+        with open(data_path / "2024_03_get_playlist.json", encoding="utf8") as f:
+            mock_response = json.load(f)
+
+        playlist_id = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+        fields = ["videoId", "title", "duration_seconds"]
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            expected = yt.get_playlist(playlist_id)
+            playlist = yt.get_playlist(playlist_id, fields=fields)
+            tracks = list(yt.iter_playlist(playlist_id, fields=fields))
+            with pytest.raises(YTMusicUserError, match="Unknown fields"):
+                yt.get_playlist(playlist_id, fields=["videoid"])
+
+        assert (
+            playlist["tracks"]
+            == tracks
+            == [{key: track[key] for key in fields} for track in expected["tracks"]]
+        )
+        assert playlist["duration_seconds"] == expected["duration_seconds"]
+
+    def test_get_audio_playlist_fields(self, yt, data_path):
+        with open(data_path / "2025_12_get_playlist_audio.json", encoding="utf8") as f:
+            mock_response = json.load(f)
+
+        playlist_id = "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+            expected = yt.get_playlist(playlist_id)
+            playlist = yt.get_playlist(playlist_id, fields=["videoId"])
+
+        assert expected["title"] is not None
+        assert playlist["title"] == expected["title"]
+
+    def test_get_playlist_cursor(self, yt, data_path):
+        with open(data_path / "2024_03_get_playlist.json", encoding="utf8") as f:
+            mock_response = json.load(f)
+        shelf = mock_response["contents"]["twoColumnBrowseResultsRenderer"]["secondaryContents"][
+            "sectionListRenderer"
+        ]["contents"][0]["musicPlaylistShelfRenderer"]
+        items = shelf["contents"]
+
+        def continuation(token: int) -> list[dict]:
+            command = {"continuationCommand": {"token": str(token)}}
+            return [{"continuationItemRenderer": {"continuationEndpoint": command}}] if token < 4 else []
+
+        def send_request(endpoint, body, additionalParams=""):
+            if "continuation" not in body:
+                return mock_response
+            page = int(body["continuation"])
+            page_items = items[page * 10 : page * 10 + 10] + continuation(page + 1)
+            return {
+                "onResponseReceivedActions": [
+                    {"appendContinuationItemsAction": {"continuationItems": page_items}}
+                ]
+            }
+
+        shelf["contents"] = items[:10] + continuation(1)
+        playlist_id = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+        with mock.patch("ytmusicapi.YTMusic._send_request", side_effect=send_request):
+            expected = yt.get_playlist(playlist_id, limit=None)
+            playlist = yt.get_playlist(playlist_id, limit=10)
+            assert playlist["tracks"] == expected["tracks"][:20]
+            assert playlist["cursor"] == "2"
+
+            tracks = []
+            while playlist["cursor"]:
+                playlist = yt.get_playlist(playlist_id, limit=10, cursor=playlist["cursor"])
+                tracks.extend(playlist["tracks"])
+            assert tracks == expected["tracks"][20:]
+            assert playlist["title"] == expected["title"]
+            assert expected["cursor"] is None
+
     @pytest.mark.parametrize(
         "playlist_id, tracks_len, related_len",
         [
@@ -152,6 +152,7 @@ class TestSearch:
 
     def test_search_top_result_video(self, yt):
         results = yt.search("Fuel Eminem")
+        assert yt.search("Fuel Eminem", lazy=True)[0].to_dict() == results[0]
         assert results[0]["category"] == "Top result"
         assert results[0]["resultType"] == "video"
         assert results[0]["videoId"] == "t5H_CewqpKA"
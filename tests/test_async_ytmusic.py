@@ -0,0 +1,184 @@
+import asyncio
+import inspect
+import json
+from unittest import mock
+
+import pytest
+
+from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+from ytmusicapi.retry import RetryPolicy
+
+httpx = pytest.importorskip("httpx")
+async_ytmusic = pytest.importorskip("ytmusicapi.async_ytmusic", reason="requires greenlet")
+AsyncYTMusic, await_only = async_ytmusic.AsyncYTMusic, async_ytmusic.await_only
+
+HOMEPAGE = 'ytcfg.set({"VISITOR_DATA": "visitor"});'
+
+
+def mock_client(handler) -> "httpx.AsyncClient":
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_mirrors_public_methods():
+    for name in ["search", "get_album", "get_playlist", "get_library_songs", "upload_song"]:
+        assert asyncio.iscoroutinefunction(getattr(AsyncYTMusic, name))
+        assert getattr(AsyncYTMusic, name).__doc__ == getattr(YTMusic, name).__doc__
+    assert not hasattr(AsyncYTMusic, "as_mobile")
+    assert inspect.isasyncgenfunction(AsyncYTMusic.iter_playlist)
+    assert inspect.isasyncgenfunction(AsyncYTMusic.iter_library_songs)
+
+
+def test_async_get_playlist(data_path):
+    test_file = "2024_03_get_playlist.json"
+    with open(data_path / test_file, encoding="utf8") as f:
+        mock_response = json.load(f)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        return httpx.Response(200, json=mock_response)
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler)) as ytmusic:
+            return await asyncio.gather(
+                *(ytmusic.get_playlist("PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm") for _ in range(5))
+            )
+
+    playlists = asyncio.run(run())
+
+    with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+        expected = YTMusic().get_playlist("PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm")
+    assert all(playlist == expected for playlist in playlists)
+    post = next(request for request in requests if request.method == "POST")
+    assert post.headers["X-Goog-Visitor-Id"] == "visitor"
+    assert json.loads(post.content)["context"]["client"]["clientName"] == "WEB_REMIX"
+
+
+def test_async_iter_playlist(data_path):
+    with open(data_path / "2024_03_get_playlist.json", encoding="utf8") as f:
+        mock_response = json.load(f)
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        return httpx.Response(200, json=mock_response)
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler)) as ytmusic:
+            return [track async for track in ytmusic.iter_playlist("PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm")]
+
+    tracks = asyncio.run(run())
+
+    with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response):
+        assert tracks == list(YTMusic().iter_playlist("PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"))
+
+
+def test_async_get_albums(data_path):
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        mock_response = json.load(f)
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        return httpx.Response(200, json=mock_response)
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler)) as ytmusic:
+            return await ytmusic.get_albums(["MPREabc", "asdf", "MPREabc"], concurrency=2)
+
+    albums = asyncio.run(run())
+    assert albums[0] == albums[2] and albums[0]["title"]
+    assert isinstance(albums[1], YTMusicUserError)
+
+
+def test_async_metrics(data_path):
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        mock_response = json.load(f)
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        return httpx.Response(200, json=mock_response)
+
+    calls = []
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler), metrics=calls.append) as ytmusic:
+            await asyncio.gather(ytmusic.get_albums(["MPREabc", "MPREdef"]), ytmusic.get_album("MPREabc"))
+
+    asyncio.run(run())
+    assert sorted(call.method for call in calls) == ["get_album", "get_albums"]
+    endpoints = {call.method: [request.endpoint for request in call.requests] for call in calls}
+    assert endpoints["get_albums"].count("browse") == 2
+    assert endpoints["get_album"].count("browse") == 1
+
+
+def test_async_server_error():
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        return httpx.Response(400, json={"error": {"message": "Request contains an invalid argument."}})
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler)) as ytmusic:
+            await ytmusic.get_album("MPREb_invalid")
+
+    with pytest.raises(YTMusicServerError, match="invalid argument"):
+        asyncio.run(run())
+
+
+def test_async_retry(data_path):
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        mock_response = json.load(f)
+    failures = [httpx.ConnectError("reset"), httpx.Response(503, text="unavailable")]
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json=mock_response)
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler), retry=RetryPolicy(backoff=0.01)) as ytmusic:
+            album = await ytmusic.get_album("MPREabc")
+            return album, ytmusic.ytmusic.retry_stats
+
+    album, stats = asyncio.run(run())
+    assert album["title"]
+    assert stats.reasons == {"ConnectError": 1, "503": 1}
+
+
+def test_async_coalesces_requests(data_path):
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        mock_response = json.load(f)
+    posts = []
+
+    async def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, text=HOMEPAGE)
+        posts.append(json.loads(request.content)["browseId"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=mock_response)
+
+    async def run():
+        async with AsyncYTMusic(client=mock_client(handler)) as ytmusic:
+            await ytmusic.get_album("MPREabc")  # fetch the visitor id
+            return await asyncio.gather(*(ytmusic.get_album("MPREabc") for _ in range(5)))
+
+    albums = asyncio.run(run())
+    assert all(album == albums[0] for album in albums)
+    assert posts == ["MPREabc", "MPREabc"]
+
+
+def test_await_only_outside_greenlet():
+    coroutine = asyncio.sleep(0)
+    with pytest.raises(YTMusicUserError):
+        await_only(coroutine)
+    assert inspect.getcoroutinestate(coroutine) == inspect.CORO_CLOSED
@@ -0,0 +1,191 @@
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.fixtures import FakeTransport, PlaylistServer, make_items
+from ytmusicapi import YTMusic
+from ytmusicapi.bulk import plan_moves
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+from ytmusicapi.helpers import longest_increasing_subsequence
+
+AUTH = {
+    "cookie": "__Secure-3PAPISID=abc",
+    "authorization": "SAPISIDHASH 1_a",
+    "x-goog-authuser": "0",
+    "origin": "https://music.youtube.com",
+    "X-Goog-Visitor-Id": "visitor",
+}
+
+
+class EditServer(FakeTransport):
+    """answers edit_playlist requests, failing the requests whose index is in ``errors`` or ``rejected``"""
+
+    def __init__(self, errors=(), rejected=()):
+        super().__init__({})
+        self.errors = set(errors)
+        self.rejected = set(rejected)
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def post(self, url, body, headers, cookies, proxies):
+        with self.lock:
+            index = len(self.bodies)
+            self.requests.append(("POST", url))
+            self.bodies.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            threading.Event().wait(0.01)
+            if index in self.errors:
+                response = self._response(json.dumps({"error": {"message": "Backend Error"}}))
+                response.status_code = 500
+                response.reason = "Internal Server Error"
+                return response
+            if index in self.rejected:
+                return self._response(json.dumps({"status": "STATUS_FAILED"}))
+            results = [
+                {"playlistEditVideoAddedResultData": {"videoId": videoId, "setVideoId": f"SET{videoId}"}}
+                for action in body["actions"]
+                if (videoId := action.get("addedVideoId"))
+            ]
+            return self._response(json.dumps({"status": "STATUS_SUCCEEDED", "playlistEditResults": results}))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def video_ids(n: int) -> list[str]:
+    return [f"video{i:06d}" for i in range(n)]
+
+
+def test_add_playlist_items_bulk():
+    server = EditServer()
+    ytmusic = YTMusic(auth=AUTH, transport=server)
+    result = ytmusic.add_playlist_items_bulk("VLPL123", video_ids(250), duplicates=True)
+    assert result.status == "STATUS_SUCCEEDED" and not result.failed
+    assert [len(body["actions"]) for body in server.bodies] == [100, 100, 50]
+    assert all(body["playlistId"] == "PL123" for body in server.bodies)
+    assert server.bodies[0]["actions"][0]["dedupeOption"] == "DEDUPE_OPTION_SKIP"
+    assert [data["videoId"] for data in result.playlistEditResults] == video_ids(250)
+
+    with pytest.raises(YTMusicUserError):
+        ytmusic.add_playlist_items_bulk("PL123", video_ids(2), chunk_size=0)
+    with pytest.raises(YTMusicUserError):
+        YTMusic(transport=server).add_playlist_items_bulk("PL123", video_ids(2))
+
+
+def test_add_playlist_items_bulk_partial_failure():
+    server = EditServer(errors={1})
+    ytmusic = YTMusic(auth=AUTH, transport=server)
+    result = ytmusic.add_playlist_items_bulk("PL123", video_ids(7), chunk_size=2)
+    assert len(server.bodies) == 2  # stops after the failed chunk to keep the order
+    assert [(chunk.index, chunk.sent) for chunk in result.failed] == [(1, True), (2, False), (3, False)]
+    assert isinstance(result.failed[0].error, YTMusicServerError)
+    assert result.status == "STATUS_FAILED"
+    assert result.failed_items == video_ids(7)[2:]
+    assert len(result.playlistEditResults) == 2
+
+    retried = ytmusic.add_playlist_items_bulk("PL123", result.failed_items, chunk_size=2)
+    assert not retried.failed
+    assert [data["videoId"] for data in retried.playlistEditResults] == video_ids(7)[2:]
+
+
+def test_remove_playlist_items_bulk():
+    videos = [{"videoId": videoId, "setVideoId": f"SET{videoId}"} for videoId in video_ids(10)]
+    server = EditServer(rejected={0, 3})
+    with ThreadPoolExecutor(4) as executor:
+        ytmusic = YTMusic(auth=AUTH, transport=server, executor=executor)
+        result = ytmusic.remove_playlist_items_bulk(
+            "PL123", [*videos, {"videoId": "x"}], chunk_size=2, max_in_flight=2
+        )
+    assert len(server.bodies) == 5  # all chunks are sent, as the order of removals does not matter
+    assert server.max_in_flight == 2
+    assert sorted(chunk.index for chunk in result.failed) == [0, 3]
+    assert {item["videoId"] for item in result.failed_items} == set(video_ids(10)[:2] + video_ids(10)[6:8])
+    assert all(chunk.status == "STATUS_FAILED" and chunk.error is None for chunk in result.failed)
+
+    with pytest.raises(YTMusicUserError, match="setVideoId is missing"):
+        ytmusic.remove_playlist_items_bulk("PL123", [{"videoId": "x"}])
+    with pytest.raises(YTMusicUserError, match="max_in_flight"):
+        ytmusic.remove_playlist_items_bulk("PL123", videos, max_in_flight=0)
+
+
+def test_move_playlist_items():
+    server = EditServer()
+    ytmusic = YTMusic(auth=AUTH, transport=server)
+    result = ytmusic.move_playlist_items(
+        "PL123", [("SET1", "SET0"), ("SET2", None), ("SET3", "SET1")], chunk_size=2
+    )
+    assert not result.failed and not result.playlistEditResults
+    assert [body["actions"] for body in server.bodies] == [
+        [
+            {"action": "ACTION_MOVE_VIDEO_BEFORE", "setVideoId": "SET1", "movedSetVideoIdSuccessor": "SET0"},
+            {"action": "ACTION_MOVE_VIDEO_BEFORE", "setVideoId": "SET2"},
+        ],
+        [{"action": "ACTION_MOVE_VIDEO_BEFORE", "setVideoId": "SET3", "movedSetVideoIdSuccessor": "SET1"}],
+    ]
+
+
+class ReorderServer(PlaylistServer):
+    """serves a playlist and applies the moves sent to edit_playlist"""
+
+    def post(self, url, body, headers, cookies, proxies):
+        if "edit_playlist" not in url:
+            return super().post(url, body, headers, cookies, proxies)
+        self.requests.append(("POST", url))
+        self.bodies.append(body)
+        for action in body["actions"]:
+            item = next(item for item in self.items if item[1] == action["setVideoId"])
+            self.items.remove(item)
+            successor = action.get("movedSetVideoIdSuccessor")
+            position = (
+                [setVideoId for _, setVideoId in self.items].index(successor)
+                if successor
+                else len(self.items)
+            )
+            self.items.insert(position, item)
+        return self._response(json.dumps({"status": "STATUS_SUCCEEDED"}))
+
+
+def apply_moves(items: list[str], moves: list[tuple[str, str | None]]) -> list[str]:
+    items = list(items)
+    for setVideoId, successor in moves:
+        items.remove(setVideoId)
+        items.insert(items.index(successor) if successor else len(items), setVideoId)
+    return items
+
+
+def test_plan_moves():
+    current = [f"SET{i}" for i in range(50)]
+    rng = random.Random(0)
+    for _ in range(20):
+        desired = rng.sample(current, len(current))
+        moves = plan_moves(current, desired)
+        assert apply_moves(current, moves) == desired
+        stay = longest_increasing_subsequence([current.index(setVideoId) for setVideoId in desired])
+        assert len(moves) == len(current) - len(stay)
+
+    assert plan_moves(current, current) == []
+    assert plan_moves(current, current[1:] + current[:1]) == [("SET0", None)]
+    with pytest.raises(YTMusicUserError):
+        plan_moves(current, current[1:])
+    with pytest.raises(YTMusicUserError):
+        plan_moves(current, current[1:] + current[1:2])
+
+
+def test_reorder_playlist(playlist_response):
+    server = ReorderServer(playlist_response, make_items(0, 25))
+    ytmusic = YTMusic(auth=AUTH, transport=server)
+    desired = [setVideoId for _, setVideoId in reversed(server.items)]
+    result = ytmusic.reorder_playlist("PL123", desired, chunk_size=10)
+    assert not result.failed
+    assert [setVideoId for _, setVideoId in server.items] == desired
+    edits = [body for body in server.bodies if "actions" in body]
+    assert [len(body["actions"]) for body in edits] == [10, 10, 4]
+
+    server.bodies.clear()
+    assert not ytmusic.reorder_playlist("PL123", desired).chunks
+    assert all("actions" not in body for body in server.bodies)
@@ -0,0 +1,245 @@
+import json
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from ytmusicapi import YTMusic
+from ytmusicapi.cache import LIBRARY_TAG, MemoryCache, ResponseCache, SQLiteCache
+
+
+class CountingTransport:
+    """answers every POST with a new response"""
+
+    def __init__(self):
+        self.bodies: list[tuple[str, dict]] = []
+        self.gets = 0
+
+    def post(self, url, body, headers, cookies, proxies):
+        self.bodies.append((url, json.loads(json.dumps(body))))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"count": len(self.bodies)}).encode("utf-8")
+        return response
+
+    def get(self, url, params, headers, cookies, proxies):
+        self.gets += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'ytcfg.set({{"VISITOR_DATA": "visitor{self.gets}"}});'.encode()
+        return response
+
+
+@pytest.fixture(name="ytmusic")
+def fixture_ytmusic() -> YTMusic:
+    return YTMusic(transport=CountingTransport(), cache=ResponseCache())
+
+
+@pytest.fixture(name="backend", params=["memory", "sqlite"])
+def fixture_backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(maxsize=2)
+    return SQLiteCache(tmp_path / "cache.sqlite", maxsize=2)
+
+
+class TestBackends:
+    def test_lru(self, backend):
+        backend.set("a", "1", 60, [])
+        backend.set("b", "2", 60, [])
+        time.sleep(0.01)
+        assert backend.get("a") == "1"
+        backend.set("c", "3", 60, [])
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert backend.get("c") == "3"
+        assert len(backend) == 2
+
+    def test_ttl(self, backend):
+        backend.set("a", "1", 60, [])
+        backend.set("b", "2", -1, [])
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+
+    def test_invalidate(self, backend):
+        backend.set("a", "1", 60, ["x", "y"])
+        backend.set("b", "2", 60, ["z"])
+        backend.invalidate(["y"])
+        assert backend.get("a") is None
+        assert backend.get("b") == "2"
+        backend.clear()
+        assert backend.get("b") is None
+
+    def test_sqlite_persistence(self, tmp_path):
+        SQLiteCache(tmp_path / "cache.sqlite").set("a", "1", 60, [])
+        assert SQLiteCache(tmp_path / "cache.sqlite").get("a") == "1"
+
+
+class TestResponseCache:
+    def test_hit(self, ytmusic):
+        first = ytmusic._send_request("browse", {"browseId": "MPREb_1"})
+        first["modified"] = True
+        assert ytmusic._send_request("browse", {"browseId": "MPREb_1"}) == {"count": 1}
+        assert ytmusic._send_request("browse", {"browseId": "MPREb_2"}) == {"count": 2}
+        assert ytmusic._send_request("browse", {"browseId": "MPREb_1"}, "&ctoken=a") == {"count": 3}
+
+    def test_namespace(self, ytmusic):
+        ytmusic._send_request("browse", {"browseId": "MPREb_1"})
+        with ytmusic.as_mobile():
+            assert ytmusic._send_request("browse", {"browseId": "MPREb_1"}) == {"count": 2}
+        ytmusic.context["context"]["client"]["hl"] = "de"
+        assert ytmusic._send_request("browse", {"browseId": "MPREb_1"}) == {"count": 3}
+
+    def test_uncached_endpoint(self, ytmusic):
+        ytmusic._send_request("search", {"query": "oasis"})
+        assert ytmusic._send_request("search", {"query": "oasis"}) == {"count": 2}
+
+    def test_uncached_continuation(self, ytmusic):
+        ytmusic._send_request("browse", {"continuation": "token"})
+        assert ytmusic._send_request("browse", {"continuation": "token"}) == {"count": 2}
+
+    def test_write_invalidates(self, ytmusic):
+        ytmusic._send_request("browse", {"browseId": "VLPL123"})
+        ytmusic._send_request("browse", {"browseId": "VLPL456"})
+        ytmusic._send_request("browse", {"browseId": "FEmusic_liked_playlists"})
+        ytmusic._send_request("browse/edit_playlist", {"playlistId": "PL123", "actions": []})
+        assert ytmusic._send_request("browse", {"browseId": "VLPL123"}) == {"count": 5}
+        assert ytmusic._send_request("browse", {"browseId": "VLPL456"}) == {"count": 2}
+        assert ytmusic._send_request("browse", {"browseId": "FEmusic_liked_playlists"}) == {"count": 6}
+
+    def test_form_data_bypasses(self, ytmusic):
+        with mock.patch.object(ytmusic.cache.backend, "invalidate") as invalidate:
+            ytmusic._send_request("browse", {"browseId": "FEmusic_home", "formData": {}})
+            ytmusic._send_request("browse", {"browseId": "FEmusic_home", "formData": {}})
+        assert len(ytmusic._transport.bodies) == 2
+        assert LIBRARY_TAG in invalidate.call_args.args[0]
+
+    def test_auth_identity(self):
+        def browser_auth(sapisid: str) -> dict[str, str]:
+            return {
+                "cookie": f"__Secure-3PAPISID={sapisid}",
+                "authorization": "SAPISIDHASH 1_a",
+                "x-goog-authuser": "0",
+                "origin": "https://music.youtube.com",
+                "X-Goog-Visitor-Id": "visitor",
+            }
+
+        namespaces = {
+            YTMusic(auth=browser_auth(sapisid))._cache_namespace() for sapisid in ["abc", "abc", "def"]
+        }
+        assert len(namespaces) == 2
+        assert all("abc" not in namespace for namespace in namespaces)
+
+
+class TestVisitorId:
+    def test_shared_between_processes(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        first = YTMusic(transport=CountingTransport(), cache=ResponseCache(SQLiteCache(path), ttl={}))
+        first._send_request("browse", {"browseId": "FEmusic_home"})
+        assert first._transport.gets == 1
+
+        second = YTMusic(transport=CountingTransport(), cache=ResponseCache(SQLiteCache(path), ttl={}))
+        second._send_request("browse", {"browseId": "FEmusic_home"})
+        assert second._transport.gets == 0
+        assert second.base_headers["X-Goog-Visitor-Id"] == "visitor1"
+
+    def test_expiry(self):
+        cache = ResponseCache(visitor_id_ttl=60)
+        cache.set_visitor_id("visitor")
+        assert cache.get_visitor_id() == "visitor"
+        with mock.patch("time.time", return_value=time.time() + 61):
+            assert cache.get_visitor_id() is None
+
+        cache = ResponseCache(visitor_id_ttl=0)
+        cache.set_visitor_id("visitor")
+        assert cache.get_visitor_id() is None
+
+    def test_refresh(self, ytmusic):
+        cache = ytmusic.cache
+        assert ytmusic.base_headers["X-Goog-Visitor-Id"] == "visitor1"
+        headers = ytmusic.base_headers
+        assert ytmusic.refresh_visitor_id() == "visitor2"
+        assert ytmusic.base_headers["X-Goog-Visitor-Id"] == "visitor2"
+        assert headers["X-Goog-Visitor-Id"] == "visitor1"  # not modified while in use
+        assert cache.get_visitor_id() == "visitor2"
+
+        warmed = YTMusic(transport=CountingTransport(), cache=cache)
+        assert warmed.base_headers["X-Goog-Visitor-Id"] == "visitor2"
+        assert warmed._transport.gets == 0
+
+    def test_empty_visitor_id_not_cached(self):
+        class NoVisitorTransport(CountingTransport):
+            def get(self, url, params, headers, cookies, proxies):
+                response = super().get(url, params, headers, cookies, proxies)
+                response._content = b"<html></html>"
+                return response
+
+        ytmusic = YTMusic(transport=NoVisitorTransport(), cache=ResponseCache())
+        assert ytmusic.base_headers["X-Goog-Visitor-Id"] == ""
+        assert ytmusic.cache.get_visitor_id() is None
+
+
+class PlayerTransport(CountingTransport):
+    """serves a homepage referencing a player script, and the script"""
+
+    def __init__(self, player: str = "/s/player/abc/base.js"):
+        super().__init__()
+        self.player = player
+        self.urls: list[str] = []
+
+    def get(self, url, params, headers, cookies, proxies):
+        self.urls.append(url)
+        response = super().get(url, params, headers, cookies, proxies)
+        if url.endswith("base.js"):
+            response._content = b"var a={signatureTimestamp:20123,b:1};"
+        else:
+            response._content += f'"jsUrl":"{self.player}"'.encode()
+        return response
+
+
+class TestSignatureTimestamp:
+    def test_cached_per_player(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        transport = PlayerTransport()
+        ytmusic = YTMusic(transport=transport, cache=ResponseCache(SQLiteCache(path)))
+        assert ytmusic.get_signatureTimestamp() == 20123
+        assert ytmusic.get_signatureTimestamp() == 20123
+        assert transport.urls == [
+            "https://music.youtube.com",
+            "https://music.youtube.com/s/player/abc/base.js",
+        ]
+
+        transport = PlayerTransport()
+        ytmusic = YTMusic(transport=transport, cache=ResponseCache(SQLiteCache(path)))
+        assert ytmusic.get_signatureTimestamp() == 20123
+        assert transport.urls == []
+
+    def test_new_player(self):
+        cache = ResponseCache(basejs_url_ttl=60)
+        transport = PlayerTransport()
+        ytmusic = YTMusic(transport=transport, cache=cache)
+        ytmusic.get_signatureTimestamp()
+        with mock.patch("time.time", return_value=time.time() + 61):
+            transport.player = "/s/player/def/base.js"
+            assert ytmusic.get_basejs_url().endswith("/def/base.js")
+            ytmusic.get_signatureTimestamp()
+        assert sum(url.endswith("base.js") for url in transport.urls) == 2
+
+    def test_get_song_resolves(self):
+        transport = PlayerTransport()
+        cache = ResponseCache(ttl={}, resolve_signature_timestamp=True)
+        ytmusic = YTMusic(transport=transport, cache=cache)
+        ytmusic.get_song("abc")
+        ytmusic.get_song("def")
+        bodies = [body for url, body in transport.bodies if "/player" in url]
+        assert [
+            body["playbackContext"]["contentPlaybackContext"]["signatureTimestamp"] for body in bodies
+        ] == [
+            20123,
+            20123,
+        ]
+        assert sum(url.endswith("base.js") for url in transport.urls) == 1
+
+        ytmusic = YTMusic(transport=PlayerTransport(), cache=ResponseCache())
+        ytmusic.get_song("abc")
+        assert not any(url.endswith("base.js") for url in ytmusic._transport.urls)
@@ -0,0 +1,100 @@
+import gzip
+import json
+import time
+
+import pytest
+import requests
+
+from ytmusicapi import YTMusic
+from ytmusicapi.cassette import RecordingTransport, ReplayTransport
+from ytmusicapi.enums import ResponseStatus
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+
+PLAYLIST_ID = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+AUTH = {
+    "cookie": "__Secure-3PAPISID=abc",
+    "authorization": "SAPISIDHASH 1_a",
+    "x-goog-authuser": "0",
+    "origin": "https://music.youtube.com",
+    "X-Goog-Visitor-Id": "visitor",
+}
+
+
+class Server:
+    """answers POSTs with the given responses in turn, and GETs with the homepage"""
+
+    def __init__(self, *responses: tuple[int, dict]):
+        self.responses = list(responses)
+        self.requests = 0
+
+    def _response(self, status_code: int, text: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = "OK" if status_code < 400 else "Bad Request"
+        response.headers["Content-Type"] = "application/json; charset=UTF-8"
+        response.headers["Set-Cookie"] = "secret"
+        response._content = text.encode("utf-8")
+        return response
+
+    def post(self, url, body, headers, cookies, proxies):
+        self.requests += 1
+        status_code, response = self.responses[min(self.requests, len(self.responses)) - 1]
+        return self._response(status_code, json.dumps(response))
+
+    def get(self, url, params, headers, cookies, proxies):
+        return self._response(200, 'ytcfg.set({"VISITOR_DATA": "visitor"});')
+
+    def upload(self, url, data, headers, proxies):
+        response = self._response(200, "")
+        if headers["X-Goog-Upload-Command"] == "start":
+            response.headers["X-Goog-Upload-URL"] = (
+                "https://upload.youtube.com/upload/usermusic/http?upload_id=1"
+            )
+        return response
+
+
+def test_record_replay(tmp_path, playlist_response):
+    cassette = tmp_path / "cassette.json.gz"
+    with RecordingTransport(cassette, Server((200, playlist_response))) as transport:
+        expected = YTMusic(transport=transport).get_playlist(PLAYLIST_ID)
+
+    with gzip.open(cassette, "rt", encoding="utf-8") as f:
+        recorded = f.read()
+    assert "secret" not in recorded and "X-Goog-Visitor-Id" not in recorded
+
+    ytmusic = YTMusic(transport=ReplayTransport(cassette))
+    assert ytmusic.get_playlist(PLAYLIST_ID) == expected
+    assert ytmusic.get_playlist(PLAYLIST_ID) == expected
+    with pytest.raises(YTMusicUserError, match="No response recorded"):
+        ytmusic.get_playlist(PLAYLIST_ID[:-1])
+
+
+def test_replay_order_and_latency(tmp_path):
+    cassette = tmp_path / "cassette.json.gz"
+    with RecordingTransport(
+        cassette, Server((200, {"n": 1}), (400, {"error": {"message": "gone"}}))
+    ) as transport:
+        ytmusic = YTMusic(transport=transport)
+        assert ytmusic._send_request("browse", {"browseId": "FEmusic_home"}) == {"n": 1}
+        with pytest.raises(YTMusicServerError, match="gone"):
+            ytmusic._send_request("browse", {"browseId": "FEmusic_home"})
+
+    ytmusic = YTMusic(transport=ReplayTransport(cassette, latency=0.05))
+    start = time.perf_counter()
+    assert ytmusic._send_request("browse", {"browseId": "FEmusic_home"}) == {"n": 1}
+    for _ in range(2):
+        with pytest.raises(YTMusicServerError, match="gone"):
+            ytmusic._send_request("browse", {"browseId": "FEmusic_home"})
+    assert time.perf_counter() - start >= 0.15
+
+
+def test_record_replay_upload(tmp_path, tests_base_path):
+    cassette = tmp_path / "cassette.json.gz"
+    with RecordingTransport(cassette, Server()) as transport:
+        assert (
+            YTMusic(auth=AUTH, transport=transport).upload_song(str(tests_base_path / "test.mp3"))
+            == ResponseStatus.SUCCEEDED
+        )
+
+    ytmusic = YTMusic(auth=AUTH, transport=ReplayTransport(cassette))
+    assert ytmusic.upload_song(str(tests_base_path / "test.mp3")) == ResponseStatus.SUCCEEDED
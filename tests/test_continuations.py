@@ -0,0 +1,120 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ytmusicapi.continuations import (
+    get_continuations,
+    get_continuations_2025,
+    iter_continuations,
+    iter_continuations_2025,
+)
+
+PAGES = 5
+PAGE_SIZE = 10
+DELAY = 0.05
+
+
+def continuation_item(token: int) -> dict:
+    return {
+        "continuationItemRenderer": {"continuationEndpoint": {"continuationCommand": {"token": str(token)}}}
+    }
+
+
+def page_2025(page: int) -> list[dict]:
+    items = [{"item": page * PAGE_SIZE + i} for i in range(PAGE_SIZE)]
+    return [*items, continuation_item(page + 1)] if page + 1 < PAGES else items
+
+
+def page_ctoken(page: int) -> dict:
+    results: dict = {"contents": [{"item": page * PAGE_SIZE + i} for i in range(PAGE_SIZE)]}
+    if page + 1 < PAGES:
+        results["continuations"] = [{"nextContinuationData": {"continuation": str(page + 1)}}]
+    return results
+
+
+def slow_parse(items: list[dict]) -> list[dict]:
+    time.sleep(DELAY)
+    return [item for item in items if "item" in item]
+
+
+class Server:
+    def __init__(self):
+        self.requests: list[str] = []
+
+    def request_2025(self, body: dict) -> dict:
+        self.requests.append(body["continuation"])
+        time.sleep(DELAY)
+        items = page_2025(int(body["continuation"]))
+        return {
+            "onResponseReceivedActions": [{"appendContinuationItemsAction": {"continuationItems": items}}]
+        }
+
+    def request_ctoken(self, additionalParams: str) -> dict:
+        token = additionalParams.split("=")[-1]
+        self.requests.append(token)
+        time.sleep(DELAY)
+        return {"continuationContents": {"musicShelfContinuation": page_ctoken(int(token))}}
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+@pytest.mark.parametrize("limit", [None, 15, 20, 0])
+def test_get_continuations_2025(executor, limit):
+    server = Server()
+    items = get_continuations_2025(
+        {"contents": page_2025(0)}, limit, server.request_2025, slow_parse, executor=executor
+    )
+    expected_pages = PAGES - 1 if limit is None else -(-limit // PAGE_SIZE)
+    assert items == [{"item": i} for i in range(PAGE_SIZE, (expected_pages + 1) * PAGE_SIZE)]
+    assert server.requests == [str(page) for page in range(1, expected_pages + 1)]
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+@pytest.mark.parametrize("limit", [None, 15, 20, 0])
+def test_get_continuations(executor, limit):
+    server = Server()
+    items = get_continuations(
+        page_ctoken(0), "musicShelfContinuation", limit, server.request_ctoken, slow_parse, executor=executor
+    )
+    expected_pages = PAGES - 1 if limit is None else -(-limit // PAGE_SIZE)
+    assert items == [{"item": i} for i in range(PAGE_SIZE, (expected_pages + 1) * PAGE_SIZE)]
+    assert server.requests == [str(page) for page in range(1, expected_pages + 1)]
+
+
+def test_prefetch_overlaps_parsing():
+    def timed(executor):
+        start = time.perf_counter()
+        get_continuations_2025(
+            {"contents": page_2025(0)}, None, Server().request_2025, slow_parse, executor=executor
+        )
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(1) as executor:
+        assert timed(executor) < timed(None) * 0.8
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+def test_iter_continuations_is_lazy(executor):
+    server = Server()
+    pages = iter_continuations_2025(
+        {"contents": page_2025(0)}, server.request_2025, slow_parse, executor=executor
+    )
+    assert server.requests == []
+    assert next(pages) == ([{"item": i} for i in range(PAGE_SIZE, 2 * PAGE_SIZE)], "2")
+    assert server.requests == ["1", "2"] if executor else ["1"]
+    pages.close()
+
+    pages = iter_continuations(page_ctoken(0), "musicShelfContinuation", server.request_ctoken, slow_parse)
+    assert [len(page) for page, _ in pages] == [PAGE_SIZE] * (PAGES - 1)
+
+
+def test_iter_continuations_cursor():
+    server = Server()
+    pages = iter_continuations(page_ctoken(0), "musicShelfContinuation", server.request_ctoken, slow_parse)
+    assert [cursor for _, cursor in pages] == ["2", "3", "4", None]
+
+    pages = iter_continuations({}, "musicShelfContinuation", server.request_ctoken, slow_parse, cursor="3")
+    assert [page for page, _ in pages] == [page_ctoken(3)["contents"], page_ctoken(4)["contents"]]
+
+    pages_2025 = iter_continuations_2025({}, server.request_2025, slow_parse, limit=5, cursor="4")
+    assert list(pages_2025) == [(page_2025(4), None)]
@@ -0,0 +1,42 @@
+import json
+import sys
+
+import pytest
+
+from tests.fixtures import FakeTransport
+from ytmusicapi import YTMusic
+from ytmusicapi.decoder import BACKENDS, get_decoder
+from ytmusicapi.exceptions import YTMusicUserError
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends(backend, data_path):
+    pytest.importorskip(backend)
+    decode = get_decoder(backend)
+    content = (data_path / "2024_03_get_album.json").read_bytes()
+    assert decode(content) == json.loads(content)
+    assert decode('{"text": "Beyoncé • 𝄞"}'.encode()) == {"text": "Beyoncé • 𝄞"}
+    with pytest.raises(ValueError):
+        decode(b"<html>")
+
+
+def test_get_decoder(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert get_decoder() is json.loads
+    with pytest.raises(ImportError):
+        get_decoder("orjson")
+    with pytest.raises(YTMusicUserError, match="Unknown JSON backend"):
+        get_decoder("simplejson")
+
+
+def test_custom_decoder():
+    contents: list[bytes] = []
+
+    def decode(content: bytes) -> dict:
+        contents.append(content)
+        return json.loads(content)
+
+    ytmusic = YTMusic(transport=FakeTransport({"contents": {}}), json_decoder=decode)
+    assert ytmusic._send_request("browse", {"browseId": "FEmusic_home"}) == {"contents": {}}
+    assert contents == [b'{"contents": {}}']
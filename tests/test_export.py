@@ -0,0 +1,85 @@
+import gzip
+import io
+import json
+import threading
+
+import pytest
+
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+from ytmusicapi.export import SECTIONS, export_library
+
+
+class FakeLibrary:
+    """lists ``size`` items per section, slowly, and records how many listings run at once"""
+
+    def __init__(self, size: int, playlists: int, failing: str | None = None):
+        self.size = size
+        self.playlists = [{"playlistId": f"PL{i}", "title": f"Playlist {i}"} for i in range(playlists)]
+        self.failing = failing
+        self.running = self.max_running = 0
+        self.lock = threading.Lock()
+
+    def _list(self, name: str, items: list | None = None):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            threading.Event().wait(0.01)
+            if name == self.failing:
+                raise YTMusicServerError("Server returned HTTP 500: Internal Server Error.")
+            return items if items is not None else [{"videoId": f"{name}{i}"} for i in range(self.size)]
+        finally:
+            with self.lock:
+                self.running -= 1
+
+    def get_library_playlists(self, limit):
+        return self._list("playlists", self.playlists + self.playlists[:1])
+
+    def iter_playlist(self, playlistId):
+        yield from self._list(playlistId)
+
+    def __getattr__(self, name):
+        if not name.startswith(("get_library_", "iter_library_")):
+            raise AttributeError(name)
+        return lambda limit=None: self._list(name)
+
+
+def read_lines(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_export_library(tmp_path):
+    library = FakeLibrary(size=3, playlists=5)
+    reports = []
+    path = tmp_path / "library.ndjson.gz"
+    progress = export_library(library, path, max_workers=3, progress=reports.append)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = read_lines(f.read())
+    assert lines[0] == {"version": 1, "sections": list(SECTIONS)}
+    counts = {line["section"]: line["count"] for line in lines if "count" in line}
+    assert counts == {**{section: 3 for section in SECTIONS}, "playlists": 6} | {
+        f"playlist:PL{i}": 3 for i in range(5)
+    }
+    assert sum("item" in line for line in lines) == progress.items == 3 * (len(SECTIONS) - 1) + 6 + 5 * 3
+    assert progress.sections == progress.done == len(SECTIONS) + 5
+    assert not progress.failed
+    assert library.max_running == 3
+    assert reports[-1] == progress
+    assert all(report.done <= report.sections for report in reports)
+
+
+def test_export_library_failed_section():
+    library = FakeLibrary(size=2, playlists=1, failing="get_library_albums")
+    output = io.StringIO()
+    progress = export_library(library, output, sections=["albums", "playlists"], max_workers=1)
+    lines = read_lines(output.getvalue())
+    assert progress.failed == {
+        "albums": "YTMusicServerError: Server returned HTTP 500: Internal Server Error."
+    }
+    assert {"section": "albums", "error": progress.failed["albums"]} in lines
+    assert {"section": "playlist:PL0", "count": 2} in lines
+    assert progress.done == progress.sections == 3
+
+    with pytest.raises(YTMusicUserError, match="Unknown sections"):
+        export_library(library, output, sections=["history"])
@@ -0,0 +1,84 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from ytmusicapi import YTMusic
+from ytmusicapi.cache import ResponseCache
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.instrumentation import CallMetrics
+
+
+class Server:
+    """answers every POST with the same response"""
+
+    def __init__(self, response: dict):
+        self.content = json.dumps(response).encode("utf-8")
+
+    def _response(self, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = content
+        return response
+
+    def post(self, url, body, headers, cookies, proxies):
+        return self._response(self.content)
+
+    def get(self, url, params, headers, cookies, proxies):
+        return self._response(b'ytcfg.set({"VISITOR_DATA": "visitor"});')
+
+
+@pytest.fixture(name="album_response")
+def fixture_album_response(data_path) -> dict:
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        return json.load(f)
+
+
+def test_call_metrics(album_response):
+    calls: list[CallMetrics] = []
+    with ThreadPoolExecutor(2) as executor:
+        ytmusic = YTMusic(transport=Server(album_response), executor=executor, metrics=calls.append)
+        albums = ytmusic.get_albums(["MPREb_1", "MPREb_2", "MPREb_3"], concurrency=2)
+    assert all(album["title"] for album in albums)
+
+    (call,) = calls
+    assert call.method == "get_albums" and call.exception is None
+    # the visitor id is requested once by the first request
+    assert [request.endpoint for request in call.requests].count("browse") == 3
+    browse = next(request for request in call.requests if request.endpoint == "browse")
+    assert browse.category == "album" and not browse.continuation and browse.cache is None
+    assert browse.response_bytes == len(json.dumps(album_response))
+    assert call.total > 0 and call.decode > 0
+
+
+def test_cache_and_errors(album_response):
+    calls: list[CallMetrics] = []
+    ytmusic = YTMusic(transport=Server(album_response), cache=ResponseCache(), metrics=calls.append)
+    ytmusic.get_album("MPREb_1")
+    ytmusic.get_album("MPREb_1")
+    assert [request.cache for request in calls[0].requests if request.endpoint == "browse"] == ["miss"]
+    assert [request.cache for request in calls[1].requests] == ["hit"]
+    assert calls[1].cache_hits == 1
+    assert calls[0].total > calls[0].parse > 0
+
+    with pytest.raises(YTMusicUserError):
+        ytmusic.get_album("invalid")
+    assert isinstance(calls[2].exception, YTMusicUserError)
+    assert calls[2].requests == []
+
+
+def test_generator_metrics(playlist_response):
+    calls: list[CallMetrics] = []
+    ytmusic = YTMusic(transport=Server(playlist_response), metrics=calls.append)
+    tracks = ytmusic.iter_playlist("PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm")
+    next(tracks)
+    assert calls == []
+    tracks.close()
+    (call,) = calls
+    assert call.method == "iter_playlist"
+
+    with pytest.raises(YTMusicUserError):
+        ytmusic.iter_library_songs()  # checks the authentication before the first item is requested
+    assert calls[1].method == "iter_library_songs" and isinstance(calls[1].exception, YTMusicUserError)
+    assert [request.category for request in call.requests if request.endpoint == "browse"] == ["playlist"]
@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+from tests.fixtures import PLAYLIST_ID, PlaylistServer, make_items
+from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.library_index import LibraryIndex
+
+
+class FakeLibrary:
+    """serves canned library listings, and playlists through a client of a PlaylistServer"""
+
+    def __init__(self, server: PlaylistServer):
+        self.server = server
+        self.client = YTMusic(transport=server)
+        self.songs = [
+            {
+                "videoId": "abc",
+                "title": "Around the World",
+                "artists": [{"name": "Daft Punk", "id": "UC1"}],
+                "album": {"name": "Homework", "id": "MPRE1"},
+            },
+            {"videoId": "def", "title": "Windowlicker", "artists": [{"name": "Aphex Twin"}], "album": None},
+        ]
+        self.uploads = [{"entityId": "t_po_1", "videoId": "up1", "title": "Demo Tape", "artists": None}]
+        self.albums = [{"browseId": "MPRE1", "title": "Homework", "artists": [{"name": "Daft Punk"}]}]
+        self.artists = [{"browseId": "UC1", "artist": "Daft Punk"}]
+        self.playlists = [
+            {"playlistId": PLAYLIST_ID, "title": "Mix", "owned": True},
+            {"playlistId": "PLother", "title": "Someone else's", "owned": False},
+        ]
+        self.calls: list[str] = []
+
+    def iter_library_songs(self):
+        self.calls.append("songs")
+        yield from self.songs
+
+    def iter_library_upload_songs(self):
+        self.calls.append("uploads")
+        yield from self.uploads
+
+    def get_library_albums(self, limit):
+        self.calls.append("albums")
+        return self.albums
+
+    def get_library_artists(self, limit):
+        self.calls.append("artists")
+        return self.artists
+
+    def get_library_playlists(self, limit):
+        self.calls.append("playlists")
+        return self.playlists
+
+    def sync_playlist(self, playlistId, snapshot=None):
+        self.calls.append(playlistId)
+        if playlistId == "LM":
+            return YTMusic(transport=PlaylistServer(self.server.body, [])).sync_playlist(playlistId, snapshot)
+        return self.client.sync_playlist(playlistId, snapshot)
+
+
+@pytest.fixture(name="library")
+def fixture_library(playlist_response) -> FakeLibrary:
+    return FakeLibrary(PlaylistServer(playlist_response, make_items(0, 25)))
+
+
+def test_library_index(library, tmp_path):
+    index = LibraryIndex(tmp_path / "library.db")
+    refreshed = index.refresh(library)
+    assert refreshed == {
+        "songs": 2,
+        "uploads": 1,
+        "albums": 1,
+        "artists": 1,
+        "playlists": 2,
+        "playlist:LM": 0,
+        f"playlist:{PLAYLIST_ID}": 25,
+    }
+    assert len(index) == 32
+
+    results = index.search("daft")
+    assert {(result["resultType"], result["source"]) for result in results} == {
+        ("song", "songs"),
+        ("album", "albums"),
+        ("artist", "artists"),
+    }
+    assert [result["videoId"] for result in index.search("arou wor", kinds=["song"])] == ["abc"]
+    assert index.search("homework", kinds=["song"])[0]["videoId"] == "abc"  # matches the album
+    assert index.search("demo")[0]["entityId"] == "t_po_1"
+    assert not index.search('"') and not index.search("  ") and not index.search("zzz")
+    assert len(index.search("Hate Everything", kinds=["playlistItem"], limit=5)) == 5
+    index.close()
+
+    library.calls.clear()
+    reopened = LibraryIndex(tmp_path / "library.db")
+    assert reopened.refresh(library, max_age=3600) == {}
+    assert library.calls == []
+    assert len(reopened.search("daft")) == 3  # answered without requests
+
+    with pytest.raises(YTMusicUserError, match="Unknown sources"):
+        reopened.refresh(library, ["subscriptions"])
+
+
+def test_library_index_incremental(library):
+    index = LibraryIndex()
+    index.refresh(library)
+
+    library.songs.pop(0)
+    removed = library.server.items.pop(3)
+    library.server.items.insert(0, make_items(100, 101)[0])
+    library.playlists[0]["title"] = "Renamed mix"
+    library.server.requests.clear()
+    assert index.refresh(library, ["songs", "playlists"])[f"playlist:{PLAYLIST_ID}"] == 25
+    assert library.server.pages == 2  # stops at the first page after the edits
+
+    assert {result["resultType"] for result in index.search("daft")} == {"album", "artist"}
+    assert index.search("renamed")[0]["playlistId"] == PLAYLIST_ID
+    items = index.search("Hate Everything", kinds=["playlistItem"], limit=100)
+    set_video_ids = {item["setVideoId"] for item in items}
+    assert "SET0000000000100" in set_video_ids and removed[1] not in set_video_ids
+    assert len(items) == 25
+
+    library.playlists.pop(0)
+    index.refresh(library, ["playlists"])
+    assert not index.search("Hate Everything", kinds=["playlistItem"])
+    assert f"playlist:{PLAYLIST_ID}" not in index.sources()
+
+
+def test_library_index_changed_status(library):
+    index = LibraryIndex()
+    index.refresh(library, ["playlists"])
+    source = f"playlist:{PLAYLIST_ID}"
+    connection = index._connection
+    (state,) = connection.execute("SELECT state FROM sources WHERE source = ?", (source,)).fetchone()
+    snapshot = json.loads(state)
+    videoId, setVideoId = snapshot["items"][3][:2]
+    snapshot["items"][3] = [videoId, setVideoId, "LIKE", "UP", 3]
+    connection.execute("UPDATE sources SET state = ? WHERE source = ?", (json.dumps(snapshot), source))
+    (data,) = connection.execute("SELECT data FROM entries WHERE key = ?", (setVideoId,)).fetchone()
+    stale = {
+        **json.loads(data),
+        "likeStatus": "LIKE",
+        "communityVoteStatus": {"netVoteValue": 3, "status": "UP"},
+    }
+    connection.execute("UPDATE entries SET data = ? WHERE key = ?", (json.dumps(stale), setVideoId))
+
+    index.refresh(library, ["playlists"])
+    (data,) = connection.execute("SELECT data FROM entries WHERE key = ?", (setVideoId,)).fetchone()
+    assert json.loads(data) == {**stale, "likeStatus": "INDIFFERENT", "communityVoteStatus": None}
@@ -0,0 +1,23 @@
+import pytest
+
+from ytmusicapi.navigation import compile_path, nav
+
+DATA = {"a": [{"b": "value"}, {"c": None}]}
+
+
+@pytest.mark.parametrize(
+    "path", [["a", 0, "b"], ["a", 1, "c"], ["a", 2, "b"], ["a", 0, "c"], ["x"], ["a", -1]]
+)
+def test_compile_path_matches_nav(path):
+    assert compile_path(path, True)(DATA) == nav(DATA, path, True)
+    assert compile_path(path, True)(None) is None
+
+
+def test_compile_path_errors():
+    with pytest.raises(KeyError, match="Unable to find 'c'"):
+        compile_path(["a", 0, "c"])(DATA)
+    with pytest.raises(IndexError, match="Unable to find '2'"):
+        compile_path(["a", 2])(DATA)
+    with pytest.raises(TypeError):
+        compile_path(["a", slice(1)])
+    assert compile_path(["a", 0, "b"]).__name__ == "get['a'][0]['b']"
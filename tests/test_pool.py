@@ -0,0 +1,116 @@
+import pytest
+
+from tests.fixtures import FakeTransport, ThrottledTransport
+from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+from ytmusicapi.pool import ClientPool, TokenBucket
+
+PLAYLIST_ID = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+
+
+class Clock:
+    """a clock which only advances when sleeping"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_pool(clock: Clock, *transports: FakeTransport, **kwargs) -> ClientPool:
+    clients = {f"account{i}": YTMusic(transport=transport) for i, transport in enumerate(transports)}
+    return ClientPool(clients, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_token_bucket():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+    assert bucket.delay() == 1.5
+    clock.sleep(10)
+    assert bucket.delay() == 0
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+    bucket.pause(5)
+    assert bucket.paused_until == clock.now + 5
+    assert bucket.reserve() == 6  # after the pause, behind the token reserved before it
+    clock.sleep(6)
+    assert bucket.reserve() == 0.5
+
+    with pytest.raises(YTMusicUserError):
+        TokenBucket(rate=0)
+
+
+def test_pool_dispatch(playlist_response):
+    clock = Clock()
+    transports = [FakeTransport(playlist_response), FakeTransport(playlist_response)]
+    pool = make_pool(clock, *transports, rate=1, burst=2)
+
+    playlists = [pool.get_playlist(PLAYLIST_ID, limit=None) for _ in range(4)]
+    assert all(playlist == playlists[0] for playlist in playlists)
+    # each account fetched its visitor id and two playlists, within its burst and one token later
+    assert [len(transport.requests) for transport in transports] == [3, 3]
+    assert clock.now == 101
+
+    stats = pool.stats()
+    assert stats["account0"].calls == stats["account1"].calls == 2
+    assert stats["account0"].requests == 3
+    assert stats["account0"].in_flight == 0 and pool.queue_depth == 0
+    assert stats["account0"].waited == 1 and stats["account1"].waited == 0  # refilled meanwhile
+
+
+def test_pool_pinned_account(playlist_response):
+    clock = Clock()
+    transports = [FakeTransport(playlist_response), FakeTransport(playlist_response)]
+    pool = make_pool(clock, *transports)
+
+    tracks = pool.iter_playlist(PLAYLIST_ID, account="account1")
+    assert pool.stats()["account1"].in_flight == 1
+    assert next(tracks)["videoId"]
+    tracks.close()
+    assert pool.stats()["account1"].in_flight == 0
+    assert not transports[0].requests
+
+    with pytest.raises(YTMusicUserError, match="Unknown account"):
+        pool.get_playlist(PLAYLIST_ID, account="account2")
+    with pytest.raises(YTMusicUserError, match="not a method"):
+        pool.call("_send_request", "browse", {})
+    assert not hasattr(pool, "get_playlists")
+    with pytest.raises(YTMusicUserError, match="account1 are not YTMusic"):
+        ClientPool({"account0": YTMusic(), "account1": FakeTransport({})})
+
+
+def test_pool_retry_after(playlist_response):
+    clock = Clock()
+    throttled = ThrottledTransport(playlist_response, throttled=1, headers={"Retry-After": "30"})
+    pool = make_pool(clock, throttled, FakeTransport(playlist_response), rate=1, burst=1)
+
+    with pytest.raises(YTMusicServerError, match="429"):
+        pool.get_playlist(PLAYLIST_ID, account="account0")
+    stats = pool.stats()
+    assert stats["account0"].throttled == 1
+    assert stats["account0"].paused_for == 30
+
+    pool.get_playlist(PLAYLIST_ID)  # dispatched to the account which is not paused
+    assert pool.stats()["account1"].calls == 1
+    pool.get_playlist(PLAYLIST_ID, account="account0")
+    assert clock.now >= 130
+
+
+def test_pool_exponential_backoff(playlist_response):
+    clock = Clock()
+    pool = make_pool(
+        clock, ThrottledTransport(playlist_response, throttled=3), rate=10, backoff=2, max_backoff=5
+    )
+    pauses = []
+    for _ in range(3):
+        with pytest.raises(YTMusicServerError):
+            pool.get_playlist(PLAYLIST_ID)
+        pauses.append(pool.stats()["account0"].paused_for)
+    assert pauses == [2, 4, 5]
+    pool.get_playlist(PLAYLIST_ID)
+    assert pool.stats()["account0"].throttled == 3
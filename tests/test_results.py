@@ -0,0 +1,161 @@
+import pickle
+from functools import partial
+
+import pytest
+
+from tests.fixtures import recorded_shelves
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.models.results import LazyResult, SearchResult, Track, item_parser, lazy_field
+from ytmusicapi.navigation import MRLIR
+from ytmusicapi.parsers.playlists import parse_playlist_item, parse_playlist_items
+from ytmusicapi.parsers.search import parse_search_result, parse_search_results
+
+SHELVES = recorded_shelves()
+
+
+def unresolved(result: LazyResult) -> set[str]:
+    return {
+        slot for slot in type(result).__slots__ if slot.startswith("_cached_") and not hasattr(result, slot)
+    }
+
+
+@pytest.mark.parametrize("name", SHELVES)
+def test_track_matches_playlist_item(name):
+    is_album = "get_album" in name
+    is_collaborative = "collaborative" in name
+    eager = parse_playlist_items(SHELVES[name], is_album, is_collaborative)
+    lazy = parse_playlist_items(SHELVES[name], is_album, is_collaborative, parse_item=Track.parse)
+
+    assert lazy == eager
+    for track, expected in zip(lazy, eager, strict=True):
+        assert isinstance(track, Track)
+        assert list(track) == list(expected)
+        assert track.to_dict() == expected
+        assert track.get("setVideoId") == expected.get("setVideoId")
+
+
+@pytest.mark.parametrize("name", SHELVES)
+def test_track_projection(name):
+    is_album = "get_album" in name
+    fields = ["title", "videoId", "duration_seconds", "setVideoId", "feedbackTokens", "trackNumber"]
+    eager = parse_playlist_items(SHELVES[name], is_album)
+    projected = parse_playlist_items(
+        SHELVES[name], is_album, parse_item=item_parser(Track.parse, fields=fields)
+    )
+
+    assert projected == [{key: item[key] for key in fields if key in item} for item in eager]
+    assert all(list(item)[:2] == ["title", "videoId"] for item in projected)
+
+
+def test_track_projection_skips_fields():
+    track = Track(SHELVES["2024_03_get_playlist"][0][MRLIR])
+    assert set(track.project(["videoId", "isExplicit"])) == {"videoId", "isExplicit"}
+    assert {"_cached_artists", "_cached_album", "_cached_thumbnails", "_cached_menu_data"} <= unresolved(
+        track
+    )
+
+
+def test_item_parser():
+    assert item_parser(Track.parse) is None
+    assert item_parser(Track.parse, lazy=True) == Track.parse
+    with pytest.raises(YTMusicUserError, match="lazy"):
+        item_parser(Track.parse, lazy=True, fields=["title"])
+    with pytest.raises(YTMusicUserError, match="Unknown fields tilte"):
+        item_parser(Track.parse, fields=["tilte"], known_fields=Track.FIELDS)
+
+
+def test_track_resolves_fields_on_access():
+    data = SHELVES["2024_03_get_playlist"][0][MRLIR]
+    expected = parse_playlist_item(data)
+    assert expected is not None
+    track = Track(data)
+    assert not hasattr(track, "__dict__")
+    assert unresolved(track) == set(Track.__slots__[3:])
+
+    assert track.videoId == expected["videoId"]
+    assert "_cached_artists" in unresolved(track)
+    assert "_cached_thumbnails" in unresolved(track)
+    assert "_cached_menu_data" in unresolved(track)
+
+    assert track["artists"] is track.artists  # resolved once
+    assert "_cached_artists" not in unresolved(track)
+
+
+def test_track_missing_keys():
+    track = Track(SHELVES["2024_03_get_playlist"][0][MRLIR])
+    assert track.trackNumber is None
+    assert "trackNumber" not in track
+    with pytest.raises(KeyError):
+        track["trackNumber"]
+    with pytest.raises(KeyError):
+        track["unknown"]
+
+
+def test_track_deleted():
+    data = SHELVES["2024_03_get_playlist"][0][MRLIR]
+    data = {**data, "musicItemRendererDisplayPolicy": "MUSIC_ITEM_RENDERER_DISPLAY_POLICY_GREY_OUT"}
+    data["flexColumns"] = [
+        {"musicResponsiveListItemFlexColumnRenderer": {"text": {"runs": [{"text": "Song deleted"}]}}},
+        *data["flexColumns"][1:],
+    ]
+    assert parse_playlist_item(data) is None
+    assert Track.parse(data) is None
+
+
+def test_search_result_parses_once():
+    rows = SHELVES["2024_03_get_playlist"]
+    eager = parse_search_results(rows, "song", "Songs")
+    lazy = parse_search_results(rows, "song", "Songs", parse_item=SearchResult.parse)
+    assert lazy == eager
+    assert all(result.to_dict() == expected for result, expected in zip(lazy, eager, strict=True))
+
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return parse_search_result(rows[0][MRLIR], "song", "Songs")
+
+    result = SearchResult(parse)
+    assert not calls
+    assert result.videoId == result["videoId"] == eager[0]["videoId"]
+    assert result.resultType == "song"
+    assert len(calls) == 1
+    assert not hasattr(result, "browseId") and "browseId" not in result
+    assert "SearchResult({'category': 'Songs'" in repr(result)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [["resultType", "videoId", "title"], ["artists", "duration_seconds"], ["inLibrary", "thumbnails"]],
+)
+def test_search_result_partial_parse(fields):
+    rows = SHELVES["2024_03_get_playlist"]
+    eager = parse_search_results(rows, "song", "Songs")
+    projected = parse_search_results(
+        rows,
+        "song",
+        "Songs",
+        parse_item=item_parser(partial(SearchResult.parse, fields=fields), fields=fields),
+    )
+    assert projected == [{key: result[key] for key in fields if key in result} for result in eager]
+
+    parsed = parse_search_result(rows[0][MRLIR], "song", "Songs", fields=["videoId"])
+    assert "videoId" in parsed and not {"thumbnails", "inLibrary", "artists"} & parsed.keys()
+
+
+def test_lazy_field_requires_slot():
+    with pytest.raises((TypeError, RuntimeError)) as excinfo:  # wrapped in a RuntimeError before 3.12
+
+        class Incomplete(LazyResult):
+            __slots__ = ()
+
+            @lazy_field
+            def title(self) -> str:
+                return "title"
+
+    assert "missing _cached_title" in str(excinfo.value.__cause__ or excinfo.value)
+
+
+def test_track_pickle():
+    track = Track(SHELVES["2024_03_get_playlist"][0][MRLIR])
+    assert pickle.loads(pickle.dumps(track)) == track
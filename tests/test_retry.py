@@ -0,0 +1,130 @@
+import pytest
+import requests
+
+from tests.fixtures import FakeTransport, ThrottledTransport
+from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.retry import RetryPolicy, retry_after
+
+PLAYLIST_ID = "PLaZPMsuQNCsWn0iVMtGbaUXO6z-EdZaZm"
+
+
+class FlakyTransport(FakeTransport):
+    """raises ``errors`` in turn before answering POSTs"""
+
+    def __init__(self, body: dict, *errors: Exception):
+        super().__init__(body)
+        self.errors = list(errors)
+
+    def post(self, url, body, headers, cookies, proxies):
+        if self.errors:
+            self.requests.append(("POST", url))
+            raise self.errors.pop(0)
+        return super().post(url, body, headers, cookies, proxies)
+
+
+def policy(sleeps: list, **kwargs) -> RetryPolicy:
+    return RetryPolicy(jitter=0, sleep=sleeps.append, **kwargs)
+
+
+def posts(transport: FakeTransport) -> int:
+    return sum(method == "POST" for method, _ in transport.requests)
+
+
+def test_retry_after():
+    response = requests.Response()
+    assert retry_after(response) is None
+    response.headers["Retry-After"] = "120"
+    assert retry_after(response) == 120
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert retry_after(response, now=1445412470) == 10
+    response.headers["Retry-After"] = "soon"
+    assert retry_after(response) is None
+
+
+def test_retry_policy_delay():
+    retry = RetryPolicy(max_attempts=5, backoff=1, max_backoff=5, jitter=0)
+    assert [retry.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, None]
+    response = requests.Response()
+    response.headers["Retry-After"] = "7"
+    assert retry.delay(1, response) == 7
+    response.headers["Retry-After"] = "300"
+    assert retry.delay(1, response) is None
+    jittered = RetryPolicy(backoff=1, jitter=0.5)
+    assert all(0.5 <= jittered.delay(1) <= 1 for _ in range(100))
+
+
+def test_retry_status(playlist_response):
+    sleeps: list[float] = []
+    transport = ThrottledTransport(playlist_response, throttled=2)
+    ytmusic = YTMusic(transport=transport, retry=policy(sleeps, backoff=1))
+    assert ytmusic.get_playlist(PLAYLIST_ID)["tracks"]
+    assert posts(transport) == 3
+    assert sleeps == [1, 2]
+    stats = ytmusic.retry_stats
+    assert (stats.requests, stats.retries, stats.exhausted, stats.waited) == (2, 2, 0, 3)
+    assert stats.reasons == {"429": 2}
+
+
+def test_retry_exhausted(playlist_response):
+    sleeps: list[float] = []
+    transport = ThrottledTransport(playlist_response, throttled=5, headers={"Retry-After": "3"})
+    ytmusic = YTMusic(transport=transport, retry=policy(sleeps, max_attempts=3))
+    with pytest.raises(YTMusicServerError, match="429"):
+        ytmusic.get_playlist(PLAYLIST_ID)
+    assert sleeps == [3, 3]
+    assert ytmusic.retry_stats.exhausted == 1
+
+
+def test_retry_exceptions(playlist_response):
+    sleeps: list[float] = []
+    errors = [requests.ConnectionError("reset"), requests.ReadTimeout("timeout")]
+    transport = FlakyTransport(playlist_response, *errors)
+    ytmusic = YTMusic(transport=transport, retry=policy(sleeps))
+    assert ytmusic.get_playlist(PLAYLIST_ID)["tracks"]
+    assert ytmusic.retry_stats.reasons == {"ConnectionError": 1, "ReadTimeout": 1}
+
+    transport = FlakyTransport(playlist_response, ValueError("not transient"))
+    ytmusic = YTMusic(transport=transport, retry=policy(sleeps))
+    with pytest.raises(ValueError):
+        ytmusic.get_playlist(PLAYLIST_ID)
+    assert ytmusic.retry_stats.retries == 0
+
+
+def test_retry_writes(playlist_response):
+    sleeps: list[float] = []
+    errors = [requests.ConnectionError("reset")]
+    ytmusic = YTMusic(transport=FlakyTransport(playlist_response, *errors), retry=policy(sleeps))
+    with pytest.raises(requests.ConnectionError):
+        ytmusic._send_request("browse/edit_playlist", {"playlistId": "PL"})
+
+    transport = ThrottledTransport({}, throttled=1)
+    ytmusic = YTMusic(transport=transport, retry=policy(sleeps))
+    ytmusic._send_request("browse/edit_playlist", {"playlistId": "PL"})  # 429 is always retried
+    assert posts(transport) == 2
+
+    ytmusic = YTMusic(transport=FlakyTransport({}, *errors), retry=policy(sleeps, retry_writes=True))
+    assert ytmusic._send_request("browse/edit_playlist", {"playlistId": "PL"}) == {}
+
+
+def test_no_retry_by_default(playlist_response):
+    ytmusic = YTMusic(transport=ThrottledTransport(playlist_response, throttled=1))
+    with pytest.raises(YTMusicServerError, match="429"):
+        ytmusic.get_playlist(PLAYLIST_ID)
+    assert ytmusic.retry_stats.requests == 2 and ytmusic.retry_stats.retries == 0
+
+
+def test_error_page_is_not_json():
+    transport = FlakyTransport({})
+    ytmusic = YTMusic(transport=transport)
+
+    def post(url, body, headers, cookies, proxies):
+        response = requests.Response()
+        response.status_code = 502
+        response.reason = "Bad Gateway"
+        response._content = b"<html>Bad Gateway</html>"
+        return response
+
+    transport.post = post
+    with pytest.raises(YTMusicServerError, match="HTTP 502: Bad Gateway"):
+        ytmusic._send_request("browse", {"browseId": "FEmusic_home"})
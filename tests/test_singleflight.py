@@ -0,0 +1,125 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.fixtures import FakeTransport
+from ytmusicapi import YTMusic
+from ytmusicapi.singleflight import SingleFlight
+
+WORKERS = 5
+
+
+class GatedTransport(FakeTransport):
+    """holds POSTs and GETs with parameters until ``release`` is set"""
+
+    def __init__(self, body: dict):
+        super().__init__(body)
+        self.release = threading.Event()
+        self.waiting: list[dict] = []
+
+    def post(self, url, body, headers, cookies, proxies):
+        self.waiting.append(body)
+        assert self.release.wait(5)
+        return super().post(url, body, headers, cookies, proxies)
+
+    def get(self, url, params, headers, cookies, proxies):
+        if params is not None:  # not the visitor id
+            self.waiting.append(params)
+            assert self.release.wait(5)
+        return super().get(url, params, headers, cookies, proxies)
+
+
+def wait_until(condition) -> None:
+    event = threading.Event()
+    for _ in range(500):
+        if condition():
+            return
+        event.wait(0.01)
+    raise AssertionError("timed out")
+
+
+def test_single_flight():
+    flights: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        assert release.wait(5)
+        return 42
+
+    with ThreadPoolExecutor(WORKERS) as executor:
+        futures = [executor.submit(flights.do, "key", fn) for _ in range(WORKERS)]
+        wait_until(lambda: flights.shared == WORKERS - 1)
+        release.set()
+        results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert sorted(results) == [(42, False)] + [(42, True)] * (WORKERS - 1)
+    assert flights.do("key", lambda: 43) == (43, False)  # finished calls are not kept
+
+
+def test_single_flight_exception():
+    flights: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        assert release.wait(5)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(flights.do, "key", fail) for _ in range(2)]
+        wait_until(lambda: flights.shared == 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError, match="failed"):
+                future.result()
+    assert not flights._flights
+
+
+def test_ytmusic_coalesces_requests(data_path):
+    with open(data_path / "2024_03_get_album.json", encoding="utf8") as f:
+        transport = GatedTransport(json.load(f))
+    ytmusic = YTMusic(transport=transport)
+    assert ytmusic._flights is not None
+
+    with ThreadPoolExecutor(WORKERS) as executor:
+        futures = [executor.submit(ytmusic.get_album, "MPREb_abc") for _ in range(WORKERS)]
+        other = executor.submit(ytmusic.get_album, "MPREb_def")
+        wait_until(lambda: ytmusic._flights.shared == WORKERS - 1)
+        transport.release.set()
+        albums = [future.result() for future in futures]
+        other.result()
+    assert all(album == albums[0] for album in albums)
+    assert albums[0]["tracks"] is not albums[1]["tracks"]  # each caller parses its own copy
+    assert [body["browseId"] for body in transport.bodies].count("MPREb_abc") == 1
+    assert len(transport.bodies) == 2
+
+
+def test_ytmusic_does_not_coalesce_writes():
+    transport = GatedTransport({})
+    ytmusic = YTMusic(transport=transport)
+    with ThreadPoolExecutor(2) as executor:
+        body = {"target": {"videoId": "abc"}}
+        futures = [executor.submit(ytmusic._send_request, "like/like", body) for _ in range(2)]
+        wait_until(lambda: len(transport.waiting) == 2)
+        transport.release.set()
+        for future in futures:
+            future.result()
+    assert len(transport.bodies) == 2
+
+    transport = GatedTransport({})
+    ytmusic = YTMusic(transport=transport)
+    with ThreadPoolExecutor(2) as executor:
+        params = {"cpn": "abc"}
+        url = "https://example.com/playback"
+        futures = [executor.submit(ytmusic._send_get_request, url, params, write=True) for _ in range(2)]
+        wait_until(lambda: len(transport.waiting) == 2)
+        transport.release.set()
+        for future in futures:
+            future.result()
+    assert transport.requests.count(("GET", url)) == 2
+
+    ytmusic = YTMusic(transport=transport, coalesce=False)
+    assert ytmusic._flights is None
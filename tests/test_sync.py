@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from tests.fixtures import PLAYLIST_ID, PlaylistServer, make_items
+from ytmusicapi import YTMusic
+from ytmusicapi.helpers import longest_increasing_subsequence
+from ytmusicapi.sync import PlaylistSnapshot, SnapshotItem
+
+
+@pytest.fixture(name="server")
+def fixture_server(playlist_response) -> PlaylistServer:
+    return PlaylistServer(playlist_response, make_items(0, 25))
+
+
+def sync(server: PlaylistServer, snapshot: PlaylistSnapshot | None = None, full: bool = False):
+    server.requests.clear()
+    snapshot, diff = YTMusic(transport=server).sync_playlist(PLAYLIST_ID, snapshot, full=full)
+    assert [item.setVideoId for item in snapshot.items] == [setVideoId for _, setVideoId in server.items]
+    assert diff.pages == server.pages
+    return snapshot, diff
+
+
+def test_longest_increasing_subsequence():
+    assert longest_increasing_subsequence([]) == []
+    assert longest_increasing_subsequence([0, 1, 2]) == [0, 1, 2]
+    assert longest_increasing_subsequence([3, 0, 1, 2]) == [1, 2, 3]
+    assert longest_increasing_subsequence([0, 4, 1, 2, 3, 5]) == [0, 2, 3, 4, 5]
+    assert len(longest_increasing_subsequence([2, 2, 1, 1])) == 1
+
+
+def test_sync_initial(server):
+    snapshot, diff = sync(server)
+    assert diff.pages == 3 and diff.complete
+    assert [position for position, _ in diff.added] == list(range(25))
+    assert diff.added[3][1]["videoId"] == "video000003"
+    assert diff.header["trackCount"] == (None, 25)
+    assert snapshot.header["privacy"] == "PRIVATE"
+    assert PlaylistSnapshot.from_dict(json.loads(json.dumps(snapshot.to_dict()))) == snapshot
+
+
+def test_sync_unchanged(server):
+    snapshot, _ = sync(server)
+    resynced, diff = sync(server, snapshot)
+    assert resynced == snapshot
+    assert not diff
+    assert diff.pages == 1 and not diff.complete
+
+    _, diff = sync(server, snapshot, full=True)
+    assert not diff and diff.pages == 3 and diff.complete
+
+
+def test_sync_edits_near_top(server):
+    snapshot, _ = sync(server)
+    removed = server.items.pop(5)
+    server.items.insert(2, make_items(100, 101)[0])
+    snapshot, diff = sync(server, snapshot)
+    assert diff.pages == 2 and not diff.complete
+    assert [(position, track["setVideoId"]) for position, track in diff.added] == [(2, "SET0000000000100")]
+    assert diff.removed == [SnapshotItem(*removed, "INDIFFERENT")]
+    assert not diff.moved and not diff.header
+
+    server.items.pop(0)
+    snapshot, diff = sync(server, snapshot)
+    assert diff.pages == 1
+    assert diff.header == {"trackCount": (25, 24)}
+
+
+def test_sync_moves_and_appends(server):
+    snapshot, _ = sync(server)
+    server.items.insert(0, server.items.pop())
+    server.items.extend(make_items(100, 102))
+    _, diff = sync(server, snapshot)
+    assert diff.pages == 3 and diff.complete
+    assert [(item.setVideoId, old, new) for item, old, new in diff.moved] == [("SET0000000000024", 24, 0)]
+    assert [position for position, _ in diff.added] == [25, 26]
+    assert diff.header == {"trackCount": (25, 27)}
+
+
+def test_sync_changed_status(server):
+    snapshot, _ = sync(server)
+    snapshot.items[3] = snapshot.items[3]._replace(likeStatus="LIKE")
+    snapshot.items[22] = snapshot.items[22]._replace(likeStatus="LIKE")
+    _, diff = sync(server, snapshot)
+    assert diff.pages == 2  # stops at the second page, which matches the snapshot
+    assert [(old.likeStatus, new.likeStatus) for old, new in diff.changed] == [("LIKE", "INDIFFERENT")]
+    assert not diff.added and not diff.removed and not diff.moved
+
+    _, diff = sync(server, snapshot, full=True)
+    assert [old.setVideoId for old, _ in diff.changed] == ["SET0000000000003", "SET0000000000022"]
+
+
+def test_sync_duplicates_without_set_video_id(playlist_response):
+    # playlists of other users have no setVideoId, so copies of a video are told apart by their order
+    server = PlaylistServer(
+        playlist_response, [("videoA", ""), ("videoB", ""), ("videoA", ""), ("videoC", "")]
+    )
+    client = YTMusic(transport=server)
+    snapshot, diff = client.sync_playlist(PLAYLIST_ID)
+    assert [item.key for item in snapshot.items] == ["videoA", "videoB", "videoA", "videoC"]
+    assert [position for position, _ in diff.added] == [0, 1, 2, 3]
+
+    _, diff = client.sync_playlist(PLAYLIST_ID, snapshot, full=True)
+    assert not diff
+
+    server.items.pop(2)
+    _, diff = client.sync_playlist(PLAYLIST_ID, snapshot, full=True)
+    assert diff.removed == [snapshot.items[2]]
+    assert not diff.added and not diff.moved
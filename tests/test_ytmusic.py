@@ -1,8 +1,11 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import pytest
 import requests
 
+from tests.fixtures import FakeTransport
 from ytmusicapi import YTMusic
 from ytmusicapi.exceptions import YTMusicUserError
 
@@ -26,3 +29,67 @@ def test_ytmusic_session():
     ytmusic = YTMusic()
     assert isinstance(ytmusic._session, requests.Session)
     assert ytmusic._session != test_session
+
+
+def test_ytmusic_transport():
+    transport = FakeTransport({"contents": {}})
+    ytmusic = YTMusic(transport=transport)
+    assert ytmusic._send_request("browse", {"browseId": "FEmusic_home"}) == {"contents": {}}
+    assert ytmusic.base_headers["X-Goog-Visitor-Id"] == "visitor"
+    assert transport.requests == [
+        ("GET", "https://music.youtube.com"),
+        ("POST", "https://music.youtube.com/youtubei/v1/browse?alt=json"),
+    ]
+
+
+def test_ytmusic_iter_checks_auth_on_call():
+    transport = FakeTransport({"contents": {}})
+    ytmusic = YTMusic(transport=transport)
+    for iter_method in (ytmusic.iter_library_songs, ytmusic.iter_history, ytmusic.iter_library_upload_songs):
+        with pytest.raises(YTMusicUserError, match="authentication"):
+            iter_method()
+    with pytest.raises(YTMusicUserError, match="Unknown fields"):
+        ytmusic.iter_history(fields=["tilte"])
+    with pytest.raises(YTMusicUserError, match="Unknown fields"):
+        ytmusic.iter_playlist("PL123", fields=["tilte"])
+    with pytest.raises(YTMusicUserError, match="Invalid filter"):
+        ytmusic.iter_search("query", "tracks")
+    assert transport.requests == []
+
+
+def test_ytmusic_shared_between_threads():
+    transport = FakeTransport({"contents": {}})
+    ytmusic = YTMusic(transport=transport)
+    body = {"browseId": "FEmusic_home"}
+    barrier = threading.Barrier(8)
+
+    def send(_):
+        barrier.wait()
+        return ytmusic._send_request("browse", body)
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(send, range(8))) == [{"contents": {}}] * 8
+    assert body == {"browseId": "FEmusic_home"}  # the context is added to a copy
+    assert [method for method, _ in transport.requests].count("GET") == 1  # visitor id fetched once
+
+    headers = ytmusic.headers
+    headers["X-Test"] = "1"
+    assert "X-Test" not in ytmusic.base_headers
+
+
+def test_ytmusic_as_mobile_thread_local():
+    transport = FakeTransport({"contents": {}})
+    ytmusic = YTMusic(transport=transport)
+
+    def client_name():
+        ytmusic._send_request("browse", {"browseId": "FEmusic_home"})
+        return transport.bodies[-1]["context"]["client"]["clientName"]
+
+    with ytmusic.as_mobile(), ThreadPoolExecutor(1) as executor:
+        assert client_name() == "ANDROID_MUSIC"
+        assert executor.submit(client_name).result() == "WEB_REMIX"
+        assert (
+            YTMusic(transport=transport)._request_context()["context"]["client"]["clientName"] == "WEB_REMIX"
+        )
+    assert client_name() == "WEB_REMIX"
+    assert ytmusic.context["context"]["client"]["clientName"] == "WEB_REMIX"
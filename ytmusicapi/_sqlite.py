@@ -0,0 +1,22 @@
+"""sqlite helpers shared by :py:mod:`ytmusicapi.cache` and :py:mod:`ytmusicapi.library_index`"""
+
+import sqlite3
+
+
+class Transaction:
+    """Runs the statements of a with-block in a single sqlite transaction, and rolls them back on errors
+
+    :param connection: Connection opened with ``isolation_level=None``, so that sqlite3 does not begin
+        transactions implicitly
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.cursor = connection.cursor()
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self.cursor.execute("BEGIN IMMEDIATE")
+        return self.cursor
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        self.cursor.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        self.cursor.close()
@@ -0,0 +1,351 @@
+"""asyncio interface to YouTube Music
+
+:class:`AsyncYTMusic` exposes the same methods as :class:`~ytmusicapi.YTMusic`, but as coroutines,
+and the ``iter_*`` generators as asynchronous generators.
+The mixins and parsers are shared with the synchronous client: each call runs the regular
+implementation inside a greenlet, which is suspended whenever a request is sent and resumed by the
+event loop once the response has arrived. No threads are involved, so a single event loop can drive
+hundreds of concurrent calls.
+
+Requires the optional dependencies ``httpx`` and ``greenlet``::
+
+    pip install ytmusicapi[async]
+
+Usage::
+
+    from ytmusicapi.async_ytmusic import AsyncYTMusic
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Mapping
+from concurrent.futures import Executor, Future
+from dataclasses import replace
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ytmusicapi.auth.oauth import OAuthCredentials
+from ytmusicapi.decoder import JsonDecoder
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.instrumentation import MetricsCallback, mixin_methods
+from ytmusicapi.retry import RetryPolicy
+from ytmusicapi.singleflight import SingleFlight
+from ytmusicapi.transport import AsyncTransport, UploadData
+from ytmusicapi.type_alias import JsonDict
+from ytmusicapi.ytmusic import YTMusic, YTMusicBase
+
+try:
+    import httpx
+    from greenlet import getcurrent, greenlet
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "AsyncYTMusic requires httpx and greenlet. Install them with `pip install ytmusicapi[async]`"
+    ) from e
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+#: methods of :class:`YTMusic` that are not mirrored, because they are not network calls
+EXCLUDED_METHODS = {"as_mobile"}
+
+_EXHAUSTED = object()
+
+
+class _AsyncGreenlet(greenlet):  # type: ignore[misc]
+    """greenlet running a synchronous call, which switches to ``driver`` to await responses"""
+
+    def __init__(self, fn: Callable[..., Any], driver: greenlet):
+        super().__init__(fn, driver)
+        self.driver = driver
+
+
+def await_only(awaitable: Awaitable[T]) -> T:
+    """Awaits ``awaitable`` from synchronous code that was started by :func:`greenlet_spawn`."""
+    current = getcurrent()
+    if not isinstance(current, _AsyncGreenlet):
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()  # never awaited, which would be warned about
+        raise YTMusicUserError("AsyncYTMusic internals can only be used from within an awaited method call")
+    result: T = current.driver.switch(awaitable)
+    return result
+
+
+async def greenlet_spawn(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs the synchronous ``fn`` and awaits every awaitable it passes to :func:`await_only`."""
+    context = _AsyncGreenlet(fn, getcurrent())
+    result = context.switch(*args, **kwargs)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:  # noqa: BLE001 - re-raised inside the greenlet
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+    return result  # type: ignore[no-any-return]
+
+
+def greenlet_sleep(seconds: float) -> None:
+    """Sleeps without blocking the event loop, from code started by :func:`greenlet_spawn`"""
+    await_only(asyncio.sleep(seconds))
+
+
+def greenlet_wait(future: Future[T]) -> T:
+    """Waits for a future without blocking the event loop, from code started by :func:`greenlet_spawn`"""
+    return await_only(asyncio.wrap_future(future))
+
+
+def async_retry_policy(policy: RetryPolicy) -> RetryPolicy:
+    """Adapts a retry policy to httpx exceptions and to sleeping in the event loop"""
+    return replace(
+        policy,
+        exceptions=(*policy.exceptions, httpx.TransportError),
+        sleep=greenlet_sleep if policy.sleep is time.sleep else policy.sleep,
+    )
+
+
+def to_requests_response(response: httpx.Response) -> Response:
+    """Converts an httpx response, so that mixins can keep working with :class:`requests.Response`"""
+    converted = Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted._content = response.content
+    return converted
+
+
+def proxy_mounts(proxies: dict[str, str] | None) -> dict[str, httpx.AsyncBaseTransport] | None:
+    """Converts a proxy configuration in requests format to httpx transport mounts"""
+    if not proxies:
+        return None
+    return {
+        (pattern if "://" in pattern else pattern + "://"): httpx.AsyncHTTPTransport(proxy=proxy)
+        for pattern, proxy in proxies.items()
+    }
+
+
+async def iter_file(file: BinaryIO, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    """Streams a file in chunks, as httpx only accepts asynchronous iterables for async requests"""
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+class HttpxTransport:
+    """Default :class:`~ytmusicapi.transport.AsyncTransport`, sending requests with an :class:`httpx.AsyncClient`.
+    Proxies and cookies are configured on the client, so the per-request values are not used."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return to_requests_response(await self.client.post(url, json=body, headers=dict(headers)))
+
+    async def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return to_requests_response(await self.client.get(url, params=params, headers=dict(headers)))
+
+    async def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        content = data if isinstance(data, bytes) else iter_file(data)
+        return to_requests_response(await self.client.post(url, content=content, headers=dict(headers)))
+
+
+class GreenletTransport:
+    """:class:`~ytmusicapi.transport.Transport` awaiting an asynchronous transport with :func:`await_only`"""
+
+    def __init__(self, transport: AsyncTransport):
+        self.transport = transport
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return await_only(self.transport.post(url, body, headers, cookies, proxies))
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return await_only(self.transport.get(url, params, headers, cookies, proxies))
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        return await_only(self.transport.upload(url, data, headers, proxies))
+
+
+class GreenletFuture(Future[T]):
+    """Future of a call running as an asyncio task, which can be waited for with :func:`await_only`"""
+
+    def __init__(self, task: asyncio.Task[T]):
+        super().__init__()
+        self.task = task
+
+    def result(self, timeout: float | None = None) -> T:
+        return await_only(self.task)
+
+    def cancel(self) -> bool:
+        return self.task.cancel()
+
+
+class GreenletExecutor(Executor):
+    """Executor running each call in its own greenlet on the event loop, for concurrent requests within a call"""
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return GreenletFuture(asyncio.ensure_future(greenlet_spawn(fn, *args, **kwargs)))
+
+
+class AsyncYTMusic:
+    """
+    Asynchronous variant of :class:`~ytmusicapi.YTMusic`.
+    Every public method of :class:`~ytmusicapi.YTMusic` is available with the same signature,
+    but returns a coroutine::
+
+        async with AsyncYTMusic() as ytmusic:
+            results = await asyncio.gather(*(ytmusic.search(query) for query in queries))
+
+    Exceptions are the same as for the synchronous client.
+    """
+
+    def __init__(
+        self,
+        auth: str | JsonDict | None = None,
+        user: str | None = None,
+        proxies: dict[str, str] | None = None,
+        language: str = "en",
+        location: str = "",
+        oauth_credentials: OAuthCredentials | None = None,
+        client: httpx.AsyncClient | None = None,
+        transport: AsyncTransport | None = None,
+        metrics: MetricsCallback | None = None,
+        json_decoder: JsonDecoder | None = None,
+        retry: RetryPolicy | None = None,
+        coalesce: bool = True,
+    ):
+        """
+        Create a new instance to interact with YouTube Music asynchronously.
+
+        :param auth: See :py:meth:`YTMusic.__init__`
+        :param user: See :py:meth:`YTMusic.__init__`
+        :param proxies: Optional. Proxy configuration in requests format, i.e. ``{"https": "http://proxy:8080"}``.
+            Ignored if ``client`` is provided.
+        :param language: See :py:meth:`YTMusic.__init__`
+        :param location: See :py:meth:`YTMusic.__init__`
+        :param oauth_credentials: See :py:meth:`YTMusic.__init__`
+        :param client: An :class:`httpx.AsyncClient` or None to create one.
+            Default clients have a request timeout of 30s.
+            A client passed in is not closed by :py:meth:`close`.
+        :param transport: Optional. Asynchronous network backend used to send all requests,
+            see :py:class:`ytmusicapi.transport.AsyncTransport`. Default: a :py:class:`HttpxTransport` using ``client``.
+        :param metrics: See :py:meth:`YTMusic.__init__`
+        :param json_decoder: See :py:meth:`YTMusic.__init__`
+        :param retry: See :py:meth:`YTMusic.__init__`. Also retries :class:`httpx.TransportError`,
+            and waits between attempts without blocking the event loop.
+        :param coalesce: See :py:meth:`YTMusic.__init__`. Applies to identical requests of concurrent tasks.
+        """
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=30, mounts=proxy_mounts(proxies))
+        self._ytmusic = YTMusic(
+            auth=auth,
+            user=user,
+            language=language,
+            location=location,
+            oauth_credentials=oauth_credentials,
+            transport=GreenletTransport(transport or HttpxTransport(self._client)),
+            executor=GreenletExecutor(),
+            metrics=metrics,
+            json_decoder=json_decoder,
+            retry=async_retry_policy(retry) if retry is not None else None,
+            # requests waiting for an identical one must not block the event loop
+            coalesce=SingleFlight(greenlet_wait) if coalesce else False,
+        )
+        self._client.cookies.update(self._ytmusic.cookies)
+
+    @property
+    def ytmusic(self) -> YTMusicBase:
+        """The underlying synchronous client, i.e. for reading ``language`` or ``auth_type``"""
+        return self._ytmusic
+
+    async def close(self) -> None:
+        """Closes the underlying httpx client, if it was created by this instance"""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Callable[..., Any]: ...
+
+
+def _mirror(name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+    method = getattr(YTMusic, name)
+
+    @functools.wraps(method)
+    async def mirrored(self: AsyncYTMusic, *args: Any, **kwargs: Any) -> Any:
+        return await greenlet_spawn(getattr(self._ytmusic, name), *args, **kwargs)
+
+    return mirrored
+
+
+def _mirror_generator(name: str) -> Callable[..., AsyncIterator[Any]]:
+    method = getattr(YTMusic, name)
+
+    @functools.wraps(method)
+    async def mirrored(self: AsyncYTMusic, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        iterator = await greenlet_spawn(getattr(self._ytmusic, name), *args, **kwargs)
+        try:
+            while (item := await greenlet_spawn(next, iterator, _EXHAUSTED)) is not _EXHAUSTED:
+                yield item
+        finally:
+            await greenlet_spawn(iterator.close)
+
+    return mirrored
+
+
+for _name, _ in mixin_methods(YTMusic):
+    if _name not in EXCLUDED_METHODS:
+        mirror = _mirror_generator if _name.startswith("iter_") else _mirror
+        setattr(AsyncYTMusic, _name, mirror(_name))
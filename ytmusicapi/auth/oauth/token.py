@@ -1,8 +1,9 @@
 import json
+import threading
 import time
 import webbrowser
 from collections.abc import KeysView
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -90,12 +91,20 @@ class RefreshingToken(OAuthToken):
     #: protected/property attribute enables auto writing token values to new file location via setter
     _local_cache: Path | None = None
 
+    #: serializes refreshes of a token shared by several threads
+    _refresh_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
     def __getattribute__(self, item: str) -> Any:
         """access token setter to auto-refresh if it is expiring"""
         if item == "access_token" and self.is_expiring:
-            fresh = self.credentials.refresh_token(self.refresh_token)
-            self.update(fresh)
-            self.store_token()
+            with self._refresh_lock:
+                # threads waiting for the lock use the token refreshed by the first one
+                if self.is_expiring:
+                    fresh = self.credentials.refresh_token(self.refresh_token)
+                    self.update(fresh)
+                    self.store_token()
 
         return super().__getattribute__(item)
 
@@ -0,0 +1,169 @@
+"""bulk edits of playlists in chunks
+
+``browse/edit_playlist`` takes a list of actions, but large lists time out or are rejected as a whole.
+The bulk methods of :class:`~ytmusicapi.YTMusic`, like
+:py:meth:`~ytmusicapi.YTMusic.add_playlist_items_bulk`, split the actions into chunks of ``chunk_size``
+and return a :class:`BulkEditResult`, which lists the chunks that failed, so that their items can be
+passed to the same method again::
+
+    result = ytmusic.add_playlist_items_bulk(playlistId, videoIds)
+    while result.failed:
+        result = ytmusic.add_playlist_items_bulk(playlistId, result.failed_items)
+
+Chunks whose order matters, i.e. added items or moves, are sent one after another, and the remaining
+chunks are not sent after a failure, so that retrying them keeps the order. Removals are sent concurrently
+with the ``executor`` of the client, if it has one.
+"""
+
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from ytmusicapi.continuations import submit
+from ytmusicapi.enums import ResponseStatus
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.helpers import longest_increasing_subsequence
+from ytmusicapi.type_alias import JsonDict, JsonList
+
+#: actions per request of the bulk methods
+DEFAULT_CHUNK_SIZE = 100
+
+#: requests of a bulk method in flight at once, if the client has an executor
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+@dataclass
+class EditChunk:
+    """A request of a bulk edit"""
+
+    #: position of the chunk among the chunks of the edit
+    index: int
+    #: the items passed to the bulk method which are edited by this chunk
+    items: list[Any]
+    actions: JsonList = field(repr=False)
+    #: response of the request, None if it was not sent or failed
+    response: JsonDict | None = field(default=None, repr=False)
+    #: exception raised while sending the request
+    error: Exception | None = None
+
+    @property
+    def sent(self) -> bool:
+        """whether the request was sent"""
+        return self.response is not None or self.error is not None
+
+    @property
+    def status(self) -> str | None:
+        """``status`` of the response, i.e. ``STATUS_SUCCEEDED``"""
+        return self.response.get("status") if self.response is not None else None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == ResponseStatus.SUCCEEDED
+
+
+@dataclass
+class BulkEditResult:
+    """Outcome of a bulk edit, by chunk"""
+
+    chunks: list[EditChunk]
+
+    @property
+    def failed(self) -> list[EditChunk]:
+        """chunks which failed or were not sent"""
+        return [chunk for chunk in self.chunks if not chunk.succeeded]
+
+    @property
+    def failed_items(self) -> list[Any]:
+        """items of the failed chunks, in order, to pass to the bulk method again"""
+        return [item for chunk in self.failed for item in chunk.items]
+
+    @property
+    def status(self) -> str:
+        """``STATUS_SUCCEEDED`` if all chunks succeeded, else the status of the first failed chunk"""
+        for chunk in self.failed:
+            return chunk.status or "STATUS_FAILED"
+        return ResponseStatus.SUCCEEDED.value
+
+    @property
+    def playlistEditResults(self) -> JsonList:
+        """``playlistEditVideoAddedResultData`` of the items added by successful chunks, in order,
+        which maps each videoId to its new setVideoId. See :py:meth:`~ytmusicapi.YTMusic.add_playlist_items`"""
+        return [
+            result["playlistEditVideoAddedResultData"]
+            for chunk in self.chunks
+            if chunk.succeeded and chunk.response is not None
+            for result in chunk.response.get("playlistEditResults", [])
+            if "playlistEditVideoAddedResultData" in result
+        ]
+
+
+def make_chunks(items: Sequence[Any], actions: JsonList, chunk_size: int) -> list[EditChunk]:
+    """Splits items and their actions, one per item, into chunks of ``chunk_size``"""
+    if chunk_size < 1:
+        raise YTMusicUserError("chunk_size must be at least 1")
+    return [
+        EditChunk(index, list(items[start : start + chunk_size]), actions[start : start + chunk_size])
+        for index, start in enumerate(range(0, len(items), chunk_size))
+    ]
+
+
+def send_chunks(
+    send: Callable[[JsonList], JsonDict],
+    chunks: list[EditChunk],
+    ordered: bool,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> BulkEditResult:
+    """
+    Sends the actions of each chunk and records its response or exception
+
+    :param send: Sends a list of actions to ``browse/edit_playlist``
+    :param ordered: Send the chunks one after another and stop at the first failure
+    :param executor: Sends up to ``max_in_flight`` chunks concurrently, unless ``ordered``
+    """
+    if max_in_flight < 1:
+        raise YTMusicUserError("max_in_flight must be at least 1")
+
+    def send_chunk(chunk: EditChunk) -> None:
+        try:
+            chunk.response = send(chunk.actions)
+        except Exception as e:  # noqa: BLE001 - reported by the chunk
+            chunk.error = e
+
+    in_flight: deque[Future[None]] = deque()
+    for chunk in chunks:
+        if ordered or executor is None:
+            send_chunk(chunk)
+            if ordered and not chunk.succeeded:
+                break
+            continue
+        if len(in_flight) >= max_in_flight:
+            in_flight.popleft().result()
+        in_flight.append(submit(executor, send_chunk, chunk))
+    for future in in_flight:
+        future.result()
+    return BulkEditResult(chunks)
+
+
+def plan_moves(current: Sequence[str], desired: Sequence[str]) -> list[tuple[str, str | None]]:
+    """
+    Returns the fewest moves which reorder the items of a playlist from ``current`` to ``desired``,
+    as arguments of :py:meth:`~ytmusicapi.YTMusic.move_playlist_items`
+
+    The items of a longest increasing subsequence of the current positions in the desired order stay,
+    the others are moved before their desired successor, starting from the end.
+
+    :param current: setVideoIds in their current order
+    :param desired: the same setVideoIds in the desired order
+    """
+    positions = {setVideoId: position for position, setVideoId in enumerate(current)}
+    if len(positions) != len(current) or len(desired) != len(current) or positions.keys() != set(desired):
+        raise YTMusicUserError("The desired order must contain each setVideoId of the playlist once")
+    stay = set(longest_increasing_subsequence([positions[setVideoId] for setVideoId in desired]))
+    moves: list[tuple[str, str | None]] = []
+    for index in reversed(range(len(desired))):
+        if index not in stay:
+            moves.append((desired[index], desired[index + 1] if index + 1 < len(desired) else None))
+    return moves
@@ -0,0 +1,338 @@
+"""opt-in cache for responses of read-only endpoints
+
+Pass a :class:`ResponseCache` to :class:`~ytmusicapi.YTMusic` to answer repeated requests, i.e. for
+:py:meth:`~ytmusicapi.YTMusic.get_album` or :py:meth:`~ytmusicapi.YTMusic.get_artist`,
+without sending them again::
+
+    ytmusic = YTMusic(cache=ResponseCache(MemoryCache(maxsize=1000)))
+    ytmusic = YTMusic(cache=ResponseCache(SQLiteCache("ytmusic.sqlite"), ttl={"browse": 3600}))
+
+Only endpoints with a TTL are cached. Requests to write endpoints are never cached and invalidate
+the cached responses of the entities they modify, as well as the user's library and feeds.
+Continuations requested by their token alone are not cached either, since the token does not show
+which entity they belong to, so that writes could not invalidate them.
+
+The visitor id, which is otherwise scraped from the YouTube Music homepage by the first request of each
+instance, is cached as well. With a :class:`SQLiteCache`, new processes start without any extra request.
+So are the URL of the ``base.js`` player script and its ``signatureTimestamp``, which
+:py:meth:`~ytmusicapi.YTMusic.get_song` resolves automatically with ``resolve_signature_timestamp=True``.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Protocol
+
+from ytmusicapi._sqlite import Transaction
+from ytmusicapi.type_alias import JsonDict
+
+#: default time to live in seconds per endpoint. Endpoints not listed are not cached
+DEFAULT_TTL = {"browse": 600, "next": 600, "player": 300}
+
+#: endpoints modifying data. Any request to these invalidates related cache entries
+WRITE_ENDPOINTS = (
+    "browse/edit_playlist",
+    "feedback",
+    "like/",
+    "music/delete_privately_owned_entity",
+    "playlist/",
+    "subscription/",
+)
+
+#: default time to live of the visitor id in seconds
+DEFAULT_VISITOR_ID_TTL = 86400.0
+
+#: cache key of the visitor id
+VISITOR_ID_KEY = "@visitor_id"
+
+#: default time to live of the URL of the base.js player script in seconds, which changes with new player versions
+DEFAULT_BASEJS_URL_TTL = 3600.0
+
+#: time to live of the signatureTimestamp of a base.js URL in seconds. The script at a URL never changes
+SIGNATURE_TIMESTAMP_TTL = 30 * 86400.0
+
+#: cache key of the base.js URL
+BASEJS_URL_KEY = "@basejs_url"
+
+#: prefix of the cache keys of signatureTimestamps, followed by the base.js URL
+SIGNATURE_TIMESTAMP_KEY = "@signature_timestamp:"
+
+#: tag of all entries for personal pages (library, history, liked songs, ...), invalidated on every write
+LIBRARY_TAG = "@library"
+
+#: browseId prefixes of personal pages
+LIBRARY_BROWSE_IDS = ("FE", "VLLM", "VLSE")
+
+#: prefixes stripped from browseIds to find the playlist they refer to
+BROWSE_ID_PREFIXES = ("VL", "MPSP")
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses. Implementations must be safe to use from multiple threads."""
+
+    def get(self, key: str) -> str | None:
+        """Returns the stored value, or None if it is absent or expired"""
+
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str]) -> None:
+        """Stores value for ttl seconds, evicting the least recently used entries if necessary"""
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Removes all entries stored with one of the tags"""
+
+    def clear(self) -> None:
+        """Removes all entries"""
+
+
+class MemoryCache:
+    """In-memory LRU cache
+
+    :param maxsize: Maximum number of responses to keep. Default: 256
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, str, frozenset[str]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._remove(key)
+            frozen_tags = frozenset(tags)
+            self._entries[key] = (time.time() + ttl, value, frozen_tags)
+            for tag in frozen_tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+class SQLiteCache:
+    """On-disk LRU cache in an sqlite database, which can be shared between processes
+
+    :param path: Path of the database file. Created if it does not exist
+    :param maxsize: Maximum number of responses to keep. Default: 10000
+    """
+
+    def __init__(self, path: str | Path, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+            CREATE TABLE IF NOT EXISTS tags (tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key));
+            CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+            """
+        )
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires >= ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return str(row[0])
+
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str]) -> None:
+        now = time.time()
+        with self._lock, self._transaction() as cursor:
+            self._delete(cursor, "key = ?", (key,))
+            cursor.execute("INSERT INTO entries VALUES (?, ?, ?, ?)", (key, value, now + ttl, now))
+            cursor.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)", [(tag, key) for tag in tags])
+            self._delete(cursor, "expires < ?", (now,))
+            self._delete(
+                cursor,
+                "key IN (SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        placeholders = ", ".join("?" * len(tags))
+        with self._lock, self._transaction() as cursor:
+            self._delete(cursor, f"key IN (SELECT key FROM tags WHERE tag IN ({placeholders}))", tags)
+
+    def clear(self) -> None:
+        with self._lock, self._transaction() as cursor:
+            cursor.execute("DELETE FROM entries")
+            cursor.execute("DELETE FROM tags")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _transaction(self) -> Transaction:
+        return Transaction(self._connection)
+
+    @staticmethod
+    def _delete(cursor: sqlite3.Cursor, condition: str, params: Iterable[Any]) -> None:
+        keys = [row[0] for row in cursor.execute(f"SELECT key FROM entries WHERE {condition}", tuple(params))]
+        cursor.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        cursor.executemany("DELETE FROM tags WHERE key = ?", [(key,) for key in keys])
+
+
+class ResponseCache:
+    """Caching policy for :class:`~ytmusicapi.YTMusic` responses
+
+    :param backend: Storage for the responses. Default: a :class:`MemoryCache`
+    :param ttl: Time to live in seconds per endpoint, i.e. ``{"browse": 3600}``.
+        Only endpoints listed here are cached. Default: :data:`DEFAULT_TTL`
+    :param visitor_id_ttl: Time to live of the visitor id in seconds, 0 to not cache it.
+        Default: :data:`DEFAULT_VISITOR_ID_TTL`
+    :param basejs_url_ttl: Time to live of the URL of the base.js player script in seconds, 0 to not cache it.
+        The ``signatureTimestamp`` of each URL is cached for :data:`SIGNATURE_TIMESTAMP_TTL`.
+        Default: :data:`DEFAULT_BASEJS_URL_TTL`
+    :param resolve_signature_timestamp: Whether :py:meth:`~ytmusicapi.YTMusic.get_song` calls without a
+        ``signatureTimestamp`` use the cached one of the current player, instead of a default value
+        which might result in invalid streaming URLs. Default: False
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl: dict[str, float] | None = None,
+        visitor_id_ttl: float = DEFAULT_VISITOR_ID_TTL,
+        basejs_url_ttl: float = DEFAULT_BASEJS_URL_TTL,
+        resolve_signature_timestamp: bool = False,
+    ):
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.ttl = DEFAULT_TTL.copy() if ttl is None else ttl
+        self.visitor_id_ttl = visitor_id_ttl
+        self.basejs_url_ttl = basejs_url_ttl
+        self.resolve_signature_timestamp = resolve_signature_timestamp
+
+    def key(self, endpoint: str, body: JsonDict, additionalParams: str, namespace: str) -> str | None:
+        """Returns the cache key of a request, or None if its response must not be cached
+
+        :param namespace: identifies the client state the response depends on,
+            i.e. language, location and the authenticated user
+        """
+        if not self.ttl.get(endpoint) or "formData" in body or "continuation" in body:
+            return None
+        request = {k: v for k, v in body.items() if k != "context"}
+        serialized = json.dumps([endpoint, request, additionalParams, namespace], sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> JsonDict | None:
+        """Returns a cached response. Each call returns a new object, which may be modified"""
+        value = self.backend.get(key)
+        return None if value is None else json.loads(value)
+
+    def set(self, key: str, endpoint: str, body: JsonDict, response: JsonDict) -> None:
+        """Stores the response of a request that had a cache key"""
+        self.backend.set(key, json.dumps(response), self.ttl[endpoint], request_tags(body))
+
+    def get_visitor_id(self) -> str | None:
+        """Returns the cached visitor id, or None if it is absent, expired or not cached"""
+        return self.backend.get(VISITOR_ID_KEY) if self.visitor_id_ttl else None
+
+    def set_visitor_id(self, visitor_id: str) -> None:
+        """Stores a visitor id, i.e. one fetched by another instance or provided by a deployment"""
+        if self.visitor_id_ttl and visitor_id:
+            self.backend.set(VISITOR_ID_KEY, visitor_id, self.visitor_id_ttl, ())
+
+    def get_basejs_url(self) -> str | None:
+        """Returns the cached URL of the base.js player script, or None"""
+        return self.backend.get(BASEJS_URL_KEY) if self.basejs_url_ttl else None
+
+    def set_basejs_url(self, url: str) -> None:
+        if self.basejs_url_ttl:
+            self.backend.set(BASEJS_URL_KEY, url, self.basejs_url_ttl, ())
+
+    def get_signature_timestamp(self, url: str) -> int | None:
+        """Returns the cached signatureTimestamp of a base.js URL, or None"""
+        value = self.backend.get(SIGNATURE_TIMESTAMP_KEY + url)
+        return None if value is None else int(value)
+
+    def set_signature_timestamp(self, url: str, signature_timestamp: int) -> None:
+        self.backend.set(SIGNATURE_TIMESTAMP_KEY + url, str(signature_timestamp), SIGNATURE_TIMESTAMP_TTL, ())
+
+    def invalidate(self, endpoint: str, body: JsonDict) -> None:
+        """Invalidates entries related to a request, if it is sent to a write endpoint"""
+        if is_write(endpoint, body):
+            self.backend.invalidate({LIBRARY_TAG, *write_tags(body)})
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        self.backend.clear()
+
+
+def is_write(endpoint: str, body: JsonDict) -> bool:
+    """Returns whether a request modifies data"""
+    return endpoint.startswith(WRITE_ENDPOINTS) or "formData" in body
+
+
+def request_tags(body: JsonDict) -> set[str]:
+    """Returns the ids of the entities a read request refers to"""
+    tags = set()
+    for field in ("browseId", "videoId", "playlistId"):
+        if value := body.get(field):
+            tags.add(value)
+            for prefix in BROWSE_ID_PREFIXES:
+                tags.add(value.removeprefix(prefix))
+    if body.get("browseId", "").startswith(LIBRARY_BROWSE_IDS):
+        tags.add(LIBRARY_TAG)
+    return tags
+
+
+def write_tags(body: Any) -> Iterator[str]:
+    """Yields all strings of a write request body, which contain the ids of the modified entities"""
+    if isinstance(body, str):
+        yield body
+    elif isinstance(body, dict):
+        for field, value in body.items():
+            if field != "context":
+                yield from write_tags(value)
+    elif isinstance(body, list):
+        for value in body:
+            yield from write_tags(value)
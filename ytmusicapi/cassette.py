@@ -0,0 +1,211 @@
+"""record and replay requests to YouTube Music
+
+A :class:`RecordingTransport` captures every request sent by :class:`~ytmusicapi.YTMusic` together with
+its response and saves them to a gzip-compressed cassette file. A :class:`ReplayTransport` serves the
+recorded responses back without network access, optionally delaying each one to simulate latency::
+
+    with RecordingTransport("session.json.gz") as transport:
+        YTMusic(transport=transport).get_playlist("PL...", limit=None)
+
+    ytmusic = YTMusic(transport=ReplayTransport("session.json.gz", latency=0.05))
+    ytmusic.get_playlist("PL...", limit=None)  # same result, same requests
+
+Requests are matched on their method, URL and body without the client ``context``. Of the response
+headers, only the content type and the ``X-Goog-Upload-*`` headers read by
+:py:meth:`~ytmusicapi.YTMusic.upload_song` are recorded, and neither the request headers nor cookies,
+so cassettes recorded with authentication contain no credentials, but they do contain the personal
+data returned by the requests.
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+import requests
+from requests import Response
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.transport import RequestsTransport, Transport, UploadData
+from ytmusicapi.type_alias import JsonDict
+
+CASSETTE_VERSION = 1
+
+#: prefix of the response headers recorded besides the content type, i.e. ``X-Goog-Upload-URL``
+RECORDED_HEADERS_PREFIX = "x-goog-upload-"
+
+
+def request_key(method: str, url: str, request: Any) -> str:
+    """Identifies a request by method, URL and its body or query parameters without the ``context``"""
+    if isinstance(request, dict):
+        request = {k: v for k, v in request.items() if k != "context"}
+    return json.dumps([method, url, request], sort_keys=True)
+
+
+def load_cassette(path: str | Path) -> list[JsonDict]:
+    """Returns the exchanges recorded in a cassette file"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        cassette: JsonDict = json.load(f)
+    if cassette.get("version") != CASSETTE_VERSION:
+        raise YTMusicUserError(f"Unsupported cassette version {cassette.get('version')} in {path}")
+    exchanges: list[JsonDict] = cassette["exchanges"]
+    return exchanges
+
+
+def save_cassette(path: str | Path, exchanges: list[JsonDict]) -> None:
+    """Writes exchanges to a cassette file, replacing it if it exists"""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"version": CASSETTE_VERSION, "exchanges": exchanges}, f)
+
+
+class RecordingTransport:
+    """Sends requests through another transport and records them with their responses
+
+    The cassette is written by :meth:`save`, or when leaving a ``with`` block.
+
+    :param path: Path of the cassette file
+    :param transport: Transport sending the requests. Default: a new
+        :class:`~ytmusicapi.transport.RequestsTransport`
+    """
+
+    def __init__(self, path: str | Path, transport: Transport | None = None):
+        self.path = path
+        self.transport: Transport = transport or RequestsTransport(requests.Session())
+        self.exchanges: list[JsonDict] = []
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self._record("POST", url, body, self.transport.post(url, body, headers, cookies, proxies))
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self._record("GET", url, params, self.transport.get(url, params, headers, cookies, proxies))
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        return self._record("UPLOAD", url, None, self.transport.upload(url, data, headers, proxies))
+
+    def save(self) -> None:
+        """Writes all exchanges recorded so far to the cassette file"""
+        with self._lock:
+            save_cassette(self.path, self.exchanges)
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.save()
+
+    def _record(self, method: str, url: str, request: Any, response: Response) -> Response:
+        exchange = {
+            "method": method,
+            "url": url,
+            "request": json.loads(request_key(method, url, request))[2],  # a copy without the context
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "content_type": response.headers.get("Content-Type"),
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower().startswith(RECORDED_HEADERS_PREFIX)
+            },
+            "text": response.text,
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+        return response
+
+
+class ReplayTransport:
+    """Serves the responses recorded in a cassette file instead of sending requests
+
+    Identical requests are answered with their recorded responses in order. Once they are exhausted,
+    the last response is repeated, so a cassette can be replayed any number of times, i.e. for load tests.
+
+    :param path: Path of the cassette file
+    :param latency: Seconds to wait before returning each response. Default: 0
+    :raises YTMusicUserError: from the request methods, if a request was not recorded
+    """
+
+    def __init__(self, path: str | Path, latency: float = 0.0):
+        self.latency = latency
+        self._responses: dict[str, list[JsonDict]] = {}
+        for exchange in load_cassette(path):
+            key = request_key(exchange["method"], exchange["url"], exchange["request"])
+            self._responses.setdefault(key, []).append(exchange)
+        self._served: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self._replay("POST", url, body)
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self._replay("GET", url, params)
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        return self._replay("UPLOAD", url, None)
+
+    def _replay(self, method: str, url: str, request: Any) -> Response:
+        key = request_key(method, url, request)
+        with self._lock:
+            recorded = self._responses.get(key)
+            if not recorded:
+                raise YTMusicUserError(f"No response recorded for {method} {url} with {key}")
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        exchange = recorded[min(index, len(recorded) - 1)]
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        response = Response()
+        response.url = url
+        response.status_code = exchange["status_code"]
+        response.reason = exchange["reason"]
+        if exchange["content_type"]:
+            response.headers["Content-Type"] = exchange["content_type"]
+        response.headers.update(exchange.get("headers", {}))
+        response.encoding = "utf-8"
+        response._content = exchange["text"].encode("utf-8")
+        return response
@@ -1,5 +1,7 @@
-from collections.abc import Callable
-from typing import Any, cast
+import contextvars
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, TypeVar, cast
 
 from ytmusicapi.navigation import nav
 from ytmusicapi.type_alias import (
@@ -20,6 +22,31 @@ COMMAND_EXECUTOR_COMMANDS = [
 ]
 CONTINUATION_ITEMS = ["onResponseReceivedActions", 0, "appendContinuationItemsAction", "continuationItems"]
 
+T = TypeVar("T")
+
+
+class CursorList(list[JsonDict]):
+    """
+    Items of a paginated listing. ``cursor`` is the position after the last item, which can be passed back
+    to the method that returned the list to continue the listing, or None if there are no more items.
+    It is a plain string and can be stored to resume the listing later, i.e. in another process.
+    """
+
+    def __init__(self, items: Iterable[JsonDict] = (), cursor: str | None = None):
+        super().__init__(items)
+        self.cursor = cursor
+
+
+def submit(executor: Executor | None, fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Runs fn in the executor, or right away if there is none.
+    The executor runs fn in a copy of the current context, which attributes its requests to the call
+    measured by :mod:`ytmusicapi.instrumentation`"""
+    if executor is not None:
+        return executor.submit(contextvars.copy_context().run, fn, *args)
+    future: Future[T] = Future()
+    future.set_result(fn(*args))
+    return future
+
 
 def get_continuation_token(results: JsonList) -> str | None:
     last_result = results[-1]
@@ -42,24 +69,68 @@ def get_continuations_2025(
     limit: int | None,
     request_func: RequestFuncBodyType,
     parse_func: ParseFuncType,
+    executor: Executor | None = None,
 ) -> JsonList:
+    """
+    :param executor: Optional executor to fetch the next page while the current page is parsed
+    """
     items: JsonList = []
-    continuation_token = get_continuation_token(results["contents"])
-    while continuation_token and (limit is None or len(items) < limit):
-        response = request_func({"continuation": continuation_token})
-        continuation_items = nav(response, CONTINUATION_ITEMS, True)
-        if not continuation_items:
-            break
-
-        contents = parse_func(continuation_items)
-        if len(contents) == 0:
-            break
+    for contents, _ in iter_continuations_2025(results, request_func, parse_func, limit, executor):
         items.extend(contents)
-        continuation_token = get_continuation_token(continuation_items)
-
     return items
 
 
+def iter_continuations_2025(
+    results: JsonDict,
+    request_func: RequestFuncBodyType,
+    parse_func: ParseFuncType,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    cursor: str | None = None,
+) -> Iterator[tuple[JsonList, str | None]]:
+    """
+    Yields the parsed items of each continuation page, along with the cursor of the following page.
+    A page is only requested once the previous one has been consumed, or prefetched while it is being
+    parsed and consumed if an executor is given.
+
+    :param limit: stop after at least this many items. None to continue until there are no more pages
+    :param executor: Optional executor to fetch the next page while the current page is parsed
+    :param cursor: continuation token of the first page to request, to resume an earlier listing.
+        Default: the continuation token at the end of ``results``
+    """
+    count = 0
+    request_page = lambda token: request_func({"continuation": token})
+    continuation_token = cursor if cursor is not None else get_continuation_token(results["contents"])
+    pending = (
+        submit(None, request_page, continuation_token)
+        if continuation_token and (limit is None or limit > 0)
+        else None
+    )
+    try:
+        while pending is not None:
+            response = pending.result()
+            pending = None
+            continuation_items = nav(response, CONTINUATION_ITEMS, True)
+            if not continuation_items:
+                break
+
+            continuation_token = get_continuation_token(continuation_items)
+            # prefetch, unless the limit is likely reached by the current page
+            if executor and continuation_token and (limit is None or count + len(continuation_items) < limit):
+                pending = submit(executor, request_page, continuation_token)
+
+            contents = parse_func(continuation_items)
+            if len(contents) == 0:
+                break
+            count += len(contents)
+            yield contents, continuation_token
+            if pending is None and continuation_token and (limit is None or count < limit):
+                pending = submit(None, request_page, continuation_token)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 def get_reloadable_continuations(
     results: JsonDict,
     continuation_type: str,
@@ -82,6 +153,7 @@ def get_continuations(
     parse_func: ParseFuncType,
     ctoken_path: str = "",
     additionalParams: str | None = None,
+    executor: Executor | None = None,
 ) -> JsonList:
     """
 
@@ -95,24 +167,83 @@ def get_continuations(
     :param ctoken_path: rarely used specifier applied to retrieve the ctoken ("next<ctoken_path>ContinuationData").
             Default empty string
     :param additionalParams: Optional additional params to pass to the request func. Default: use get_continuation_params
+    :param executor: Optional executor to fetch the next page while the current page is parsed.
+            Not used with fixed additionalParams, as every request returns a different page
     :return: list of parsed continuation results
     """
     items: JsonList = []
-    while "continuations" in results and (limit is None or len(items) < limit):
-        additional_params = additionalParams or get_continuation_params(results, ctoken_path)
-        response = request_func(additional_params)
-        if "continuationContents" in response:
-            results = response["continuationContents"][continuation_type]
-        else:
-            break
-        contents = get_continuation_contents(results, parse_func)
-        if len(contents) == 0:
-            break
+    for contents, _ in iter_continuations(
+        results,
+        continuation_type,
+        request_func,
+        parse_func,
+        ctoken_path,
+        additionalParams,
+        limit,
+        executor,
+    ):
         items.extend(contents)
-
     return items
 
 
+def iter_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    request_func: RequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    cursor: str | None = None,
+) -> Iterator[tuple[JsonList, str | None]]:
+    """
+    Yields the parsed items of each continuation page, along with the cursor of the following page.
+    Takes the same parameters as :py:func:`get_continuations`, but only requests a page once the previous
+    one has been consumed, or prefetches it while the previous one is being parsed and consumed if an
+    executor is given.
+
+    :param limit: stop after at least this many items. None to continue until there are no more pages
+    :param cursor: ctoken of the first page to request, to resume an earlier listing.
+        Default: the ctoken of ``results``
+    """
+    count = 0
+    if additionalParams is not None:
+        executor = None
+    request_page = lambda ctoken: request_func(additionalParams or get_continuation_string(ctoken))
+    ctoken = cursor if cursor is not None else get_continuation_ctoken(results, ctoken_path)
+    pending = (
+        submit(None, request_page, ctoken)
+        if (cursor is not None or "continuations" in results) and (limit is None or limit > 0)
+        else None
+    )
+    try:
+        while pending is not None:
+            response = pending.result()
+            pending = None
+            if "continuationContents" in response:
+                results = response["continuationContents"][continuation_type]
+            else:
+                break
+
+            ctoken = get_continuation_ctoken(results, ctoken_path)
+            # prefetch, unless the limit is likely reached by the current page
+            page_size = len(results.get("contents") or results.get("items") or [])
+            if executor and "continuations" in results and (limit is None or count + page_size < limit):
+                pending = submit(executor, request_page, ctoken)
+
+            contents = get_continuation_contents(results, parse_func)
+            if len(contents) == 0:
+                break
+            count += len(contents)
+            yield contents, ctoken
+            if pending is None and "continuations" in results and (limit is None or count < limit):
+                pending = submit(None, request_page, ctoken)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 def get_validated_continuations(
     results: JsonDict,
     continuation_type: str,
@@ -151,6 +282,11 @@ def get_continuation_params(results: JsonDict, ctoken_path: str = "") -> str:
     return get_continuation_string(ctoken)
 
 
+def get_continuation_ctoken(results: JsonDict, ctoken_path: str = "") -> str | None:
+    """Returns the ctoken of the page following results, or None if there is none"""
+    return nav(results, ["continuations", 0, "next" + ctoken_path + "ContinuationData", "continuation"], True)
+
+
 def get_reloadable_continuation_params(results: JsonDict) -> str:
     ctoken = nav(results, ["continuations", 0, "reloadContinuationData", "continuation"])
     return get_continuation_string(ctoken)
@@ -0,0 +1,67 @@
+"""decoders for the JSON responses of YouTube Music
+
+Responses are decoded straight from the bytes of the body, without decoding them to a str first.
+By default, the fastest installed backend is used: orjson_, msgspec_ or the standard library::
+
+    pip install ytmusicapi[fast]
+
+A backend can also be chosen explicitly, or replaced by any callable taking bytes::
+
+    ytmusic = YTMusic(json_decoder=get_decoder("json"))
+
+.. _orjson: https://github.com/ijl/orjson
+.. _msgspec: https://github.com/jcrist/msgspec
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from ytmusicapi.exceptions import YTMusicUserError
+
+#: decodes the bytes of a JSON document, raising a :class:`ValueError` if they are not valid JSON
+JsonDecoder = Callable[[bytes], Any]
+
+#: supported backends, fastest first
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load(backend: str) -> JsonDecoder:
+    """Returns the decoder of a backend, or raises ImportError if it is not installed"""
+    match backend:
+        case "orjson":
+            import orjson
+
+            return orjson.loads
+        case "msgspec":
+            import msgspec
+
+            decode = msgspec.json.Decoder().decode
+
+            def decode_msgspec(content: bytes) -> Any:
+                try:
+                    return decode(content)
+                except msgspec.DecodeError as e:
+                    raise json.JSONDecodeError(str(e), "", 0) from e
+
+            return decode_msgspec
+        case "json":
+            return json.loads
+    raise YTMusicUserError(f"Unknown JSON backend {backend!r}, must be one of {', '.join(BACKENDS)}")
+
+
+def get_decoder(backend: str | None = None) -> JsonDecoder:
+    """
+    Returns a function decoding JSON from bytes
+
+    :param backend: One of :data:`BACKENDS`. Default: the first one installed
+    :raises ImportError: if the requested backend is not installed
+    """
+    if backend is not None:
+        return _load(backend)
+    for name in BACKENDS:
+        try:
+            return _load(name)
+        except ImportError:
+            continue
+    return json.loads  # pragma: no cover - the standard library is always available
@@ -0,0 +1,170 @@
+"""export of the user's whole library as newline-delimited JSON
+
+:func:`export_library` requests the sections of the library, like songs, albums and uploads, and the
+items of each library playlist concurrently, and writes each item as a line as soon as it is parsed,
+so memory use does not grow with the library::
+
+    progress = export_library(ytmusic, "library.ndjson.gz", max_workers=8, progress=print)
+    progress.failed  # sections which could not be exported, with their error
+
+Each line is a JSON object with the ``section`` it belongs to and either an ``item`` as returned by the
+method of the section, the ``count`` of items once the section is complete, or the ``error`` it failed
+with. The items of the library playlist ``PL...`` are in the section ``playlist:PL...``.
+Lines of different sections are interleaved. The first line holds the ``version`` of the format.
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import IO
+
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.type_alias import JsonDict
+from ytmusicapi.ytmusic import YTMusic
+
+EXPORT_VERSION = 1
+
+#: items written between progress reports within a section
+PROGRESS_INTERVAL = 500
+
+#: sections exported by default, each with the method listing its items
+SECTIONS: dict[str, Callable[[YTMusic], Iterable[JsonDict]]] = {
+    "playlists": lambda ytmusic: ytmusic.get_library_playlists(limit=None),
+    "songs": lambda ytmusic: ytmusic.iter_library_songs(),
+    "albums": lambda ytmusic: ytmusic.get_library_albums(limit=None),
+    "artists": lambda ytmusic: ytmusic.get_library_artists(limit=None),
+    "subscriptions": lambda ytmusic: ytmusic.get_library_subscriptions(limit=None),
+    "podcasts": lambda ytmusic: ytmusic.get_library_podcasts(limit=None),
+    "channels": lambda ytmusic: ytmusic.get_library_channels(limit=None),
+    "uploads": lambda ytmusic: ytmusic.iter_library_upload_songs(),
+    "upload_albums": lambda ytmusic: ytmusic.get_library_upload_albums(limit=None),
+    "upload_artists": lambda ytmusic: ytmusic.get_library_upload_artists(limit=None),
+}
+
+
+@dataclass
+class ExportProgress:
+    """State of an export, passed to the ``progress`` callback"""
+
+    #: sections found so far, including one per library playlist
+    sections: int = 0
+    #: sections exported or failed
+    done: int = 0
+    #: items written
+    items: int = 0
+    #: error of each failed section
+    failed: dict[str, str] = field(default_factory=dict)
+    #: seconds since the start of the export
+    elapsed: float = 0.0
+
+
+class _Export:
+    """writes the lines of the sections exported by the workers, and reports the progress"""
+
+    def __init__(self, file: IO[str], progress: Callable[[ExportProgress], None] | None):
+        self.file = file
+        self.callback = progress
+        self.progress = ExportProgress()
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def write(self, line: JsonDict, items: int = 0) -> None:
+        text = json.dumps(line, default=str) + "\n"
+        with self.lock:
+            self.file.write(text)
+            self.progress.items += items
+
+    def run(
+        self, ytmusic: YTMusic, section: str, items: Callable[[YTMusic], Iterable[JsonDict]]
+    ) -> list[str]:
+        """exports a section, and returns the ids of the playlists to export if it is ``playlists``"""
+        count = 0
+        playlist_ids = []
+        try:
+            for item in items(ytmusic):
+                self.write({"section": section, "item": item}, items=1)
+                count += 1
+                if section == "playlists" and item.get("playlistId"):
+                    playlist_ids.append(item["playlistId"])
+                if count % PROGRESS_INTERVAL == 0:
+                    self.report()
+        except Exception as e:  # noqa: BLE001 - reported by the export
+            self.write({"section": section, "error": f"{type(e).__name__}: {e}"})
+            with self.lock:
+                self.progress.failed[section] = f"{type(e).__name__}: {e}"
+        else:
+            self.write({"section": section, "count": count})
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+        with self.lock:
+            self.progress.done += 1
+            self.progress.sections += len(playlist_ids)
+        self.report()
+        return playlist_ids
+
+    def report(self) -> None:
+        with self.lock:
+            self.progress.elapsed = time.perf_counter() - self.start
+            progress = replace(self.progress, failed=dict(self.progress.failed))
+        if self.callback is not None:
+            self.callback(progress)
+
+
+def _playlist_items(playlistId: str) -> Callable[[YTMusic], Iterator[JsonDict]]:
+    return lambda ytmusic: ytmusic.iter_playlist(playlistId)
+
+
+def export_library(
+    ytmusic: YTMusic,
+    output: str | Path | IO[str],
+    sections: Iterable[str] = SECTIONS,
+    max_workers: int = 8,
+    progress: Callable[[ExportProgress], None] | None = None,
+) -> ExportProgress:
+    """
+    Exports the user's library, with up to ``max_workers`` sections requested at once.
+    Sections which fail are reported, and do not stop the export of the others.
+
+    :param ytmusic: Authenticated client, shared by the workers. If it has an ``executor``, each worker
+        may send further requests to prefetch pages
+    :param output: Path of the file to write, compressed with gzip if it ends with ``.gz``,
+        or a text file opened for writing
+    :param sections: Sections to export, any of :data:`SECTIONS`. ``playlists`` also exports the items of
+        each library playlist. Default: all sections
+    :param max_workers: Sections requested at once, which bounds the requests in flight
+    :param progress: Called with an :class:`ExportProgress` after each section and every
+        :data:`PROGRESS_INTERVAL` items
+    :return: The final progress
+    """
+    sections = list(sections)
+    if unknown := set(sections) - SECTIONS.keys():
+        raise YTMusicUserError(
+            f"Unknown sections {', '.join(sorted(unknown))}, must be in {', '.join(SECTIONS)}"
+        )
+    if isinstance(output, str | Path):
+        opener = gzip.open if str(output).endswith(".gz") else open
+        with opener(output, "wt", encoding="utf-8") as file:
+            return export_library(ytmusic, file, sections, max_workers, progress)
+
+    export = _Export(output, progress)
+    export.write({"version": EXPORT_VERSION, "sections": sections})
+    export.progress.sections = len(sections)
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures: dict[Future[list[str]], str] = {
+            executor.submit(export.run, ytmusic, section, SECTIONS[section]): section for section in sections
+        }
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                futures.pop(future)
+                for playlistId in future.result():
+                    section = f"playlist:{playlistId}"
+                    futures[executor.submit(export.run, ytmusic, section, _playlist_items(playlistId))] = (
+                        section
+                    )
+    export.report()
+    return export.progress
@@ -1,9 +1,10 @@
+import bisect
 import json
 import locale
 import re
 import time
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from hashlib import sha1
 from http.cookies import SimpleCookie
 from typing import Any
@@ -44,12 +45,23 @@ def initialize_context() -> JsonDict:
 
 def get_visitor_id(request_func: Callable[[str], Response]) -> dict[str, str]:
     response = request_func(YTM_DOMAIN)
-    matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", response.text)
+    return {"X-Goog-Visitor-Id": parse_visitor_id(response.text)}
+
+
+def parse_visitor_id(html: str) -> str:
+    """Returns the visitor id of the ytcfg in the HTML of the homepage, or an empty string"""
+    matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", html)
     visitor_id = ""
     if len(matches) > 0:
         ytcfg = json.loads(matches[0])
         visitor_id = ytcfg.get("VISITOR_DATA")
-    return {"X-Goog-Visitor-Id": visitor_id}
+    return visitor_id
+
+
+def parse_basejs_url(html: str) -> str | None:
+    """Returns the URL of the base.js player script referenced by the HTML of the homepage, or None"""
+    match = re.search(r'jsUrl"\s*:\s*"([^"]+)"', html)
+    return None if match is None else YTM_DOMAIN + match.group(1)
 
 
 def sapisid_from_cookie(raw_cookie: str) -> str:
@@ -120,3 +132,30 @@ def parse_description_runs(descriptionRunsList: Any | None) -> tuple[str, list[T
             description_runs.append({"text": run["text"]})
 
     return description, description_runs
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> list[int]:
+    """Returns the indices of a longest strictly increasing subsequence of values, in O(n log n)
+
+    :param values: i.e. the old positions of playlist items in their new order.
+        The items outside of the subsequence are the ones that moved
+    """
+    tails: list[int] = []  # last value of the best subsequence of each length
+    tail_indices: list[int] = []
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[length] = value
+            tail_indices[length] = index
+        previous[index] = tail_indices[length - 1] if length > 0 else -1
+
+    subsequence = []
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        subsequence.append(index)
+        index = previous[index]
+    return subsequence[::-1]
@@ -0,0 +1,237 @@
+"""timing and size metrics of the calls to :class:`~ytmusicapi.YTMusic`
+
+Pass a callback as ``metrics`` to receive a :class:`CallMetrics` after every call of a public method,
+i.e. to export histograms to a metrics system::
+
+    def export(call: CallMetrics) -> None:
+        histogram.labels(call.method).observe(call.total)
+        for request in call.requests:
+            bytes_histogram.labels(request.endpoint, request.category).observe(request.response_bytes)
+
+    ytmusic = YTMusic(metrics=export)
+
+All requests sent during a call are attributed to it, including requests sent by nested calls,
+i.e. of :py:meth:`~ytmusicapi.YTMusic.get_album` within :py:meth:`~ytmusicapi.YTMusic.get_albums`,
+and requests sent concurrently by the ``executor``. Without a callback, calls are not instrumented.
+"""
+
+import functools
+import inspect
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from requests import Response
+
+from ytmusicapi.type_alias import JsonDict
+
+#: category of browse requests by browseId prefix, longest prefixes first
+BROWSE_CATEGORIES = [
+    ("FEmusic_library", "library"),
+    ("FEmusic_liked", "library"),
+    ("FEmusic_history", "history"),
+    ("FEmusic_", "feed"),
+    ("VL", "playlist"),
+    ("MPREb", "album"),
+    ("MPLA", "artist"),
+    ("MPLYt", "lyrics"),
+    ("MPTRt", "related"),
+    ("MPSP", "podcast"),
+    ("MPED", "episode"),
+    ("UC", "channel"),
+]
+
+MetricsCallback = Callable[["CallMetrics"], None]
+
+
+@dataclass
+class RequestMetrics:
+    """Metrics of a single request
+
+    Times are in seconds. Fields the transport cannot provide are None.
+    """
+
+    #: API endpoint, i.e. ``browse``, or the URL of GET requests
+    endpoint: str
+    #: kind of page requested from the ``browse`` endpoint (see :data:`BROWSE_CATEGORIES`),
+    #: or the ``params`` of other requests, i.e. the search filter
+    category: str | None
+    #: whether the request fetched a continuation page
+    continuation: bool
+    #: ``"hit"`` if the response was served by the cache, ``"miss"`` if it was cached after sending
+    #: the request, None for requests that are not cacheable or without a cache
+    cache: Literal["hit", "miss"] | None = None
+    status_code: int | None = None
+    request_bytes: int | None = None
+    response_bytes: int = 0
+    #: time until the response headers were received, as reported by :attr:`requests.Response.elapsed`
+    ttfb: float | None = None
+    #: time spent in the transport until the whole response was received
+    total: float = 0.0
+    #: time spent decoding the JSON response
+    decode: float = 0.0
+    #: number of times the request was resent, see :py:mod:`ytmusicapi.retry`
+    retries: int = 0
+    #: whether the response of an identical request in flight was used, see :py:mod:`ytmusicapi.singleflight`
+    shared: bool = False
+
+
+@dataclass
+class CallMetrics:
+    """Metrics of a call of a public method and all requests it sent"""
+
+    #: name of the method, i.e. ``get_playlist``
+    method: str
+    requests: list[RequestMetrics] = field(default_factory=list)
+    #: wall time of the call in seconds, including the consumption of ``iter_*`` generators
+    total: float = 0.0
+    #: exception raised by the call, if any
+    exception: BaseException | None = None
+
+    @property
+    def network(self) -> float:
+        """time spent in the transport by all requests"""
+        return sum(request.total for request in self.requests)
+
+    @property
+    def decode(self) -> float:
+        """time spent decoding JSON responses"""
+        return sum(request.decode for request in self.requests)
+
+    @property
+    def parse(self) -> float:
+        """time not spent sending requests or decoding, which is mostly parsing.
+        Underestimated if requests were sent concurrently by an executor"""
+        return max(0.0, self.total - self.network - self.decode)
+
+    @property
+    def continuation_pages(self) -> int:
+        return sum(request.continuation for request in self.requests)
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(request.cache == "hit" for request in self.requests)
+
+    @property
+    def retries(self) -> int:
+        return sum(request.retries for request in self.requests)
+
+
+_current_call: ContextVar[CallMetrics | None] = ContextVar("ytmusicapi_call", default=None)
+
+_EXHAUSTED = object()
+
+
+def current_call() -> CallMetrics | None:
+    """Returns the metrics of the instrumented call in progress, or None"""
+    return _current_call.get()
+
+
+def request_category(endpoint: str, body: JsonDict | None) -> str | None:
+    if not body:
+        return None
+    if browse_id := body.get("browseId"):
+        return next(
+            (category for prefix, category in BROWSE_CATEGORIES if browse_id.startswith(prefix)), None
+        )
+    params = body.get("params")
+    return params if isinstance(params, str) else None
+
+
+def record_request(
+    call: CallMetrics,
+    endpoint: str,
+    body: JsonDict | None,
+    additionalParams: str,
+    response: Response | None,
+    total: float = 0.0,
+    decode: float = 0.0,
+    cache: Literal["hit", "miss"] | None = None,
+    retries: int = 0,
+    shared: bool = False,
+) -> None:
+    """Adds a request to a call. ``response`` is None for responses served by the cache"""
+    metrics = RequestMetrics(
+        endpoint=endpoint,
+        category=request_category(endpoint, body),
+        continuation="continuation" in additionalParams or bool(body and "continuation" in body),
+        cache=cache,
+        total=total,
+        decode=decode,
+        retries=retries,
+        shared=shared,
+    )
+    if response is not None:
+        metrics.status_code = response.status_code
+        metrics.response_bytes = len(response.content)
+        if response.request is not None and isinstance(response.request.body, bytes | str):
+            metrics.request_bytes = len(response.request.body)
+        if response.elapsed:
+            metrics.ttfb = response.elapsed.total_seconds()
+    call.requests.append(metrics)  # list.append is atomic, requests may be recorded by executor threads
+
+
+@contextmanager
+def _measure(call: CallMetrics) -> Iterator[None]:
+    token = _current_call.set(call)
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        call.exception = e
+        raise
+    finally:
+        call.total += time.perf_counter() - start
+        _current_call.reset(token)
+
+
+def mixin_methods(cls: type) -> Iterator[tuple[str, Callable[..., Any]]]:
+    """Yields the public methods of the mixins of a client class"""
+    for mixin in cls.__mro__:
+        if mixin.__name__.endswith("Mixin"):
+            for name, member in vars(mixin).items():
+                if callable(member) and not name.startswith("_"):
+                    yield name, member
+
+
+def _measure_iterator(
+    iterator: Generator[Any, Any, Any], call: CallMetrics, callback: MetricsCallback
+) -> Iterator[Any]:
+    """yields from the generator returned by an ``iter_*`` method, measuring each item as part of the call,
+    which ends when the generator is closed"""
+    try:
+        while True:
+            with _measure(call):
+                item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        with _measure(call):
+            iterator.close()
+        callback(call)
+
+
+def instrument(method: Callable[..., Any], name: str, callback: MetricsCallback) -> Callable[..., Any]:
+    """Wraps a bound method, so that callback receives the metrics of each outermost call"""
+
+    @functools.wraps(method)
+    def instrumented(*args: Any, **kwargs: Any) -> Any:
+        if _current_call.get() is not None:
+            return method(*args, **kwargs)
+        call = CallMetrics(name)
+        try:
+            with _measure(call):
+                result = method(*args, **kwargs)
+        except BaseException:
+            callback(call)
+            raise
+        if inspect.isgenerator(result):
+            return _measure_iterator(result, call, callback)
+        callback(call)
+        return result
+
+    return instrumented
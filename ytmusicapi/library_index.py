@@ -0,0 +1,275 @@
+"""a local full-text index of the user's library
+
+A :class:`LibraryIndex` stores the library songs, uploads, albums, artists, liked songs and owned
+playlists with their items in an sqlite database with an FTS5 table, so that library searches are
+answered locally, also offline::
+
+    index = LibraryIndex("library.db")
+    index.refresh(ytmusic, max_age=3600)  # only sources older than an hour are requested again
+    index.search("daft punk", kinds=["song"])
+
+Songs, uploads, albums and artists are requested in full on each refresh of their source.
+Playlists are refreshed with :py:meth:`~ytmusicapi.YTMusic.sync_playlist` from the snapshot of the
+previous refresh, so unchanged playlists cost a single request.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from ytmusicapi._sqlite import Transaction
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.sync import PlaylistSnapshot
+from ytmusicapi.type_alias import JsonDict, JsonList
+from ytmusicapi.ytmusic import YTMusic
+
+#: sources refreshed by default. ``playlists`` stands for the liked songs and each owned playlist,
+#: which are indexed as separate sources ``playlist:<playlistId>``
+SOURCES = ("songs", "uploads", "albums", "artists", "playlists")
+
+#: id of the playlist of liked songs
+LIKED_SONGS = "LM"
+
+
+def _names(items: Any) -> str:
+    return " ".join(item["name"] for item in items or [] if item.get("name"))
+
+
+def _entry(kind: str, item: JsonDict) -> tuple[str, str, str, str] | None:
+    """key and searchable title, artists and album of an item, or None if it cannot be identified"""
+    if kind == "artist":
+        key, title, artists, album = item.get("browseId"), item.get("artist"), "", ""
+    elif kind == "album":
+        key, title, artists, album = item.get("browseId"), item.get("title"), _names(item.get("artists")), ""
+    elif kind == "playlist":
+        key, title, artists, album = item.get("playlistId"), item.get("title"), "", ""
+    else:
+        key = item.get("setVideoId") or item.get("entityId") or item.get("videoId")
+        title, artists = item.get("title"), _names(item.get("artists"))
+        album = (item.get("album") or {}).get("name") or ""
+    if not key:
+        return None
+    return key, title or "", artists, album
+
+
+def _match(query: str) -> str:
+    """FTS5 query matching all words of ``query`` as prefixes, with FTS5 syntax escaped"""
+    words = query.split()
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+class LibraryIndex:
+    """Full-text index of the user's library in an sqlite database. Thread-safe
+
+    :param path: Path of the database file, created if it does not exist. Default: in memory
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY, source TEXT NOT NULL, key TEXT NOT NULL, kind TEXT NOT NULL,
+                position INTEGER NOT NULL, data TEXT NOT NULL, UNIQUE (source, key)
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(title, artists, album, tokenize='unicode61');
+            CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, refreshed REAL NOT NULL, state TEXT);
+            """
+        )
+
+    def refresh(
+        self, ytmusic: YTMusic, sources: Iterable[str] = SOURCES, max_age: float = 0.0
+    ) -> dict[str, int]:
+        """
+        Requests the sources of the index again, or only those refreshed more than ``max_age`` seconds ago
+
+        :param ytmusic: Authenticated client
+        :param sources: Any of :data:`SOURCES`. Default: all of them
+        :param max_age: Seconds after which a source is refreshed. Default: 0, all sources are refreshed
+        :return: Number of entries of each refreshed source
+        """
+        sources = list(sources)
+        if unknown := set(sources) - set(SOURCES):
+            raise YTMusicUserError(
+                f"Unknown sources {', '.join(sorted(unknown))}, must be in {', '.join(SOURCES)}"
+            )
+        refreshed: dict[str, int] = {}
+        now = time.time()
+        ages = {source: now - refreshed_at for source, refreshed_at in self.sources().items()}
+
+        def is_stale(source: str) -> bool:
+            return source not in ages or ages[source] > max_age
+
+        for source in sources:
+            if source == "playlists":
+                playlist_ids = [LIKED_SONGS] + [
+                    playlist["playlistId"]
+                    for playlist in self._refresh_playlists(ytmusic, is_stale("playlists"), refreshed)
+                    if playlist.get("owned") and playlist.get("playlistId") != LIKED_SONGS
+                ]
+                for playlistId in playlist_ids:
+                    if is_stale(f"playlist:{playlistId}"):
+                        refreshed[f"playlist:{playlistId}"] = self._sync_playlist(ytmusic, playlistId)
+                self._drop_playlists(keep=playlist_ids)
+            elif source == "songs" and is_stale(source):
+                refreshed[source] = self._replace(source, "song", ytmusic.iter_library_songs())
+            elif source == "uploads" and is_stale(source):
+                refreshed[source] = self._replace(source, "upload", ytmusic.iter_library_upload_songs())
+            elif source == "albums" and is_stale(source):
+                refreshed[source] = self._replace(source, "album", ytmusic.get_library_albums(limit=None))
+            elif source == "artists" and is_stale(source):
+                refreshed[source] = self._replace(source, "artist", ytmusic.get_library_artists(limit=None))
+        return refreshed
+
+    def search(self, query: str, kinds: Iterable[str] | None = None, limit: int = 20) -> JsonList:
+        """
+        Searches the titles, artists and albums of the index, best matches first.
+        Each word of the query matches words starting with it.
+
+        :param query: Words to search for
+        :param kinds: Only return these kinds of results: ``song``, ``upload``, ``album``, ``artist``,
+            ``playlist`` or ``playlistItem``. Default: all kinds
+        :param limit: Maximum number of results
+        :return: The indexed dictionaries of the results, as returned by the method they were requested with,
+            with the ``resultType`` of their kind and the ``source`` they were found in
+        """
+        match = _match(query)
+        if not match:
+            return []
+        sql = (
+            "SELECT entries.kind, entries.source, entries.data FROM search JOIN entries ON entries.id = search.rowid"
+            " WHERE search MATCH ?"
+        )
+        params: list[Any] = [match]
+        if kinds is not None:
+            kinds = list(kinds)
+            sql += f" AND entries.kind IN ({', '.join('?' * len(kinds))})"
+            params.extend(kinds)
+        sql += " ORDER BY bm25(search), entries.source, entries.position LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [{**json.loads(data), "resultType": kind, "source": source} for kind, source, data in rows]
+
+    def sources(self) -> dict[str, float]:
+        """Time of the last refresh of each indexed source"""
+        with self._lock:
+            return dict(self._connection.execute("SELECT source, refreshed FROM sources").fetchall())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _refresh_playlists(self, ytmusic: YTMusic, stale: bool, refreshed: dict[str, int]) -> JsonList:
+        """the library playlists, requested again if stale"""
+        if stale:
+            refreshed["playlists"] = self._replace(
+                "playlists", "playlist", ytmusic.get_library_playlists(limit=None)
+            )
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM entries WHERE source = 'playlists' ORDER BY position"
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _sync_playlist(self, ytmusic: YTMusic, playlistId: str) -> int:
+        source = f"playlist:{playlistId}"
+        with self._lock:
+            row = self._connection.execute("SELECT state FROM sources WHERE source = ?", (source,)).fetchone()
+        snapshot = PlaylistSnapshot.from_dict(json.loads(row[0])) if row and row[0] else None
+        snapshot, diff = ytmusic.sync_playlist(playlistId, snapshot)
+        positions = {item.key: position for position, item in enumerate(snapshot.items)}
+        with self._lock, Transaction(self._connection) as cursor:
+            self._delete(cursor, source, [item.key for item in diff.removed])
+            for _, track in diff.added:
+                self._insert(cursor, source, "playlistItem", track, 0)
+            for _, new in diff.changed:
+                row = cursor.execute(
+                    "SELECT data FROM entries WHERE source = ? AND key = ?", (source, new.key)
+                ).fetchone()
+                if row is None:
+                    continue
+                track = json.loads(row[0])
+                track["likeStatus"] = new.likeStatus
+                track["communityVoteStatus"] = (
+                    None
+                    if new.voteStatus is None
+                    else {"netVoteValue": new.netVoteValue, "status": new.voteStatus}
+                )
+                cursor.execute(
+                    "UPDATE entries SET data = ? WHERE source = ? AND key = ?",
+                    (json.dumps(track), source, new.key),
+                )
+            cursor.executemany(
+                "UPDATE entries SET position = ? WHERE source = ? AND key = ?",
+                [(position, source, key) for key, position in positions.items()],
+            )
+            self._mark(cursor, source, json.dumps(snapshot.to_dict()))
+        return len(snapshot.items)
+
+    def _drop_playlists(self, keep: list[str]) -> None:
+        """removes the playlists which are no longer owned or were deleted"""
+        keep_sources = {f"playlist:{playlistId}" for playlistId in keep}
+        with self._lock, Transaction(self._connection) as cursor:
+            sources = [
+                row[0] for row in cursor.execute("SELECT source FROM sources WHERE source LIKE 'playlist:%'")
+            ]
+            for source in set(sources) - keep_sources:
+                self._delete(cursor, source)
+                cursor.execute("DELETE FROM sources WHERE source = ?", (source,))
+
+    def _replace(self, source: str, kind: str, items: Iterable[JsonDict]) -> int:
+        """replaces the entries of a source with items, which are consumed before the database is locked"""
+        items = list(items)
+        with self._lock, Transaction(self._connection) as cursor:
+            self._delete(cursor, source)
+            count = sum(
+                self._insert(cursor, source, kind, item, position) for position, item in enumerate(items)
+            )
+            self._mark(cursor, source, None)
+        return count
+
+    @staticmethod
+    def _insert(cursor: sqlite3.Cursor, source: str, kind: str, item: JsonDict, position: int) -> bool:
+        entry = _entry(kind, item)
+        if entry is None:
+            return False
+        key, *text = entry
+        LibraryIndex._delete(cursor, source, [key])
+        cursor.execute(
+            "INSERT INTO entries (source, key, kind, position, data) VALUES (?, ?, ?, ?, ?)",
+            (source, key, kind, position, json.dumps(item, default=str)),
+        )
+        cursor.execute(
+            "INSERT INTO search (rowid, title, artists, album) VALUES (?, ?, ?, ?)", (cursor.lastrowid, *text)
+        )
+        return True
+
+    @staticmethod
+    def _delete(cursor: sqlite3.Cursor, source: str, keys: Iterable[str | None] | None = None) -> None:
+        """deletes the entries of the keys of a source, or all of them"""
+        if keys is None:
+            ids = [row[0] for row in cursor.execute("SELECT id FROM entries WHERE source = ?", (source,))]
+        else:
+            ids = [
+                row[0]
+                for key in keys
+                for row in cursor.execute(
+                    "SELECT id FROM entries WHERE source = ? AND key = ?", (source, key)
+                )
+            ]
+        cursor.executemany("DELETE FROM search WHERE rowid = ?", [(id_,) for id_ in ids])
+        cursor.executemany("DELETE FROM entries WHERE id = ?", [(id_,) for id_ in ids])
+
+    @staticmethod
+    def _mark(cursor: sqlite3.Cursor, source: str, state: str | None) -> None:
+        cursor.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (source, time.time(), state))
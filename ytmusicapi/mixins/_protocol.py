@@ -1,6 +1,7 @@
 """protocol that defines the functions available to mixins"""
 
 from collections.abc import Iterator
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from typing import Protocol
 
@@ -8,7 +9,9 @@ from requests import Response
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.auth.types import AuthType
+from ytmusicapi.cache import ResponseCache
 from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.transport import Transport
 from ytmusicapi.type_alias import JsonDict
 
 
@@ -21,13 +24,24 @@ class MixinProtocol(Protocol):
 
     proxies: dict[str, str] | None
 
+    _transport: Transport
+
+    _executor: Executor | None
+
+    cache: ResponseCache | None
+
     def _check_auth(self) -> None:
         """checks if self has authentication"""
 
+    def _init_base_headers(self) -> CaseInsensitiveDict[str]:
+        """initializes the headers shared by all requests, caching the visitor id and base.js URL"""
+
     def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
         """for sending post requests to YouTube Music"""
 
-    def _send_get_request(self, url: str, params: JsonDict | None = None) -> Response:
+    def _send_get_request(
+        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False, write: bool = False
+    ) -> Response:
         """for sending get requests to YouTube Music"""
 
     @contextmanager
@@ -1,7 +1,11 @@
 import re
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Literal, TypeVar
 
+from ytmusicapi.continuations import submit
 from ytmusicapi.exceptions import YTMusicGatedError, YTMusicUserError
 from ytmusicapi.models.content.enums import LikeStatus
 from ytmusicapi.navigation import nav
@@ -9,6 +13,8 @@ from ytmusicapi.type_alias import JsonDict
 
 LibraryOrderType = Literal["a_to_z", "z_to_a", "recently_added"]
 
+_T = TypeVar("_T")
+
 
 def prepare_like_endpoint(rating: str | LikeStatus) -> str:
     match rating:
@@ -82,3 +88,43 @@ def get_datestamp() -> int:
     Currently only used for the signature timestamp in :py:func:`get_song`."""
     epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
     return (datetime.now(timezone.utc) - epoch).days
+
+
+def batch_map(
+    fn: Callable[[str], _T], ids: Sequence[str], concurrency: int, executor: Executor | None = None
+) -> list[_T | Exception]:
+    """
+    Calls fn for each id, with at most ``concurrency`` calls running at once
+
+    :param executor: Executor to run the calls in. Default: a thread pool created for the batch
+    :return: the results in the order of ids. The exception raised by a call replaces its result,
+        so that a single failure does not abort the batch
+    """
+    if concurrency < 1:
+        raise YTMusicUserError("concurrency must be at least 1")
+
+    results: dict[int, _T | Exception] = {}
+    remaining = iter(range(len(ids)))
+    lock = threading.Lock()
+
+    def work() -> None:
+        while True:
+            with lock:
+                index = next(remaining, None)
+            if index is None:
+                return
+            try:
+                results[index] = fn(ids[index])
+            except Exception as e:  # noqa: BLE001 - reported in place of the result
+                results[index] = e
+
+    workers = min(concurrency, len(ids))
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            for future in [submit(pool, work) for _ in range(workers)]:
+                future.result()
+    else:
+        for future in [submit(executor, work) for _ in range(workers)]:
+            future.result()
+
+    return [results[index] for index in range(len(ids))]
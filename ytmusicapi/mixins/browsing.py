@@ -1,12 +1,13 @@
 import re
 import warnings
+from collections.abc import Sequence
 from typing import Any, Literal, overload
 
 from ytmusicapi.continuations import (
     get_continuations,
     get_reloadable_continuation_params,
 )
-from ytmusicapi.helpers import YTM_DOMAIN, parse_description_runs, sum_total_duration
+from ytmusicapi.helpers import YTM_DOMAIN, parse_basejs_url, parse_description_runs, sum_total_duration
 from ytmusicapi.models.lyrics import LyricLine, Lyrics, TimedLyrics
 from ytmusicapi.parsers.albums import parse_album_header_2024
 from ytmusicapi.parsers.browsing import (
@@ -23,7 +24,7 @@ from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFunc
 from ..exceptions import YTMusicError, YTMusicUserError
 from ..navigation import *
 from ._protocol import MixinProtocol
-from ._utils import get_datestamp
+from ._utils import batch_map, get_datestamp
 
 
 class BrowsingMixin(MixinProtocol):
@@ -306,6 +307,17 @@ class BrowsingMixin(MixinProtocol):
 
     ArtistOrderType = Literal["Recency", "Popularity", "Alphabetical order"]
 
+    def get_artists(self, channelIds: Sequence[str], concurrency: int = 8) -> list[JsonDict | Exception]:
+        """
+        Get information about multiple artists, requesting up to ``concurrency`` of them at once
+
+        :param channelIds: channel ids of the artists
+        :param concurrency: Maximum number of concurrent requests. Default: 8
+        :return: List with the result of :py:func:`get_artist` for each channel id, in the same order.
+            If an artist could not be retrieved, the exception raised for it takes the place of its result
+        """
+        return batch_map(self.get_artist, channelIds, concurrency, self._executor)
+
     def get_artist_albums(
         self, channelId: str, params: str, limit: int | None = 100, order: ArtistOrderType | None = None
     ) -> JsonList:
@@ -619,6 +631,17 @@ class BrowsingMixin(MixinProtocol):
 
         return album
 
+    def get_albums(self, browseIds: Sequence[str], concurrency: int = 8) -> list[JsonDict | Exception]:
+        """
+        Get information and tracks of multiple albums, requesting up to ``concurrency`` of them at once
+
+        :param browseIds: browseIds of the albums, see :py:func:`get_album`
+        :param concurrency: Maximum number of concurrent requests. Default: 8
+        :return: List with the result of :py:func:`get_album` for each browseId, in the same order.
+            If an album could not be retrieved, the exception raised for it takes the place of its result
+        """
+        return batch_map(self.get_album, browseIds, concurrency, self._executor)
+
     def get_song_credits(self, browseId: str) -> JsonDict:
         """
         Get credits for a song. Top-level entries are limited to ``performed_by``,
@@ -702,7 +725,9 @@ class BrowsingMixin(MixinProtocol):
 
         :param videoId: Video id
         :param signatureTimestamp: Provide the current YouTube signatureTimestamp.
-            If not provided a default value will be used, which might result in invalid streaming URLs
+            If not provided, the cached one of the current player is used if the ``cache`` was created with
+            ``resolve_signature_timestamp=True``, see :py:func:`get_signatureTimestamp`.
+            Otherwise a default value will be used, which might result in invalid streaming URLs
         :return: Dictionary with song metadata.
 
         Example::
@@ -869,7 +894,10 @@ class BrowsingMixin(MixinProtocol):
         """
         endpoint = "player"
         if not signatureTimestamp:
-            signatureTimestamp = get_datestamp() - 1
+            if self.cache is not None and self.cache.resolve_signature_timestamp:
+                signatureTimestamp = self.get_signatureTimestamp()
+            else:
+                signatureTimestamp = get_datestamp() - 1
 
         params = {
             "playbackContext": {"contentPlaybackContext": {"signatureTimestamp": signatureTimestamp}},
@@ -882,6 +910,23 @@ class BrowsingMixin(MixinProtocol):
                 del response[k]
         return response
 
+    def get_songs(
+        self, videoIds: Sequence[str], signatureTimestamp: int | None = None, concurrency: int = 8
+    ) -> list[JsonDict | Exception]:
+        """
+        Returns metadata and streaming information about multiple songs or videos,
+        requesting up to ``concurrency`` of them at once
+
+        :param videoIds: Video ids
+        :param signatureTimestamp: Provide the current YouTube signatureTimestamp. See :py:func:`get_song`
+        :param concurrency: Maximum number of concurrent requests. Default: 8
+        :return: List with the result of :py:func:`get_song` for each video id, in the same order.
+            If a song could not be retrieved, the exception raised for it takes the place of its result
+        """
+        return batch_map(
+            lambda videoId: self.get_song(videoId, signatureTimestamp), videoIds, concurrency, self._executor
+        )
+
     def get_song_related(self, browseId: str) -> JsonList:
         """
         Gets related content for a song. Equivalent to the content
@@ -1057,33 +1102,48 @@ class BrowsingMixin(MixinProtocol):
     def get_basejs_url(self) -> str:
         """
         Extract the URL for the `base.js` script from YouTube Music.
+        With a ``cache``, the URL is reused for the ``basejs_url_ttl`` of the cache.
 
         :return: URL to `base.js`
         """
+        if self.cache is not None:
+            self._init_base_headers()
+            if (url := self.cache.get_basejs_url()) is not None:
+                return url
         response = self._send_get_request(url=YTM_DOMAIN)
-        match = re.search(r'jsUrl"\s*:\s*"([^"]+)"', response.text)
-        if match is None:
+        url = parse_basejs_url(response.text)
+        if url is None:
             raise YTMusicError("Could not identify the URL for base.js player.")
 
-        return YTM_DOMAIN + match.group(1)
+        if self.cache is not None:
+            self.cache.set_basejs_url(url)
+        return url
 
     def get_signatureTimestamp(self, url: str | None = None) -> int:
         """
         Fetch the `base.js` script from YouTube Music and parse out the
         ``signatureTimestamp`` for use with :py:func:`get_song`.
 
+        With a ``cache``, the ``signatureTimestamp`` of each script URL is only fetched once, which saves
+        downloading the multi-megabyte script for each call.
+
         :param url: Optional. Provide the URL of the `base.js` script. If this
             isn't specified a call will be made to :py:func:`get_basejs_url`.
         :return: ``signatureTimestamp`` string
         """
         if url is None:
             url = self.get_basejs_url()
+        if self.cache is not None and (cached := self.cache.get_signature_timestamp(url)) is not None:
+            return cached
         response = self._send_get_request(url=url)
         match = re.search(r"signatureTimestamp[:=](\d+)", response.text)
         if match is None:
             raise YTMusicError("Unable to identify the signatureTimestamp.")
 
-        return int(match.group(1))
+        signature_timestamp = int(match.group(1))
+        if self.cache is not None:
+            self.cache.set_signature_timestamp(url, signature_timestamp)
+        return signature_timestamp
 
     def get_tasteprofile(self) -> JsonDict:
         """
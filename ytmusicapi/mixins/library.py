@@ -1,12 +1,14 @@
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from random import randint
+from typing import Any, Literal, overload
 
 from requests import Response
 
 from ytmusicapi.continuations import *
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.models.content.enums import LikeStatus
+from ytmusicapi.models.results import Track, item_parser
 from ytmusicapi.parsers.browsing import *
 from ytmusicapi.parsers.library import *
 from ytmusicapi.parsers.playlists import parse_playlist_items
@@ -52,14 +54,51 @@ class LibraryMixin(MixinProtocol):
             parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_playlist)
             remaining_limit = None if limit is None else (limit - len(playlists))
             playlists.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+                get_continuations(
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    executor=self._executor,
+                )
             )
 
         return playlists
 
+    @overload
     def get_library_songs(
-        self, limit: int = 25, validate_responses: bool = False, order: LibraryOrderType | None = None
+        self,
+        limit: int = 25,
+        validate_responses: bool = False,
+        order: LibraryOrderType | None = None,
+        cursor: str | None = None,
+        lazy: Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> JsonList:
+        """overload for mypy only"""
+
+    @overload
+    def get_library_songs(
+        self,
+        limit: int = 25,
+        validate_responses: bool = False,
+        order: LibraryOrderType | None = None,
+        cursor: str | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> list[Track]:
+        """overload for mypy only"""
+
+    def get_library_songs(
+        self,
+        limit: int = 25,
+        validate_responses: bool = False,
+        order: LibraryOrderType | None = None,
+        cursor: str | None = None,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> JsonList | list[Track]:
         """
         Gets the songs in the user's library (liked videos are not included).
         To get liked songs and videos, use :py:func:`get_liked_songs`
@@ -68,7 +107,18 @@ class LibraryMixin(MixinProtocol):
         :param validate_responses: Flag indicating if responses from YTM should be validated and retried in case
             when some songs are missing. Default: False
         :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
-        :return: List of songs. Same format as :py:func:`get_playlist`
+        :param cursor: The ``cursor`` of an earlier result, to return the songs following that result
+            instead of the first songs. Not supported with ``validate_responses``.
+        :param lazy: Return :class:`~ytmusicapi.models.results.Track` objects, which only parse the fields
+            that are read, instead of dictionaries. Default: False
+        :param fields: Only parse these keys of the songs. See :py:func:`get_playlist`
+        :return: List of songs. Same format as :py:func:`get_playlist`.
+            Unless ``validate_responses`` is set, it is a :class:`~ytmusicapi.continuations.CursorList`,
+            whose ``cursor`` continues after the last song, or is None if there are no more songs::
+
+                songs = ytmusic.get_library_songs(limit=1000)
+                while songs.cursor:
+                    songs = ytmusic.get_library_songs(limit=1000, cursor=songs.cursor)
         """
         self._check_auth()
         body = {"browseId": "FEmusic_liked_videos"}
@@ -79,11 +129,15 @@ class LibraryMixin(MixinProtocol):
         per_page = 25
 
         request_func: RequestFuncType = lambda additionalParams: self._send_request(endpoint, body)
-        parse_func: ParseFuncDictType = lambda raw_response: parse_library_songs(raw_response)
+        parse_item = item_parser(Track.parse, lazy, fields, Track.FIELDS)
+        parse_func: ParseFuncDictType = lambda raw_response: parse_library_songs(raw_response, parse_item)
 
         if validate_responses and limit is None:
             raise YTMusicUserError("Validation is not supported without a limit parameter.")
 
+        if validate_responses and cursor is not None:
+            raise YTMusicUserError("Validation is not supported with a cursor.")
+
         if validate_responses:
             validate_func: Callable[[JsonDict], bool] = lambda parsed: validate_response(
                 parsed, per_page, limit, 0
@@ -91,21 +145,25 @@ class LibraryMixin(MixinProtocol):
             response = resend_request_until_parsed_response_is_valid(
                 request_func, "", parse_func, validate_func, 3
             )
+        elif cursor is not None:
+            response = {"results": {}, "parsed": []}
         else:
             response = parse_func(request_func(""))
 
         results = response["results"]
         songs: JsonList | None = response["parsed"]
         if songs is None:
-            return []
+            return CursorList()
 
-        if "continuations" in results:
-            request_continuations_func = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            parse_continuations_func = lambda contents: parse_playlist_items(contents)
+        request_continuations_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_continuations_func: ParseFuncType = lambda contents: parse_playlist_items(
+            contents, parse_item=parse_item
+        )
 
-            if validate_responses:
+        if validate_responses:
+            if "continuations" in results:
                 songs.extend(
                     get_validated_continuations(
                         results,
@@ -116,25 +174,82 @@ class LibraryMixin(MixinProtocol):
                         parse_continuations_func,
                     )
                 )
-            else:
-                remaining_limit = None if limit is None else (limit - len(songs))
-                songs.extend(
-                    get_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        remaining_limit,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
-                )
+            return songs
+
+        remaining_limit = None if limit is None else (limit - len(songs))
+        next_cursor = cursor if cursor is not None else get_continuation_ctoken(results)
+        for contents, next_cursor in iter_continuations(
+            results,
+            "musicShelfContinuation",
+            request_continuations_func,
+            parse_continuations_func,
+            limit=remaining_limit,
+            executor=self._executor,
+            cursor=cursor,
+        ):
+            songs.extend(contents)
+
+        return CursorList(songs, next_cursor)
+
+    @overload
+    def iter_library_songs(
+        self,
+        order: LibraryOrderType | None = None,
+        lazy: Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> Iterator[JsonDict]:
+        """overload for mypy only"""
+
+    @overload
+    def iter_library_songs(
+        self, order: LibraryOrderType | None = None, *, lazy: Literal[True]
+    ) -> Iterator[Track]:
+        """overload for mypy only"""
+
+    def iter_library_songs(
+        self, order: LibraryOrderType | None = None, lazy: bool = False, fields: list[str] | None = None
+    ) -> Iterator[JsonDict] | Iterator[Track]:
+        """
+        Yields all songs in the user's library. Further pages are only requested as the songs are consumed,
+        so large libraries can be processed with constant memory.
 
-        return songs
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :param lazy: Yield :class:`~ytmusicapi.models.results.Track` objects instead of dictionaries.
+            Default: False
+        :param fields: Only parse these keys of the songs. See :py:func:`get_playlist`
+        :return: Generator of songs. Same format as :py:func:`get_playlist`
+        """
+        self._check_auth()
+        body = {"browseId": "FEmusic_liked_videos"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        parse_item = item_parser(Track.parse, lazy, fields, Track.FIELDS)
+        return self._iter_library_songs(body, parse_item)
+
+    def _iter_library_songs(self, body: JsonDict, parse_item: Callable[..., Any] | None) -> Iterator[Any]:
+        """yields the library songs once the arguments of :py:func:`iter_library_songs` are checked"""
+        endpoint = "browse"
+        response = parse_library_songs(self._send_request(endpoint, body), parse_item)
+        results = response["results"]
+        if not results:
+            return
 
-    def get_library_albums(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+        yield from response["parsed"]
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents, parse_item=parse_item)
+        for songs, _ in iter_continuations(
+            results, "musicShelfContinuation", request_func, parse_func, executor=self._executor
+        ):
+            yield from songs
+
+    def get_library_albums(self, limit: int | None = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
         Gets the albums in the user's library.
 
-        :param limit: Number of albums to return
+        :param limit: Number of albums to return. ``None`` retrieves them all. Default: 25
         :param order: Order of albums to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of albums.
 
@@ -165,11 +280,11 @@ class LibraryMixin(MixinProtocol):
             response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
         )
 
-    def get_library_artists(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    def get_library_artists(self, limit: int | None = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
         Gets the artists of the songs in the user's library.
 
-        :param limit: Number of artists to return
+        :param limit: Number of artists to return. ``None`` retrieves them all. Default: 25
         :param order: Order of artists to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of artists.
 
@@ -193,11 +308,13 @@ class LibraryMixin(MixinProtocol):
             response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
         )
 
-    def get_library_subscriptions(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    def get_library_subscriptions(
+        self, limit: int | None = 25, order: LibraryOrderType | None = None
+    ) -> JsonList:
         """
         Gets the artists the user has subscribed to.
 
-        :param limit: Number of artists to return
+        :param limit: Number of artists to return. ``None`` retrieves them all. Default: 25
         :param order: Order of artists to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of artists. Same format as :py:func:`get_library_artists`
         """
@@ -212,11 +329,11 @@ class LibraryMixin(MixinProtocol):
             response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
         )
 
-    def get_library_podcasts(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    def get_library_podcasts(self, limit: int | None = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
         Get podcasts the user has added to the library
 
-        :param limit: Number of podcasts to return
+        :param limit: Number of podcasts to return. ``None`` retrieves them all. Default: 25
         :param order: Order of podcasts to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of podcasts. New Episodes playlist is the first podcast returned, but only if subscribed to relevant podcasts.
 
@@ -258,11 +375,11 @@ class LibraryMixin(MixinProtocol):
             response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
         )
 
-    def get_library_channels(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
+    def get_library_channels(self, limit: int | None = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
         Get channels the user has added to the library
 
-        :param limit: Number of channels to return
+        :param limit: Number of channels to return. ``None`` retrieves them all. Default: 25
         :param order: Order of channels to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of channels.
 
@@ -294,31 +411,48 @@ class LibraryMixin(MixinProtocol):
             response, lambda additionalParams: self._send_request(endpoint, body, additionalParams), limit
         )
 
-    def get_history(self) -> JsonList:
+    def get_history(self, fields: list[str] | None = None) -> JsonList:
         """
         Gets your play history in reverse chronological order
 
+        :param fields: Only parse these keys of the playlistItems, including ``played``.
+            See :py:func:`get_playlist`. Default: all keys
         :return: List of playlistItems, see :py:func:`get_playlist`
           The additional property ``played`` indicates when the playlistItem was played
           The additional property ``feedbackToken`` can be used to remove items with :py:func:`remove_history_items`
         """
+        return list(self.iter_history(fields))
+
+    def iter_history(self, fields: list[str] | None = None) -> Iterator[JsonDict]:
+        """
+        Yields your play history in reverse chronological order.
+        Each day of the history is parsed only once the previous day has been consumed.
+
+        :param fields: Only parse these keys of the playlistItems. See :py:func:`get_history`
+        :return: Generator of playlistItems, see :py:func:`get_history`
+        """
+        parse_item = item_parser(Track.parse, fields=fields, known_fields=[*Track.FIELDS, "played"])
         self._check_auth()
+        return self._iter_history(fields, parse_item)
+
+    def _iter_history(
+        self, fields: list[str] | None, parse_item: Callable[..., Any] | None
+    ) -> Iterator[JsonDict]:
+        """yields the history once the arguments of :py:func:`iter_history` are checked"""
         body = {"browseId": "FEmusic_history"}
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
-        songs = []
         for content in results:
             data = nav(content, [*MUSIC_SHELF, "contents"], True)
             if not data:
                 error = nav(content, ["musicNotifierShelfRenderer", *TITLE], True)
                 raise YTMusicServerError(error)
-            songlist = parse_playlist_items(data)
-            for song in songlist:
-                song["played"] = nav(content["musicShelfRenderer"], TITLE_TEXT)
-            songs.extend(songlist)
-
-        return songs
+            songlist = parse_playlist_items(data, parse_item=parse_item)
+            if fields is None or "played" in fields:
+                for song in songlist:
+                    song["played"] = nav(content["musicShelfRenderer"], TITLE_TEXT)
+            yield from songlist
 
     def add_history_item(self, song: JsonDict) -> Response:
         """
@@ -342,7 +476,7 @@ class LibraryMixin(MixinProtocol):
         CPNA = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
         cpn = "".join(CPNA[randint(0, 256) & 63] for _ in range(16))
         params = {"ver": 2, "c": "WEB_REMIX", "cpn": cpn}
-        return self._send_get_request(url, params)
+        return self._send_get_request(url, params, write=True)
 
     def remove_history_items(self, feedbackTokens: list[str]) -> JsonDict:  # pragma: no cover
         """
@@ -1,13 +1,26 @@
+from collections.abc import Callable, Iterator
+from typing import Any, Literal, overload
 from urllib.parse import parse_qs, urlparse
 
+from ytmusicapi.bulk import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    BulkEditResult,
+    EditChunk,
+    make_chunks,
+    plan_moves,
+    send_chunks,
+)
 from ytmusicapi.continuations import *
 from ytmusicapi.enums import ResponseStatus
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.helpers import sum_total_duration
 from ytmusicapi.models.content.enums import PlaylistSortOrder, PlaylistVoteEditOptions
+from ytmusicapi.models.results import Track, item_parser
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.browsing import parse_content_list, parse_playlist
 from ytmusicapi.parsers.playlists import *
+from ytmusicapi.sync import PlaylistDiff, PlaylistSnapshot, SnapshotItem, diff_playlist, remaining_items
 from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncBodyType, RequestFuncType
 
 from ._protocol import MixinProtocol
@@ -16,7 +29,14 @@ from ._utils import *
 
 class PlaylistsMixin(MixinProtocol):
     def get_playlist(
-        self, playlistId: str, limit: int | None = 100, related: bool = False, suggestions_limit: int = 0
+        self,
+        playlistId: str,
+        limit: int | None = 100,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        cursor: str | None = None,
+        lazy: bool = False,
+        fields: list[str] | None = None,
     ) -> JsonDict:
         """
         Returns a list of playlist items
@@ -27,8 +47,23 @@ class PlaylistsMixin(MixinProtocol):
         :param suggestions_limit: How many suggestions to return. The result is a list of
             suggested playlist items (videos) contained in a "suggestions" key.
             7 items are retrieved in each internal request. Default: 0
+        :param cursor: The ``cursor`` of an earlier result, to return the tracks following that result
+            instead of the first tracks. Large playlists can be retrieved in resumable steps this way::
+
+                playlist = ytmusic.get_playlist(playlistId, limit=1000)
+                while playlist["cursor"]:
+                    playlist = ytmusic.get_playlist(playlistId, limit=1000, cursor=playlist["cursor"])
+
+        :param lazy: Return the tracks as :class:`~ytmusicapi.models.results.Track` objects, which only parse
+            the fields that are read, instead of dictionaries. Default: False
+        :param fields: Only parse these keys of the tracks, i.e. ``["videoId", "title"]``, which saves
+            the parsing of the others. Keys a track lacks, i.e. ``setVideoId``, are left out.
+            The ``duration_seconds`` of the playlist only sums those of the tracks if they are among the fields.
+            Default: all keys
+
         :return: Dictionary with information about the playlist.
-            The key ``tracks`` contains a List of playlistItem dictionaries
+            The key ``tracks`` contains a List of playlistItem dictionaries.
+            The key ``cursor`` is a string to continue after the last track, or None if there are no more tracks
 
         The result is in the following format::
 
@@ -149,17 +184,18 @@ class PlaylistsMixin(MixinProtocol):
         response = request_func("")
 
         request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
-        is_ola = playlistId.startswith(("OLA", "VLOLA"))
-        has_playlist_header = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM], True)
-        if is_ola and not has_playlist_header:
-            return parse_audio_playlist(response, limit, request_func_continuations)
+        parse_item = item_parser(Track.parse, lazy, fields, Track.FIELDS)
+        if is_audio_playlist(playlistId, response):
+            return parse_audio_playlist(
+                response, limit, request_func_continuations, self._executor, cursor, parse_item
+            )
 
         header_data = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM])
         section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
         playlist: JsonDict = {}
         playlist["owned"] = EDITABLE_PLAYLIST_DETAIL_HEADER[0] in header_data
+        header = get_playlist_header(header_data)
         if not playlist["owned"]:
-            header = nav(header_data, RESPONSIVE_HEADER)
             playlist["id"] = nav(
                 header,
                 ["buttons", 1, "musicPlayButtonRenderer", "playNavigationEndpoint", *WATCH_PLAYLIST_ID],
@@ -168,7 +204,6 @@ class PlaylistsMixin(MixinProtocol):
             playlist["privacy"] = "PUBLIC"
         else:
             playlist["id"] = nav(header_data, [*EDITABLE_PLAYLIST_DETAIL_HEADER, *PLAYLIST_ID])
-            header = nav(header_data, [*EDITABLE_PLAYLIST_DETAIL_HEADER, *HEADER, *RESPONSIVE_HEADER])
             playlist["privacy"] = header_data[EDITABLE_PLAYLIST_DETAIL_HEADER[0]]["editHeader"][
                 "musicPlaylistEditHeaderRenderer"
             ]["privacy"]
@@ -185,9 +220,9 @@ class PlaylistsMixin(MixinProtocol):
 
         playlist.update(parse_song_runs(nav(header, SUBTITLE_RUNS)[2 + playlist["owned"] * 2 :]))
 
-        # suggestions and related are missing e.g. on liked songs
-        playlist["related"] = []
-        if "continuations" in section_list:
+        def get_sections() -> JsonDict:
+            """suggestions and related playlists, which can be fetched alongside the tracks"""
+            sections: JsonDict = {}
             additionalParams = get_continuation_params(section_list)
             if playlist["owned"] and (suggestions_limit > 0 or related):
                 parse_func: ParseFuncType = lambda results: parse_playlist_items(results)
@@ -195,14 +230,14 @@ class PlaylistsMixin(MixinProtocol):
                 continuation = nav(suggested, SECTION_LIST_CONTINUATION)
                 additionalParams = get_continuation_params(continuation)
                 suggestions_shelf = nav(continuation, CONTENT + MUSIC_SHELF)
-                playlist["suggestions"] = get_continuation_contents(suggestions_shelf, parse_func)
+                sections["suggestions"] = get_continuation_contents(suggestions_shelf, parse_func)
 
                 parse_func = lambda results: parse_playlist_items(results)
-                playlist["suggestions"].extend(
+                sections["suggestions"].extend(
                     get_reloadable_continuations(
                         suggestions_shelf,
                         "musicShelfContinuation",
-                        suggestions_limit - len(playlist["suggestions"]),
+                        suggestions_limit - len(sections["suggestions"]),
                         request_func,
                         parse_func,
                     )
@@ -213,25 +248,162 @@ class PlaylistsMixin(MixinProtocol):
                 continuation = nav(response, SECTION_LIST_CONTINUATION, True)
                 if continuation:
                     parse_func = lambda results: parse_content_list(results, parse_playlist)
-                    playlist["related"] = get_continuation_contents(
+                    sections["related"] = get_continuation_contents(
                         nav(continuation, CONTENT + CAROUSEL), parse_func
                     )
+            return sections
+
+        # suggestions and related are missing e.g. on liked songs
+        playlist["related"] = []
+        sections = None
+        if "continuations" in section_list and (related or (playlist["owned"] and suggestions_limit > 0)):
+            if playlist["owned"]:
+                playlist["suggestions"] = []
+            sections = submit(self._executor, get_sections)
 
         playlist["tracks"] = []
+        playlist["cursor"] = None
         content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
         if "contents" in content_data:
-            playlist["tracks"] = parse_playlist_items(
-                content_data["contents"], is_collaborative=is_collaborative
+            playlist["tracks"], playlist["cursor"] = parse_playlist_tracks(
+                content_data,
+                limit,
+                request_func_continuations,
+                is_collaborative=is_collaborative,
+                executor=self._executor,
+                cursor=cursor,
+                parse_item=parse_item,
             )
 
-            parse_func = lambda contents: parse_playlist_items(contents, is_collaborative=is_collaborative)
-            playlist["tracks"].extend(
-                get_continuations_2025(content_data, limit, request_func_continuations, parse_func)
-            )
+        if sections is not None:
+            playlist.update(sections.result())
 
         playlist["duration_seconds"] = sum_total_duration(playlist)
         return playlist
 
+    @overload
+    def iter_playlist(
+        self, playlistId: str, lazy: Literal[False] = False, fields: list[str] | None = None
+    ) -> Iterator[JsonDict]:
+        """overload for mypy only"""
+
+    @overload
+    def iter_playlist(self, playlistId: str, lazy: Literal[True]) -> Iterator[Track]:
+        """overload for mypy only"""
+
+    def iter_playlist(
+        self, playlistId: str, lazy: bool = False, fields: list[str] | None = None
+    ) -> Iterator[JsonDict] | Iterator[Track]:
+        """
+        Yields all tracks of a playlist. Further pages are only requested as the tracks are consumed,
+        so processing can start after the first page and memory use does not grow with the playlist size.
+
+        :param playlistId: Playlist id
+        :param lazy: Yield :class:`~ytmusicapi.models.results.Track` objects instead of dictionaries.
+            Default: False
+        :param fields: Only parse these keys of the tracks. See :py:func:`get_playlist`
+        :return: Generator of playlistItem dictionaries. See :py:func:`get_playlist`
+        """
+        parse_item = item_parser(Track.parse, lazy, fields, Track.FIELDS)
+        return self._iter_playlist(playlistId, parse_item)
+
+    def _iter_playlist(self, playlistId: str, parse_item: Callable[..., Any] | None) -> Iterator[Any]:
+        """yields the tracks once the arguments of :py:func:`iter_playlist` are checked"""
+        browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
+        body = {"browseId": browseId}
+        endpoint = "browse"
+        response = self._send_request(endpoint, body)
+        request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
+
+        # audio playlists have no header, and are never collaborative, see get_playlist
+        is_collaborative = False
+        if not is_audio_playlist(playlistId, response):
+            header_data = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM], True)
+            if header_data:
+                is_collaborative = "collaborators" in parse_playlist_header_meta(
+                    get_playlist_header(header_data)
+                )
+
+        section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
+        content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
+        if "contents" not in content_data:
+            return
+
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(
+            contents, is_collaborative=is_collaborative, parse_item=parse_item
+        )
+        yield from parse_func(content_data["contents"])
+        for tracks, _ in iter_continuations_2025(
+            content_data, request_func_continuations, parse_func, executor=self._executor
+        ):
+            yield from tracks
+
+    def sync_playlist(
+        self, playlistId: str, snapshot: PlaylistSnapshot | None = None, full: bool = False
+    ) -> tuple[PlaylistSnapshot, PlaylistDiff]:
+        """
+        Returns the changes of a playlist since an earlier sync, requesting as few pages as possible.
+        Items are identified by their ``setVideoId``, so a track added twice is two items.
+        In playlists without ``setVideoId``, the copies of a track are told apart by their order.
+
+        Pagination stops as soon as a page shows that the remaining items are unchanged,
+        see :py:mod:`ytmusicapi.sync` for when this misses changes.
+
+        :param playlistId: Playlist id
+        :param snapshot: The snapshot returned by the previous sync. Default: all items are added
+        :param full: Request all pages, to also find changes which keep the position of the fetched items.
+            Default: False
+        :return: The new snapshot to pass to the next sync, and the changes since ``snapshot``.
+            Added items are playlistItem dictionaries, see :py:func:`get_playlist`
+        """
+        playlistId = validate_playlist_id(playlistId)
+        endpoint = "browse"
+        response = self._send_request(endpoint, {"browseId": "VL" + playlistId})
+        request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
+
+        is_collaborative = False
+        header_data = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM], True)
+        if header_data:
+            is_collaborative = "collaborators" in parse_playlist_header_meta(get_playlist_header(header_data))
+        header = parse_playlist_summary(header_data)
+
+        section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
+        content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"], True) or {}
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(
+            contents, is_collaborative=is_collaborative
+        )
+
+        items: list[SnapshotItem] = []
+        tracks: dict[str | None, JsonDict] = {}
+        pages, rest = 0, None
+
+        def add_page(page: JsonList) -> list[SnapshotItem] | None:
+            nonlocal pages
+            pages += 1
+            page_start = len(items)
+            for track in page:
+                item = SnapshotItem.from_track(track)
+                if item is not None:
+                    items.append(item)
+                    tracks.setdefault(item.key, track)
+            if full or snapshot is None:
+                return None
+            return remaining_items(snapshot, header, items, page_start)
+
+        if content_data.get("contents"):
+            rest = add_page(parse_func(content_data["contents"]))
+            if rest is None:
+                for page, _ in iter_continuations_2025(content_data, request_func_continuations, parse_func):
+                    rest = add_page(page)
+                    if rest is not None:
+                        break
+
+        new_snapshot = PlaylistSnapshot(playlistId, header, items + (rest or []))
+        diff = diff_playlist(snapshot, new_snapshot, tracks)
+        diff.pages = pages
+        diff.complete = rest is None
+        return new_snapshot, diff
+
     def get_liked_songs(self, limit: int = 100) -> JsonDict:
         """
         Gets playlist items for the 'Liked Songs' playlist
@@ -512,3 +684,130 @@ class PlaylistsMixin(MixinProtocol):
         response = self._send_request(endpoint, body)
         result: str | JsonDict = response.get("status", response)
         return result
+
+    def add_playlist_items_bulk(
+        self,
+        playlistId: str,
+        videoIds: list[str],
+        duplicates: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BulkEditResult:
+        """
+        Adds any number of songs to a playlist, ``chunk_size`` songs per request.
+        The chunks are sent in order, and the remaining chunks are not sent after a chunk failed,
+        so that the songs keep their order when :attr:`~ytmusicapi.bulk.BulkEditResult.failed_items`
+        are added again.
+
+        :param playlistId: Playlist id
+        :param videoIds: List of Video ids
+        :param duplicates: If True, duplicates will be added. If False, a chunk containing a song which is
+            already in the playlist fails. See :py:func:`add_playlist_items`
+        :param chunk_size: Songs per request. Default: 100
+        :return: The response of each chunk. ``playlistEditResults`` maps the added videoIds to their
+            new setVideoIds, see :py:mod:`ytmusicapi.bulk`
+        """
+        self._check_auth()
+        actions: JsonList = []
+        for videoId in videoIds:
+            action = {"action": "ACTION_ADD_VIDEO", "addedVideoId": videoId}
+            if duplicates:
+                action["dedupeOption"] = "DEDUPE_OPTION_SKIP"
+            actions.append(action)
+        return self._edit_playlist_chunks(
+            playlistId, make_chunks(videoIds, actions, chunk_size), ordered=True
+        )
+
+    def remove_playlist_items_bulk(
+        self,
+        playlistId: str,
+        videos: JsonList,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> BulkEditResult:
+        """
+        Removes any number of songs from a playlist, ``chunk_size`` songs per request.
+        If the client has an ``executor``, up to ``max_in_flight`` chunks are sent concurrently.
+
+        :param playlistId: Playlist id
+        :param videos: List of PlaylistItems, see :py:func:`get_playlist`.
+            Must contain videoId and setVideoId
+        :param chunk_size: Songs per request. Default: 100
+        :param max_in_flight: Requests sent at once. Default: 4
+        :return: The response of each chunk, see :py:mod:`ytmusicapi.bulk`
+        """
+        self._check_auth()
+        videos = [video for video in videos if "videoId" in video and "setVideoId" in video]
+        if len(videos) == 0:
+            raise YTMusicUserError(
+                "Cannot remove songs, because setVideoId is missing. Do you own this playlist?"
+            )
+        actions: JsonList = [
+            {
+                "setVideoId": video["setVideoId"],
+                "removedVideoId": video["videoId"],
+                "action": "ACTION_REMOVE_VIDEO",
+            }
+            for video in videos
+        ]
+        return self._edit_playlist_chunks(
+            playlistId, make_chunks(videos, actions, chunk_size), ordered=False, max_in_flight=max_in_flight
+        )
+
+    def move_playlist_items(
+        self,
+        playlistId: str,
+        moves: list[tuple[str, str | None]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BulkEditResult:
+        """
+        Moves any number of items of a playlist, with several moves per request instead of
+        one :py:func:`edit_playlist` call each. The moves are applied in order, like ``moveItem``
+        of :py:func:`edit_playlist`, and the remaining chunks are not sent after a chunk failed.
+
+        :param playlistId: Playlist id
+        :param moves: setVideoId of each item to move, and the setVideoId of the item to move it before,
+            or None to move it to the end
+        :param chunk_size: Moves per request. Default: 100
+        :return: The response of each chunk, see :py:mod:`ytmusicapi.bulk`
+        """
+        self._check_auth()
+        actions: JsonList = []
+        for setVideoId, successor in moves:
+            action = {"action": "ACTION_MOVE_VIDEO_BEFORE", "setVideoId": setVideoId}
+            if successor is not None:
+                action["movedSetVideoIdSuccessor"] = successor
+            actions.append(action)
+        return self._edit_playlist_chunks(playlistId, make_chunks(moves, actions, chunk_size), ordered=True)
+
+    def reorder_playlist(
+        self, playlistId: str, setVideoIds: list[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BulkEditResult:
+        """
+        Reorders a playlist with as few moves as possible, sent ``chunk_size`` moves per request,
+        so that reordering a playlist of 1000 tracks takes a few requests instead of 1000
+        :py:func:`edit_playlist` calls. The playlist must be sorted manually, see ``sortOrder``
+        of :py:func:`edit_playlist`.
+
+        :param playlistId: Playlist id
+        :param setVideoIds: The setVideoId of each item of the playlist, in the desired order
+        :param chunk_size: Moves per request. Default: 100
+        :return: The response of each chunk of moves, see :py:func:`move_playlist_items`.
+            No request is sent if the playlist is in the desired order.
+        """
+        self._check_auth()
+        tracks = self.iter_playlist(playlistId, fields=["setVideoId"])
+        current = [track["setVideoId"] for track in tracks if "setVideoId" in track]
+        return self.move_playlist_items(playlistId, plan_moves(current, setVideoIds), chunk_size)
+
+    def _edit_playlist_chunks(
+        self,
+        playlistId: str,
+        chunks: list[EditChunk],
+        ordered: bool,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> BulkEditResult:
+        playlistId = validate_playlist_id(playlistId)
+        send = lambda actions: self._send_request(
+            "browse/edit_playlist", {"playlistId": playlistId, "actions": actions}
+        )
+        return send_chunks(send, chunks, ordered, self._executor, max_in_flight)
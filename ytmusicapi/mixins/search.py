@@ -1,11 +1,14 @@
-from typing import Literal
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any, Literal, cast, overload
 
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import iter_continuations
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.mixins._protocol import MixinProtocol
+from ytmusicapi.models.results import SearchResult, item_parser
 from ytmusicapi.navigation import MRLIR
 from ytmusicapi.parsers.search import *
-from ytmusicapi.type_alias import JsonList, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, RequestFuncType
 
 _SearchFilterType = Literal[
     "songs",
@@ -22,8 +25,12 @@ _SearchFilterType = Literal[
 
 _SearchScopeType = Literal["uploads", "library"]
 
+#: scopes in the order of their tabs, which follow the tab of the default scope
+_SEARCH_SCOPES = ["library", "uploads"]
+
 
 class SearchMixin(MixinProtocol):
+    @overload
     def search(
         self,
         query: str,
@@ -31,7 +38,34 @@ class SearchMixin(MixinProtocol):
         scope: _SearchScopeType | None = None,
         limit: int = 20,
         ignore_spelling: bool = False,
+        lazy: Literal[False] = False,
+        fields: list[str] | None = None,
     ) -> JsonList:
+        """overload for mypy only"""
+
+    @overload
+    def search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int = 20,
+        ignore_spelling: bool = False,
+        *,
+        lazy: Literal[True],
+    ) -> list[SearchResult]:
+        """overload for mypy only"""
+
+    def search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int = 20,
+        ignore_spelling: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> JsonList | list[SearchResult]:
         """
         Search YouTube music
         Returns results within the provided category.
@@ -50,6 +84,12 @@ class SearchMixin(MixinProtocol):
           If True, the exact search term will be searched for, and will not be corrected.
           This does not have any effect when the filter is set to ``uploads``.
           Default: False, will use YTM's default behavior of autocorrecting the search.
+        :param lazy: Return :class:`~ytmusicapi.models.results.SearchResult` objects, which are only parsed
+          when a field is read, instead of dictionaries. Default: False
+        :param fields: Only return these keys of the results, i.e. ``["resultType", "videoId", "title"]``.
+          Keys a result lacks are left out. The menu data, song details, badges and thumbnails of a result
+          are only parsed if one of their keys is requested. Cannot be combined with ``lazy``.
+          Default: all keys
         :return: List of results depending on filter.
           resultType specifies the type of item (important for default search).
           albums, artists and playlists additionally contain a browseId, corresponding to
@@ -159,9 +199,69 @@ class SearchMixin(MixinProtocol):
             ]
 
         """
+        results = self.iter_search(query, filter, scope, limit, ignore_spelling, lazy=lazy, fields=fields)
+        return cast(JsonList | list[SearchResult], list(results))
+
+    @overload
+    def iter_search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int | None = None,
+        ignore_spelling: bool = False,
+        lazy: Literal[False] = False,
+        fields: list[str] | None = None,
+    ) -> Iterator[JsonDict]:
+        """overload for mypy only"""
+
+    @overload
+    def iter_search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int | None = None,
+        ignore_spelling: bool = False,
+        *,
+        lazy: Literal[True],
+    ) -> Iterator[SearchResult]:
+        """overload for mypy only"""
+
+    @overload
+    def iter_search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int | None = None,
+        ignore_spelling: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> Iterator[JsonDict] | Iterator[SearchResult]:
+        """overload for mypy only"""
+
+    def iter_search(
+        self,
+        query: str,
+        filter: _SearchFilterType | None = None,
+        scope: _SearchScopeType | None = None,
+        limit: int | None = None,
+        ignore_spelling: bool = False,
+        lazy: bool = False,
+        fields: list[str] | None = None,
+    ) -> Iterator[JsonDict] | Iterator[SearchResult]:
+        """
+        Yields search results as they are parsed. With a filter, further pages of results are only
+        requested as the results are consumed.
+
+        :param limit: Stop requesting further pages once this many results have been yielded.
+            ``None`` to continue until there are no more results. Default: None
+        :return: Generator of search results. For the other parameters and the format of the results,
+            see :py:func:`search`
+        """
         body = {"query": query}
-        endpoint = "search"
-        search_results: JsonList = []
+        parse_item = item_parser(partial(SearchResult.parse, fields=fields), lazy, fields)
         filters = [
             "albums",
             "artists",
@@ -180,7 +280,7 @@ class SearchMixin(MixinProtocol):
                 + ", ".join(filters)
             )
 
-        scopes = ["library", "uploads"]
+        scopes = _SEARCH_SCOPES
         if scope and scope not in scopes:
             raise YTMusicUserError(
                 "Invalid scope provided. Please use one of the following scopes or leave out the parameter: "
@@ -203,12 +303,27 @@ class SearchMixin(MixinProtocol):
         params = get_search_params(filter, scope, ignore_spelling)
         if params:
             body["params"] = params
+        return self._iter_search(body, filter, scope, limit, lazy, fields, parse_item)
 
+    def _iter_search(
+        self,
+        body: JsonDict,
+        filter: str | None,
+        scope: str | None,
+        limit: int | None,
+        lazy: bool,
+        fields: list[str] | None,
+        parse_item: Callable[..., Any] | None,
+    ) -> Iterator[Any]:
+        """yields the search results once the arguments of :py:func:`iter_search` are checked"""
+        endpoint = "search"
+        count = 0
+        scopes = _SEARCH_SCOPES
         response = self._send_request(endpoint, body)
 
         # no results
         if "contents" not in response:
-            return search_results
+            return
 
         if "tabbedSearchResultsRenderer" in response["contents"]:
             tab_index = 0 if not scope or filter else scopes.index(scope) + 1
@@ -222,7 +337,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if len(section_list) == 1 and "itemSectionRenderer" in section_list:
-            return search_results
+            return
 
         # set filter for parser
         internal_filter: str | None = filter
@@ -237,10 +352,18 @@ class SearchMixin(MixinProtocol):
             category = None
 
             if "musicCardShelfRenderer" in res:
-                top_result = parse_top_result(
-                    res["musicCardShelfRenderer"], self.parser.get_search_result_types()
+                parse_top = partial(
+                    parse_top_result, res["musicCardShelfRenderer"], self.parser.get_search_result_types()
                 )
-                search_results.append(top_result)
+                top_result: JsonDict | SearchResult
+                if lazy:
+                    top_result = SearchResult(parse_top)
+                elif fields is not None:
+                    top_result = SearchResult(parse_top).project(fields)
+                else:
+                    top_result = parse_top()
+                count += 1
+                yield top_result
                 if not (shelf_contents := nav(res, ["musicCardShelfRenderer", "contents"], True)):
                     continue
                 # if "more from youtube" is present, remove it - it's not parseable
@@ -273,7 +396,9 @@ class SearchMixin(MixinProtocol):
                     continue
                 result_type = internal_filter[:-1].lower()
 
-            search_results.extend(parse_search_results(shelf_contents, result_type, category))
+            shelf_results = parse_search_results(shelf_contents, result_type, category, parse_item)
+            count += len(shelf_results)
+            yield from shelf_results
 
             if internal_filter:  # if filter is set, there are continuations
                 request_func: RequestFuncType = lambda additionalParams: self._send_request(
@@ -283,19 +408,17 @@ class SearchMixin(MixinProtocol):
                 def parse_func(
                     contents: JsonList, result_type: str | None = result_type, category: str | None = category
                 ) -> JsonList:
-                    return parse_search_results(contents, result_type, category)
-
-                search_results.extend(
-                    get_continuations(
-                        res["musicShelfRenderer"],
-                        "musicShelfContinuation",
-                        limit - len(search_results),
-                        request_func,
-                        parse_func,
-                    )
-                )
-
-        return search_results
+                    return parse_search_results(contents, result_type, category, parse_item)
+
+                for continuation_results, _ in iter_continuations(
+                    res["musicShelfRenderer"],
+                    "musicShelfContinuation",
+                    request_func,
+                    parse_func,
+                    limit=None if limit is None else limit - count,
+                ):
+                    count += len(continuation_results)
+                    yield from continuation_results
 
     def get_search_suggestions(self, query: str, detailed_runs: bool = False) -> list[str] | JsonList:
         """
@@ -1,9 +1,10 @@
 import typing
+from collections.abc import Iterator
 from pathlib import Path
 
 import requests
 
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import get_continuations, iter_continuations
 from ytmusicapi.helpers import *
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.albums import parse_album_header
@@ -69,12 +70,49 @@ class UploadsMixin(MixinProtocol):
             remaining_limit = None if limit is None else (limit - len(songs))
             songs.extend(
                 get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_uploaded_items,
+                    executor=self._executor,
                 )
             )
 
         return songs
 
+    def iter_library_upload_songs(self, order: LibraryOrderType | None = None) -> Iterator[JsonDict]:
+        """
+        Yields all uploaded songs. Further pages are only requested as the songs are consumed.
+
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :return: Generator of uploaded songs. See :py:func:`get_library_upload_songs`
+        """
+        self._check_auth()
+        body = {"browseId": "FEmusic_library_privately_owned_tracks"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        return self._iter_library_upload_songs(body)
+
+    def _iter_library_upload_songs(self, body: JsonDict) -> Iterator[JsonDict]:
+        """yields the uploaded songs once the arguments of :py:func:`iter_library_upload_songs` are checked"""
+        endpoint = "browse"
+        response = self._send_request(endpoint, body)
+        results = get_library_contents(response, MUSIC_SHELF)
+        if results is None:
+            return
+        pop_songs_random_mix(results)
+        yield from parse_uploaded_items(results["contents"])
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        for songs, _ in iter_continuations(
+            results, "musicShelfContinuation", request_func, parse_uploaded_items, executor=self._executor
+        ):
+            yield from songs
+
     def get_library_upload_albums(
         self, limit: int | None = 25, order: LibraryOrderType | None = None
     ) -> JsonList:
@@ -244,12 +282,12 @@ class UploadsMixin(MixinProtocol):
         headers["X-Goog-Upload-Command"] = "start"
         headers["X-Goog-Upload-Header-Content-Length"] = str(filesize)
         headers["X-Goog-Upload-Protocol"] = "resumable"
-        response = requests.post(upload_url, data=body, headers=headers, proxies=self.proxies)
+        response = self._transport.upload(upload_url, body, headers=headers, proxies=self.proxies)
         headers["X-Goog-Upload-Command"] = "upload, finalize"
         headers["X-Goog-Upload-Offset"] = "0"
         upload_url = response.headers["X-Goog-Upload-URL"]
         with open(fp, "rb") as file:
-            response = requests.post(upload_url, data=file, headers=headers, proxies=self.proxies)
+            response = self._transport.upload(upload_url, file, headers=headers, proxies=self.proxies)
 
         if response.status_code == 200:
             return ResponseStatus.SUCCEEDED
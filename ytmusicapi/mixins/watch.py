@@ -1,9 +1,11 @@
-from ytmusicapi.continuations import get_continuations
+from collections.abc import Iterator
+
+from ytmusicapi.continuations import get_continuations, iter_continuations
 from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.parsers.playlists import validate_playlist_id
 from ytmusicapi.parsers.watch import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
 
 
 class WatchMixin(MixinProtocol):
@@ -109,6 +111,75 @@ class WatchMixin(MixinProtocol):
             }
 
         """
+        watchNextRenderer, results, request_func, ctoken_path = self._get_watch_next(
+            videoId, playlistId, radio, shuffle
+        )
+
+        browse_ids = get_tab_browse_ids(watchNextRenderer)
+        lyrics_browse_id = browse_ids.get("MUSIC_PAGE_TYPE_TRACK_LYRICS")
+        related_browse_id = browse_ids.get("MUSIC_PAGE_TYPE_TRACK_RELATED")
+
+        playlist = next(
+            filter(
+                bool,
+                (
+                    nav(x, ["playlistPanelVideoRenderer", *NAVIGATION_PLAYLIST_ID], True)
+                    for x in results["contents"]
+                ),
+            ),
+            None,
+        )
+        tracks = parse_watch_playlist(results["contents"])
+
+        if "continuations" in results:
+            parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
+            tracks.extend(
+                get_continuations(
+                    results,
+                    "playlistPanelContinuation",
+                    limit - len(tracks),
+                    request_func,
+                    parse_func,
+                    ctoken_path,
+                )
+            )
+
+        return {
+            "tracks": tracks,
+            "playlistId": playlist,
+            "lyrics": lyrics_browse_id,
+            "related": related_browse_id,
+        }
+
+    def iter_watch_playlist(
+        self,
+        videoId: str | None = None,
+        playlistId: str | None = None,
+        radio: bool = False,
+        shuffle: bool = False,
+    ) -> Iterator[JsonDict]:
+        """
+        Yields the tracks of a watch playlist. Further pages are only requested as the tracks are consumed.
+        Radio playlists have no end, so the consumer has to stop iterating.
+
+        :return: Generator of tracks. For the parameters and the format of the tracks,
+            see :py:func:`get_watch_playlist`
+        """
+        _, results, request_func, ctoken_path = self._get_watch_next(videoId, playlistId, radio, shuffle)
+        parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
+        yield from parse_func(results["contents"])
+        for tracks, _ in iter_continuations(
+            results, "playlistPanelContinuation", request_func, parse_func, ctoken_path
+        ):
+            yield from tracks
+
+    def _get_watch_next(
+        self, videoId: str | None, playlistId: str | None, radio: bool, shuffle: bool
+    ) -> tuple[JsonDict, JsonDict, RequestFuncType, str]:
+        """
+        :return: the watch next renderer, the playlist panel, a request function for its continuations
+            and their ctoken path
+        """
         body = {
             "enablePersistentPlaylistPanel": True,
             "isAudioOnly": True,
@@ -149,10 +220,6 @@ class WatchMixin(MixinProtocol):
             ],
         )
 
-        browse_ids = get_tab_browse_ids(watchNextRenderer)
-        lyrics_browse_id = browse_ids.get("MUSIC_PAGE_TYPE_TRACK_LYRICS")
-        related_browse_id = browse_ids.get("MUSIC_PAGE_TYPE_TRACK_RELATED")
-
         results = nav(
             watchNextRenderer, [*TAB_CONTENT, "musicQueueRenderer", "content", "playlistPanelRenderer"], True
         )
@@ -162,37 +229,7 @@ class WatchMixin(MixinProtocol):
                 msg += f"\nEnsure you have access to {playlistId} - a private playlist may cause this."
             raise YTMusicServerError(msg)
 
-        playlist = next(
-            filter(
-                bool,
-                (
-                    nav(x, ["playlistPanelVideoRenderer", *NAVIGATION_PLAYLIST_ID], True)
-                    for x in results["contents"]
-                ),
-            ),
-            None,
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
         )
-        tracks = parse_watch_playlist(results["contents"])
-
-        if "continuations" in results:
-            request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
-            tracks.extend(
-                get_continuations(
-                    results,
-                    "playlistPanelContinuation",
-                    limit - len(tracks),
-                    request_func,
-                    parse_func,
-                    "" if is_playlist else "Radio",
-                )
-            )
-
-        return {
-            "tracks": tracks,
-            "playlistId": playlist,
-            "lyrics": lyrics_browse_id,
-            "related": related_browse_id,
-        }
+        return watchNextRenderer, results, request_func, "" if is_playlist else "Radio"
@@ -0,0 +1,406 @@
+"""result objects which parse their fields from the raw renderer on first access
+
+Methods called with ``lazy=True`` return these objects instead of dictionaries. They only keep a reference
+to the renderer of the response, so reading a few fields of a large result, i.e. the ``videoId`` of every
+track of a playlist, does not build the thumbnails, artists and menu data of every track::
+
+    tracks = ytmusic.get_playlist(playlistId, limit=None, lazy=True)["tracks"]
+    video_ids = [track.videoId for track in tracks]
+
+They are read-only mappings with the same keys as the dictionaries, so ``track["title"]`` works as before.
+:meth:`LazyResult.to_dict` resolves all fields and returns the dictionary the method would return otherwise.
+"""
+
+import abc
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from functools import partial
+from typing import Any, Generic, TypeVar, overload
+
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.navigation import MENU_LIKE_STATUS, compile_path, nav_badge_label, nav_thumbnails
+from ytmusicapi.parsers._utils import get_item_text, parse_duration
+from ytmusicapi.parsers.playlists import (
+    ColumnIndexes,
+    parse_column_indexes,
+    parse_community_vote_status,
+    parse_is_available,
+    parse_item_duration,
+    parse_menu_ids,
+    parse_play_video_id,
+    parse_track_number,
+    parse_video_type,
+)
+from ytmusicapi.parsers.search import parse_search_result
+from ytmusicapi.parsers.songs import parse_song_album, parse_song_artists, parse_song_menu_data
+from ytmusicapi.type_alias import JsonDict
+
+T = TypeVar("T")
+
+_MENU_LIKE_STATUS = compile_path(MENU_LIKE_STATUS, True)
+
+
+def lazy_slots(*names: str) -> tuple[str, ...]:
+    """slots holding the values of the :class:`lazy_field` with the given names"""
+    return tuple(f"_cached_{name.lstrip('_')}" for name in names)
+
+
+class lazy_field(Generic[T]):
+    """Like :func:`functools.cached_property`, but caches the value in a slot listed by :func:`lazy_slots`"""
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = lazy_slots(name)[0]
+        if not hasattr(owner, self.slot):
+            raise TypeError(f"{owner.__name__}.__slots__ is missing {self.slot} for the lazy field {name}")
+
+    @overload
+    def __get__(self, obj: None, owner: type) -> "lazy_field[T]":
+        """overload for mypy only"""
+
+    @overload
+    def __get__(self, obj: object, owner: type | None = None) -> T:
+        """overload for mypy only"""
+
+    def __get__(self, obj: object | None, owner: type | None = None) -> "T | lazy_field[T]":
+        if obj is None:
+            return self
+        try:
+            value: T = getattr(obj, self.slot)
+        except AttributeError:
+            value = self.func(obj)
+            setattr(obj, self.slot, value)
+        return value
+
+
+class LazyResult(Mapping[str, Any]):
+    """Base class of the lazy results, a read-only mapping with the keys of the result dictionary"""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _keys(self) -> list[str]:
+        """keys of the result dictionary in its order"""
+
+    def _has(self, key: str) -> bool:
+        """whether the result dictionary has the key, resolving as few fields as possible"""
+        return key in self._keys()
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._has(key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._has(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def to_dict(self) -> JsonDict:
+        """Resolves all fields and returns them in a new dictionary"""
+        return {key: getattr(self, key) for key in self._keys()}
+
+    def project(self, fields: Iterable[str]) -> JsonDict:
+        """Resolves only the given fields and returns those the result has in a new dictionary,
+        in the given order"""
+        return {key: getattr(self, key) for key in fields if self._has(key)}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Track(LazyResult):
+    """
+    A track of a playlist or of the library songs. The fields are those of the playlistItem dictionaries
+    described in :py:func:`~ytmusicapi.YTMusic.get_playlist`. Optional keys which are missing from the
+    dictionary, i.e. ``setVideoId``, are None when read as attributes, but missing from the mapping.
+
+    :param data: The ``musicResponsiveListItemRenderer`` of the track
+    """
+
+    __slots__ = (
+        "_data",
+        "_is_album",
+        "_is_collaborative",
+        *lazy_slots(
+            "_menu_ids",
+            "_menu_data",
+            "_play_video_id",
+            "_columns",
+            "videoId",
+            "title",
+            "artists",
+            "album",
+            "likeStatus",
+            "thumbnails",
+            "isAvailable",
+            "isExplicit",
+            "videoType",
+            "views",
+            "communityVoteStatus",
+            "trackNumber",
+            "duration",
+            "duration_seconds",
+        ),
+    )
+
+    #: keys of the playlistItem dictionaries
+    FIELDS = (
+        "videoId",
+        "title",
+        "artists",
+        "album",
+        "likeStatus",
+        "inLibrary",
+        "pinnedToListenAgain",
+        "feedbackTokens",
+        "listenAgainFeedbackTokens",
+        "feedbackToken",
+        "thumbnails",
+        "isAvailable",
+        "isExplicit",
+        "videoType",
+        "views",
+        "communityVoteStatus",
+        "trackNumber",
+        "duration",
+        "duration_seconds",
+        "setVideoId",
+        "creditsBrowseId",
+    )
+
+    def __init__(self, data: JsonDict, is_album: bool = False, is_collaborative: bool = False):
+        self._data = data
+        self._is_album = is_album
+        self._is_collaborative = is_collaborative
+
+    @classmethod
+    def parse(cls, data: JsonDict, is_album: bool = False, is_collaborative: bool = False) -> "Track | None":
+        """Returns the track of a renderer, or None if the song was deleted,
+        like :py:func:`~ytmusicapi.parsers.playlists.parse_playlist_item`"""
+        track = cls(data, is_album, is_collaborative)
+        return None if track.title == "Song deleted" else track
+
+    def _keys(self) -> list[str]:
+        keys = ["videoId", "title", "artists", "album", "likeStatus", *self._menu_data]
+        keys += ["thumbnails", "isAvailable", "isExplicit", "videoType", "views", "communityVoteStatus"]
+        if self._is_album:
+            keys.append("trackNumber")
+        if self.duration:
+            keys += ["duration", "duration_seconds"]
+        if self.setVideoId:
+            keys.append("setVideoId")
+        if self.creditsBrowseId:
+            keys.append("creditsBrowseId")
+        return keys
+
+    def _has(self, key: str) -> bool:
+        match key:
+            case "trackNumber":
+                return self._is_album
+            case "duration" | "duration_seconds":
+                return bool(self.duration)
+            case "setVideoId":
+                return bool(self.setVideoId)
+            case "creditsBrowseId":
+                return bool(self.creditsBrowseId)
+            case "feedbackTokens" | "listenAgainFeedbackTokens" | "feedbackToken":
+                return key in self._menu_data
+        return key in self.FIELDS
+
+    @lazy_field
+    def _menu_ids(self) -> tuple[str | None, str | None, str | None]:
+        return parse_menu_ids(self._data)
+
+    @lazy_field
+    def _menu_data(self) -> JsonDict:
+        return {"inLibrary": None, "pinnedToListenAgain": None} | parse_song_menu_data(self._data)
+
+    @lazy_field
+    def _play_video_id(self) -> str | None:
+        return parse_play_video_id(self._data)
+
+    @lazy_field
+    def _columns(self) -> ColumnIndexes:
+        return parse_column_indexes(self._data, self.isAvailable, self._is_album, self._is_collaborative)
+
+    @lazy_field
+    def videoId(self) -> str | None:
+        return self._play_video_id if self._play_video_id is not None else self._menu_ids[0]
+
+    @lazy_field
+    def title(self) -> str | None:
+        index = self._columns.title
+        return get_item_text(self._data, index) if index is not None else None
+
+    @lazy_field
+    def artists(self) -> list[JsonDict] | None:
+        index = self._columns.artist
+        return parse_song_artists(self._data, index) if index is not None else None
+
+    @lazy_field
+    def album(self) -> JsonDict | None:
+        index = self._columns.album
+        return parse_song_album(self._data, index) if index is not None else None
+
+    @lazy_field
+    def likeStatus(self) -> str | None:
+        if self._play_video_id is None or "menu" not in self._data:
+            return None
+        return _MENU_LIKE_STATUS(self._data)
+
+    @property
+    def inLibrary(self) -> bool | None:
+        in_library: bool | None = self._menu_data["inLibrary"]
+        return in_library
+
+    @property
+    def pinnedToListenAgain(self) -> bool | None:
+        pinned: bool | None = self._menu_data["pinnedToListenAgain"]
+        return pinned
+
+    @property
+    def feedbackTokens(self) -> JsonDict | None:
+        return self._menu_data.get("feedbackTokens")
+
+    @property
+    def listenAgainFeedbackTokens(self) -> JsonDict | None:
+        return self._menu_data.get("listenAgainFeedbackTokens")
+
+    @property
+    def feedbackToken(self) -> str | None:
+        return self._menu_data.get("feedbackToken")
+
+    @lazy_field
+    def thumbnails(self) -> list[JsonDict] | None:
+        return nav_thumbnails(self._data)
+
+    @lazy_field
+    def isAvailable(self) -> bool:
+        return parse_is_available(self._data)
+
+    @lazy_field
+    def isExplicit(self) -> bool:
+        return nav_badge_label(self._data) is not None
+
+    @lazy_field
+    def videoType(self) -> str | None:
+        return parse_video_type(self._data)
+
+    @lazy_field
+    def views(self) -> str | None:
+        return get_item_text(self._data, 2) if self._is_album else None
+
+    @lazy_field
+    def communityVoteStatus(self) -> JsonDict | None:
+        return parse_community_vote_status(self._data)
+
+    @lazy_field
+    def trackNumber(self) -> int | None:
+        return parse_track_number(self._data) if self._is_album and self.isAvailable else None
+
+    @lazy_field
+    def duration(self) -> str | None:
+        return parse_item_duration(self._data, self._columns.duration)
+
+    @lazy_field
+    def duration_seconds(self) -> int | None:
+        return parse_duration(self.duration) if self.duration else None
+
+    @property
+    def setVideoId(self) -> str | None:
+        return self._menu_ids[1]
+
+    @property
+    def creditsBrowseId(self) -> str | None:
+        return self._menu_ids[2]
+
+
+class SearchResult(LazyResult):
+    """
+    A search result, see :py:func:`~ytmusicapi.YTMusic.search` for the fields of each ``resultType``.
+
+    Which fields a result has depends on its type, which can only be told from the whole renderer.
+    The result is therefore parsed as a whole on the first access to any field, instead of field by field.
+    Fields are read as keys or as attributes, i.e. ``result.videoId``.
+
+    :param parse: Function returning the parsed result
+    """
+
+    __slots__ = ("_parse", *lazy_slots("_parsed"))
+
+    def __init__(self, parse: Callable[[], JsonDict]):
+        self._parse = parse
+
+    @classmethod
+    def parse(
+        cls,
+        data: JsonDict,
+        resultType: str | None = None,
+        category: str | None = None,
+        fields: Collection[str] | None = None,
+    ) -> "SearchResult":
+        """Returns the search result of a ``musicResponsiveListItemRenderer``,
+        like :py:func:`~ytmusicapi.parsers.search.parse_search_result`, which only parses
+        the keys needed for ``fields`` if they are given"""
+        return cls(partial(parse_search_result, data, resultType, category, fields))
+
+    @lazy_field
+    def _parsed(self) -> JsonDict:
+        return self._parse()
+
+    def _keys(self) -> list[str]:
+        return list(self._parsed)
+
+    def _has(self, key: str) -> bool:
+        return key in self._parsed
+
+    def __getitem__(self, key: str) -> Any:
+        return self._parsed[key]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):  # unset slots must not trigger the parsing
+            raise AttributeError(name)
+        try:
+            return self._parsed[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no field {name!r}") from None
+
+    def to_dict(self) -> JsonDict:
+        return dict(self._parsed)
+
+
+def item_parser(
+    parse: Callable[..., LazyResult | None],
+    lazy: bool = False,
+    fields: list[str] | None = None,
+    known_fields: Collection[str] | None = None,
+) -> Callable[..., Any] | None:
+    """
+    Returns the ``parse_item`` argument of the parsers for the ``lazy`` and ``fields`` arguments of a method,
+    or None to parse the whole dictionaries
+
+    :param parse: Parser returning lazy results, i.e. :meth:`Track.parse`
+    :param known_fields: Fields the method can return, to reject unknown fields. Default: any field
+    :raises YTMusicUserError: if ``lazy`` and ``fields`` are both set, or a field is unknown
+    """
+    if fields is None:
+        return parse if lazy else None
+    if lazy:
+        raise YTMusicUserError("fields cannot be combined with lazy, lazy results only parse the fields read")
+    if known_fields is not None and (unknown := [field for field in fields if field not in known_fields]):
+        raise YTMusicUserError(
+            f"Unknown fields {', '.join(unknown)}. Allowed fields: {', '.join(known_fields)}"
+        )
+
+    def parse_projected(*args: Any) -> JsonDict | None:
+        result = parse(*args)
+        return None if result is None else result.project(fields)
+
+    return parse_projected
@@ -1,5 +1,6 @@
 """commonly used navigation paths"""
 
+from collections.abc import Callable
 from typing import Any, Literal, overload
 
 from ytmusicapi.type_alias import JsonDict, JsonList
@@ -145,6 +146,48 @@ def nav(root: JsonDict | None, items: list[Any], none_if_absent: bool = False) -
     return root
 
 
+@overload
+def compile_path(
+    items: list[Any], none_if_absent: Literal[False] = False
+) -> Callable[[JsonDict | None], Any]:
+    """overload for mypy only"""
+
+
+@overload
+def compile_path(
+    items: list[Any], none_if_absent: Literal[True] = True
+) -> Callable[[JsonDict | None], Any | None]:
+    """overload for mypy only"""
+
+
+def compile_path(items: list[Any], none_if_absent: bool = False) -> Callable[[JsonDict | None], Any | None]:
+    """
+    Compiles a navigation path into a getter, which is equivalent to ``nav(root, items, none_if_absent)``.
+
+    The getter performs all lookups in a single generated expression, instead of iterating
+    the path on every call. Use it for paths which are navigated for every item of a response.
+    """
+    if not all(isinstance(key, str | int) for key in items):
+        raise TypeError(f"Path {items!r} may only contain dictionary keys and list indices")
+
+    lookups = "".join(f"[{key!r}]" for key in items)
+    fallback = "return None" if none_if_absent else "return nav(root, items)"  # raises a descriptive error
+    source = (
+        "def get(root):\n"
+        "    if root is None:\n"
+        "        return None\n"
+        "    try:\n"
+        f"        return root{lookups}\n"
+        "    except (KeyError, IndexError):\n"
+        f"        {fallback}\n"
+    )
+    namespace: dict[str, Any] = {"nav": nav, "items": list(items)}
+    exec(source, namespace)  # noqa: S102 - the source only contains the repr of str and int keys
+    getter: Callable[[JsonDict | None], Any | None] = namespace["get"]
+    getter.__qualname__ = getter.__name__ = f"get{lookups}"
+    return getter
+
+
 def find_object_by_key(
     object_list: JsonList, key: str, nested: str | None = None, is_key: bool = False
 ) -> JsonDict | None:
@@ -165,3 +208,13 @@ def find_objects_by_key(object_list: JsonList, key: str, nested: str | None = No
         if key in item:
             objects.append(item)
     return objects
+
+
+# compiled getters for paths that are navigated for every item of a response, see compile_path
+nav_menu_items = compile_path(MENU_ITEMS)
+nav_play_button = compile_path(PLAY_BUTTON, True)
+nav_browse_id = compile_path(NAVIGATION_BROWSE_ID, True)
+nav_text_run = compile_path(TEXT_RUN, True)
+nav_icon_type = compile_path(ICON_TYPE, True)
+nav_thumbnails = compile_path(THUMBNAILS, True)
+nav_badge_label = compile_path(BADGE_LABEL, True)
@@ -46,14 +46,15 @@ def get_item_text(item: JsonDict, index: int, run_index: int = 0, none_if_absent
 
 
 def get_flex_column_item(item: JsonDict, index: int) -> JsonDict | None:
-    if (
-        len(item["flexColumns"]) <= index
-        or "text" not in item["flexColumns"][index]["musicResponsiveListItemFlexColumnRenderer"]
-        or "runs" not in item["flexColumns"][index]["musicResponsiveListItemFlexColumnRenderer"]["text"]
-    ):
+    flex_columns = item["flexColumns"]
+    if len(flex_columns) <= index:
+        return None
+
+    column = flex_columns[index]["musicResponsiveListItemFlexColumnRenderer"]
+    if "text" not in column or "runs" not in column["text"]:
         return None
 
-    return typing.cast(JsonDict, item["flexColumns"][index]["musicResponsiveListItemFlexColumnRenderer"])
+    return typing.cast(JsonDict, column)
 
 
 def get_fixed_column_item(item: JsonDict, index: int) -> JsonDict | None:
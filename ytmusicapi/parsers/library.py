@@ -1,5 +1,11 @@
 from ytmusicapi.continuations import get_continuations
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import (
+    JsonDict,
+    JsonList,
+    ParseFuncType,
+    ParsePlaylistItemFuncType,
+    RequestFuncType,
+)
 
 from ._utils import *
 from .browsing import parse_content_list
@@ -106,10 +112,13 @@ def pop_songs_random_mix(results: JsonDict | None) -> None:
         results["contents"].pop(0)
 
 
-def parse_library_songs(response: JsonDict) -> JsonDict:
+def parse_library_songs(response: JsonDict, parse_item: ParsePlaylistItemFuncType | None = None) -> JsonDict:
     results = get_library_contents(response, MUSIC_SHELF)
     pop_songs_random_mix(results)
-    return {"results": results, "parsed": parse_playlist_items(results["contents"]) if results else results}
+    return {
+        "results": results,
+        "parsed": parse_playlist_items(results["contents"], parse_item=parse_item) if results else results,
+    }
 
 
 def get_library_contents(response: JsonDict, renderer: list[str]) -> JsonDict | None:
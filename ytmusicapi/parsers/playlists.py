@@ -1,13 +1,31 @@
 import re
+from concurrent.futures import Executor
+from typing import NamedTuple
 
 from ytmusicapi.continuations import *
 from ytmusicapi.helpers import sum_total_duration
 from ytmusicapi.models.content.enums import VoteStatus
-from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncBodyType
+from ytmusicapi.type_alias import (
+    JsonDict,
+    JsonList,
+    ParseFuncType,
+    ParsePlaylistItemFuncType,
+    RequestFuncBodyType,
+)
 
 from ..helpers import to_int
 from .songs import *
 
+_MENU_SERVICE = compile_path(MENU_SERVICE)
+_SET_VIDEO_ID = compile_path(["playlistEditEndpoint", "actions", 0, "setVideoId"], True)
+_REMOVED_VIDEO_ID = compile_path(["playlistEditEndpoint", "actions", 0, "removedVideoId"], True)
+_MENU_NAVIGATION_BROWSE_ID = compile_path([MNIR, *NAVIGATION_BROWSE_ID], True)
+_MENU_LIKE_STATUS = compile_path(MENU_LIKE_STATUS, True)
+_MENU_VIDEO_TYPE = compile_path([*MENU_ITEMS, 0, MNIR, "navigationEndpoint", *NAVIGATION_VIDEO_TYPE], True)
+_BROWSE_PAGE_TYPE = compile_path(["browseEndpoint", *PAGE_TYPE])
+_ENGAGEMENT_BAR = compile_path(ENGAGEMENT_BAR, True)
+_TRACK_NUMBER = compile_path(["index", *RUN_TEXT])
+
 
 def parse_playlist_header(response: JsonDict) -> JsonDict:
     playlist: JsonDict = {}
@@ -33,6 +51,36 @@ def parse_playlist_header(response: JsonDict) -> JsonDict:
     return playlist
 
 
+def get_playlist_header(header_data: JsonDict) -> JsonDict:
+    """responsive header of a playlist page, which is nested in the edit header of owned playlists"""
+    header: JsonDict
+    if EDITABLE_PLAYLIST_DETAIL_HEADER[0] in header_data:
+        header = nav(header_data, [*EDITABLE_PLAYLIST_DETAIL_HEADER, *HEADER, *RESPONSIVE_HEADER])
+    else:
+        header = nav(header_data, RESPONSIVE_HEADER)
+    return header
+
+
+def parse_playlist_summary(header_data: JsonDict | None) -> JsonDict:
+    """compact metadata of a playlist page, which changes only when the playlist is edited"""
+    if not header_data:
+        return {}
+    header = get_playlist_header(header_data)
+    meta = parse_playlist_header_meta(header)
+    description_shelf = nav(header, ["description", *DESCRIPTION_SHELF], True)
+    edit_header = nav(header_data, [EDITABLE_PLAYLIST_DETAIL_HEADER[0], "editHeader"], True)
+    return {
+        "title": meta["title"],
+        "description": (
+            "".join(run["text"] for run in description_shelf["description"]["runs"])
+            if description_shelf
+            else None
+        ),
+        "privacy": edit_header["musicPlaylistEditHeaderRenderer"]["privacy"] if edit_header else "PUBLIC",
+        "trackCount": meta["trackCount"],
+    }
+
+
 def parse_playlist_header_meta(header: JsonDict) -> JsonDict:
     playlist_meta = {
         "views": None,
@@ -93,8 +141,20 @@ def parse_playlist_header_meta(header: JsonDict) -> JsonDict:
     return playlist_meta
 
 
+def is_audio_playlist(playlistId: str, response: JsonDict) -> bool:
+    """whether the response is of an OLA audio playlist without a playlist header,
+    whose tracks are parsed by :py:func:`parse_audio_playlist`"""
+    is_ola = playlistId.startswith(("OLA", "VLOLA"))
+    return is_ola and not nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM], True)
+
+
 def parse_audio_playlist(
-    response: JsonDict, limit: int | None, request_func: RequestFuncBodyType
+    response: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    executor: Executor | None = None,
+    cursor: str | None = None,
+    parse_item: ParsePlaylistItemFuncType | None = None,
 ) -> JsonDict:
     playlist: JsonDict = {
         "owned": False,
@@ -113,32 +173,70 @@ def parse_audio_playlist(
     playlist["id"] = nav(content_data, ["targetId"])
 
     playlist["tracks"] = []
+    playlist["cursor"] = None
     if "contents" in content_data:
-        playlist["tracks"] = parse_playlist_items(content_data["contents"])
-
-        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents)
-        playlist["tracks"].extend(get_continuations_2025(content_data, limit, request_func, parse_func))
+        playlist["tracks"], playlist["cursor"] = parse_playlist_tracks(
+            content_data, limit, request_func, executor=executor, cursor=cursor, parse_item=parse_item
+        )
 
     playlist["trackCount"] = len(playlist["tracks"])
 
-    playlist["title"] = playlist["tracks"][0]["album"]["name"]
+    # the tracks may be projected to fields without the album
+    first_item = nav(content_data, ["contents", 0, MRLIR], True)
+    first_track = parse_playlist_item(first_item) if first_item else None
+    playlist["title"] = nav(first_track, ["album", "name"], True)
 
     playlist["duration_seconds"] = sum_total_duration(playlist)
     return playlist
 
 
+def parse_playlist_tracks(
+    content_data: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    is_collaborative: bool = False,
+    executor: Executor | None = None,
+    cursor: str | None = None,
+    parse_item: ParsePlaylistItemFuncType | None = None,
+) -> tuple[JsonList, str | None]:
+    """
+    Parses the tracks of a playlist shelf and requests their continuations
+
+    :param cursor: cursor returned by an earlier call, to continue with the tracks following it
+        instead of the first page
+    :param parse_item: parser of each track, see :py:func:`parse_playlist_items`
+    :return: the tracks and the cursor of the page following them, or None if there are no further pages
+    """
+    parse_func: ParseFuncType = lambda contents: parse_playlist_items(
+        contents, is_collaborative=is_collaborative, parse_item=parse_item
+    )
+    tracks = parse_func(content_data["contents"]) if cursor is None else []
+    next_cursor = cursor if cursor is not None else get_continuation_token(content_data["contents"])
+    for contents, next_cursor in iter_continuations_2025(
+        content_data, request_func, parse_func, limit, executor, cursor
+    ):
+        tracks.extend(contents)
+    return tracks, next_cursor
+
+
 def parse_playlist_items(
     results: JsonList,
     is_album: bool = False,
     is_collaborative: bool = False,
+    parse_item: ParsePlaylistItemFuncType | None = None,
 ) -> JsonList:
+    """
+    :param parse_item: parser of each item taking the renderer, ``is_album`` and ``is_collaborative``,
+        which returns None for deleted songs. Default: :py:func:`parse_playlist_item`
+    """
+    parse_item = parse_item or parse_playlist_item
     songs = []
     for result in results:
         if MRLIR not in result:
             continue
         data = result[MRLIR]
-        song = parse_playlist_item(data, is_album, is_collaborative)
-        if song:
+        song = parse_item(data, is_album, is_collaborative)
+        if song is not None:
             songs.append(song)
 
     return songs
@@ -149,42 +247,113 @@ def parse_playlist_item(
     is_album: bool = False,
     is_collaborative: bool = False,
 ) -> JsonDict | None:
-    videoId = setVideoId = creditsBrowseId = None
+    videoId, setVideoId, creditsBrowseId = parse_menu_ids(data)
     like = None
 
-    # if the item has a menu, find its setVideoId
+    song_menu_data = {"inLibrary": None, "pinnedToListenAgain": None} | parse_song_menu_data(data)
+
+    # if item is not playable, the videoId was retrieved above
+    if (play_video_id := parse_play_video_id(data)) is not None:
+        videoId = play_video_id
+
+        if "menu" in data:
+            like = _MENU_LIKE_STATUS(data)
+
+    isAvailable = parse_is_available(data)
+    columns = parse_column_indexes(data, isAvailable, is_album, is_collaborative)
+
+    title = get_item_text(data, columns.title) if columns.title is not None else None
+    if title == "Song deleted":
+        return None
+
+    artists = parse_song_artists(data, columns.artist) if columns.artist is not None else None
+
+    album = parse_song_album(data, columns.album) if columns.album is not None else None
+
+    views = get_item_text(data, 2) if is_album else None
+
+    duration = parse_item_duration(data, columns.duration)
+
+    thumbnails = nav_thumbnails(data)
+
+    isExplicit = nav_badge_label(data) is not None
+
+    videoType = parse_video_type(data)
+
+    song = {
+        "videoId": videoId,
+        "title": title,
+        "artists": artists,
+        "album": album,
+        "likeStatus": like,
+        **(song_menu_data),
+        "thumbnails": thumbnails,
+        "isAvailable": isAvailable,
+        "isExplicit": isExplicit,
+        "videoType": videoType,
+        "views": views,
+        "communityVoteStatus": parse_community_vote_status(data),
+    }
+
+    if is_album:
+        song["trackNumber"] = parse_track_number(data) if isAvailable else None
+
+    if duration:
+        song["duration"] = duration
+        song["duration_seconds"] = parse_duration(duration)
+    if setVideoId:
+        song["setVideoId"] = setVideoId
+    if creditsBrowseId:
+        song["creditsBrowseId"] = creditsBrowseId
+
+    return song
+
+
+class ColumnIndexes(NamedTuple):
+    """indexes of the flex columns of a playlist item, None if the item has no such column"""
+
+    title: int | None
+    artist: int | None
+    album: int | None
+    duration: int | None
+
+
+def parse_menu_ids(data: JsonDict) -> tuple[str | None, str | None, str | None]:
+    """videoId, setVideoId and creditsBrowseId of a playlist item, as found in its menu"""
+    videoId = setVideoId = creditsBrowseId = None
     if "menu" in data:
-        for item in nav(data, MENU_ITEMS):
+        for item in nav_menu_items(data):
             if "menuServiceItemRenderer" in item:
-                menu_service = nav(item, MENU_SERVICE)
+                menu_service = _MENU_SERVICE(item)
                 if "playlistEditEndpoint" in menu_service:
-                    setVideoId = nav(menu_service, ["playlistEditEndpoint", "actions", 0, "setVideoId"], True)
-                    videoId = nav(
-                        menu_service, ["playlistEditEndpoint", "actions", 0, "removedVideoId"], True
-                    )
+                    setVideoId = _SET_VIDEO_ID(menu_service)
+                    videoId = _REMOVED_VIDEO_ID(menu_service)
             elif MNIR in item:
-                maybe_credits_browse_id = nav(item, [MNIR, *NAVIGATION_BROWSE_ID], True)
+                maybe_credits_browse_id = _MENU_NAVIGATION_BROWSE_ID(item)
                 if maybe_credits_browse_id and maybe_credits_browse_id.startswith("MPTC"):
                     creditsBrowseId = maybe_credits_browse_id
+    return videoId, setVideoId, creditsBrowseId
 
-    song_menu_data = {"inLibrary": None, "pinnedToListenAgain": None} | parse_song_menu_data(data)
 
-    # if item is not playable, the videoId was retrieved above
-    if nav(data, PLAY_BUTTON, none_if_absent=True) is not None and "playNavigationEndpoint" in nav(
-        data, PLAY_BUTTON
-    ):
-        videoId = nav(data, PLAY_BUTTON)["playNavigationEndpoint"]["watchEndpoint"]["videoId"]
+def parse_play_video_id(data: JsonDict) -> str | None:
+    """videoId of the play button, or None if the item is not playable"""
+    play_button = nav_play_button(data)
+    if play_button is not None and "playNavigationEndpoint" in play_button:
+        videoId: str = play_button["playNavigationEndpoint"]["watchEndpoint"]["videoId"]
+        return videoId
+    return None
 
-        if "menu" in data:
-            like = nav(data, MENU_LIKE_STATUS, True)
 
-    isAvailable = True
-    if "musicItemRendererDisplayPolicy" in data:
-        isAvailable = data["musicItemRendererDisplayPolicy"] != "MUSIC_ITEM_RENDERER_DISPLAY_POLICY_GREY_OUT"
+def parse_is_available(data: JsonDict) -> bool:
+    return data.get("musicItemRendererDisplayPolicy") != "MUSIC_ITEM_RENDERER_DISPLAY_POLICY_GREY_OUT"
 
+
+def parse_column_indexes(
+    data: JsonDict, is_available: bool, is_album: bool = False, is_collaborative: bool = False
+) -> ColumnIndexes:
     # For unavailable items and for album track lists indexes are preset,
     # because meaning of the flex column cannot be reliably found using navigationEndpoint
-    use_preset_columns = True if isAvailable is False or is_album is True else None
+    use_preset_columns = True if is_available is False or is_album is True else None
 
     title_index = 0 if use_preset_columns else None
     artist_index = 1 if use_preset_columns else None
@@ -195,11 +364,10 @@ def parse_playlist_item(
     unrecognized_index = None
 
     for index in range(len(data["flexColumns"])):
-        flex_column_item = get_flex_column_item(data, index)
-        navigation_endpoint = nav(flex_column_item, [*TEXT_RUN, "navigationEndpoint"], True)
+        run = nav_text_run(get_flex_column_item(data, index))
+        navigation_endpoint = run.get("navigationEndpoint") if run is not None else None
 
         if not navigation_endpoint:
-            run = nav(flex_column_item, TEXT_RUN, True)
             if run and "text" in run:
                 parsed = parse_song_run(run)
                 if parsed["type"] == "duration":
@@ -212,15 +380,7 @@ def parse_playlist_item(
         if "watchEndpoint" in navigation_endpoint:
             title_index = index
         elif "browseEndpoint" in navigation_endpoint:
-            page_type = nav(
-                navigation_endpoint,
-                [
-                    "browseEndpoint",
-                    "browseEndpointContextSupportedConfigs",
-                    "browseEndpointContextMusicConfig",
-                    "pageType",
-                ],
-            )
+            page_type = _BROWSE_PAGE_TYPE(navigation_endpoint)
 
             # MUSIC_PAGE_TYPE_ARTIST for regular songs, MUSIC_PAGE_TYPE_UNKNOWN for uploads
             if page_type == "MUSIC_PAGE_TYPE_ARTIST" or page_type == "MUSIC_PAGE_TYPE_UNKNOWN":
@@ -241,72 +401,38 @@ def parse_playlist_item(
     if artist_index is None and user_channel_indexes:
         artist_index = user_channel_indexes[-1]
 
-    title = get_item_text(data, title_index) if title_index is not None else None
-    if title == "Song deleted":
-        return None
-
-    artists = parse_song_artists(data, artist_index) if artist_index is not None else None
-
-    album = parse_song_album(data, album_index) if album_index is not None else None
+    return ColumnIndexes(title_index, artist_index, album_index, duration_index)
 
-    views = get_item_text(data, 2) if is_album else None
 
+def parse_item_duration(data: JsonDict, duration_index: int | None) -> str | None:
+    """duration text of a playlist item, from its fixed column or the flex column at duration_index"""
     duration = get_item_text(data, duration_index) if duration_index else None
     if "fixedColumns" in data:
-        if "simpleText" in nav(get_fixed_column_item(data, 0), ["text"]):
-            duration = nav(get_fixed_column_item(data, 0), ["text", "simpleText"])
+        fixed_column_item = get_fixed_column_item(data, 0)
+        if "simpleText" in nav(fixed_column_item, ["text"]):
+            duration = nav(fixed_column_item, ["text", "simpleText"])
         else:
-            duration = nav(get_fixed_column_item(data, 0), TEXT_RUN_TEXT)
+            duration = nav(fixed_column_item, TEXT_RUN_TEXT)
+    return duration
 
-    thumbnails = nav(data, THUMBNAILS, True)
 
-    isExplicit = nav(data, BADGE_LABEL, True) is not None
+def parse_video_type(data: JsonDict) -> str | None:
+    return _MENU_VIDEO_TYPE(data)
 
-    videoType = nav(
-        data,
-        [*MENU_ITEMS, 0, MNIR, "navigationEndpoint", *NAVIGATION_VIDEO_TYPE],
-        True,
-    )
 
-    voting_status = nav(data, ENGAGEMENT_BAR, none_if_absent=True)
+def parse_track_number(data: JsonDict) -> int:
+    return int(_TRACK_NUMBER(data))
 
-    community_vote_status = (
-        None
-        if voting_status is None
-        else {
-            "netVoteValue": voting_status["votes"],
-            "status": VoteStatus(voting_status["status"]),
-        }
-    )
 
-    song = {
-        "videoId": videoId,
-        "title": title,
-        "artists": artists,
-        "album": album,
-        "likeStatus": like,
-        **(song_menu_data),
-        "thumbnails": thumbnails,
-        "isAvailable": isAvailable,
-        "isExplicit": isExplicit,
-        "videoType": videoType,
-        "views": views,
-        "communityVoteStatus": community_vote_status,
+def parse_community_vote_status(data: JsonDict) -> JsonDict | None:
+    voting_status = _ENGAGEMENT_BAR(data)
+    if voting_status is None:
+        return None
+    return {
+        "netVoteValue": voting_status["votes"],
+        "status": VoteStatus(voting_status["status"]),
     }
 
-    if is_album:
-        song["trackNumber"] = int(nav(data, ["index", "runs", 0, "text"])) if isAvailable else None
-
-    if duration:
-        song["duration"] = duration
-        song["duration_seconds"] = parse_duration(duration)
-    if setVideoId:
-        song["setVideoId"] = setVideoId
-    if creditsBrowseId:
-        song["creditsBrowseId"] = creditsBrowseId
-
-    return song
-
 
 def validate_playlist_id(playlistId: str) -> str:
     return playlistId if not playlistId.startswith("VL") else playlistId[2:]
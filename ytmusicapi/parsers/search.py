@@ -1,3 +1,6 @@
+from collections.abc import Callable, Collection
+from typing import Any
+
 from ytmusicapi.type_alias import JsonDict, JsonList
 
 from ..helpers import to_int
@@ -6,6 +9,11 @@ from .albums import parse_album_playlistid_if_exists
 from .artists import parse_artists_runs
 from .songs import *
 
+_PLAY_NAVIGATION = compile_path([*PLAY_BUTTON, "playNavigationEndpoint"], True)
+_PLAY_VIDEO_ID = compile_path([*PLAY_BUTTON, "playNavigationEndpoint", *WATCH_VIDEO_ID], True)
+_PLAY_VIDEO_TYPE = compile_path([*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE], True)
+_LIVE_BADGE = compile_path(["badges", 0, "liveBadgeRenderer"], True)
+
 ALL_RESULT_TYPES = [
     "album",
     "artist",
@@ -83,15 +91,33 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
     return search_result
 
 
-def parse_search_result(data: JsonDict, result_type: str | None, category: str | None) -> JsonDict:
+#: keys of the song menu data, see :py:func:`~ytmusicapi.parsers.songs.parse_song_menu_data`
+_MENU_DATA_KEYS = ("inLibrary", "feedbackTokens", "pinnedToListenAgain", "listenAgainFeedbackTokens")
+
+#: keys parsed from the runs of the second and third flex column of songs, videos and albums
+_SONG_INFO_KEYS = ("artists", "album", "views", "duration", "duration_seconds", "year")
+
+
+def parse_search_result(
+    data: JsonDict, result_type: str | None, category: str | None, fields: Collection[str] | None = None
+) -> JsonDict:
+    """
+    :param fields: Only the keys needed for these fields are guaranteed to be parsed. The menu data,
+        song runs, badges and thumbnails are skipped if none of their keys are requested.
+        Default: parse all keys
+    """
+
+    def wanted(*keys: str) -> bool:
+        return fields is None or any(key in fields for key in keys)
+
     default_offset = (not result_type or result_type == "album") * 2
     search_result: JsonDict = {"category": category}
-    video_type = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE], True)
+    video_type = _PLAY_VIDEO_TYPE(data)
 
     # determine result type based on browseId
     #  if there was no category title (i.e. for extra results in Top Result)
     if not result_type:
-        if browse_id := nav(data, NAVIGATION_BROWSE_ID, True):
+        if browse_id := nav_browse_id(data):
             mapping = {
                 "VM": "playlist",
                 "RD": "playlist",
@@ -118,11 +144,12 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
 
     if result_type == "artist":
         search_result["artist"] = get_item_text(data, 0)
-        parse_menu_playlists(data, search_result)
+        if wanted("shuffleId", "radioId"):
+            parse_menu_playlists(data, search_result)
 
     elif result_type == "album":
         search_result["type"] = get_item_text(data, 1)
-        play_navigation = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint"], True)
+        play_navigation = _PLAY_NAVIGATION(data)
         search_result["playlistId"] = parse_album_playlistid_if_exists(play_navigation)
 
     elif result_type == "playlist":
@@ -146,10 +173,11 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
 
     elif result_type == "song":
         search_result["album"] = None
-        search_result.update(parse_song_menu_data(data))
+        if wanted(*_MENU_DATA_KEYS):
+            search_result.update(parse_song_menu_data(data))
 
     elif result_type == "upload":
-        browse_id = nav(data, NAVIGATION_BROWSE_ID, True)
+        browse_id = nav_browse_id(data)
         if not browse_id:  # song result
             flex_items = [nav(get_flex_column_item(data, i), ["text", "runs"], True) for i in range(2)]
             if flex_items[0]:
@@ -177,12 +205,10 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
                 search_result["resultType"] = "album"
 
     if result_type in ["song", "video", "episode"]:
-        search_result["videoId"] = nav(
-            data, [*PLAY_BUTTON, "playNavigationEndpoint", "watchEndpoint", "videoId"], True
-        )
+        search_result["videoId"] = _PLAY_VIDEO_ID(data)
         search_result["videoType"] = video_type
 
-    if result_type in ["song", "video", "album"]:
+    if result_type in ["song", "video", "album"] and wanted(*_SONG_INFO_KEYS):
         search_result["duration"] = None
         search_result["year"] = None
         flex_item = get_flex_column_item(data, 1)
@@ -190,27 +216,28 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
             raise ValueError("Expected flex column item at index 1")
         runs = flex_item["text"]["runs"]
         if flex_item2 := get_flex_column_item(data, 2):
-            runs.extend([{"text": ""}, *flex_item2["text"]["runs"]])  # first item is a dummy separator
+            runs = [*runs, {"text": ""}, *flex_item2["text"]["runs"]]  # first item is a dummy separator
         song_info = parse_song_runs(runs, skip_type_spec=True)
         search_result.update(song_info)
 
     if result_type in ["artist", "album", "playlist", "profile", "podcast"]:
-        search_result["browseId"] = nav(data, NAVIGATION_BROWSE_ID, True)
+        search_result["browseId"] = nav_browse_id(data)
 
-    if result_type in ["song", "album"]:
-        search_result["isExplicit"] = nav(data, BADGE_LABEL, True) is not None
+    if result_type in ["song", "album"] and wanted("isExplicit"):
+        search_result["isExplicit"] = nav_badge_label(data) is not None
 
-    if result_type in ["episode"]:
+    if result_type in ["episode"] and wanted("live", "date", "podcast"):
         flex_item = get_flex_column_item(data, 1)
         runs = nav(flex_item, TEXT_RUNS)[default_offset:]
         has_date = int(len(runs) > 1)
-        search_result["live"] = bool(nav(data, ["badges", 0, "liveBadgeRenderer"], True))
+        search_result["live"] = bool(_LIVE_BADGE(data))
         if has_date:
             search_result["date"] = runs[0]["text"]
 
         search_result["podcast"] = parse_id_name(runs[has_date * 2])
 
-    search_result["thumbnails"] = nav(data, THUMBNAILS, True)
+    if wanted("thumbnails"):
+        search_result["thumbnails"] = nav_thumbnails(data)
 
     return search_result
 
@@ -219,8 +246,14 @@ def parse_search_results(
     results: JsonList,
     resultType: str | None = None,
     category: str | None = None,
+    parse_item: Callable[[JsonDict, str | None, str | None], Any] | None = None,
 ) -> JsonList:
-    return [parse_search_result(result[MRLIR], resultType, category) for result in results]
+    """
+    :param parse_item: parser of each result taking the renderer, ``resultType`` and ``category``.
+        Default: :py:func:`parse_search_result`
+    """
+    parse_item = parse_item or parse_search_result
+    return [parse_item(result[MRLIR], resultType, category) for result in results]
 
 
 def get_search_params(filter: str | None, scope: str | None, ignore_spelling: bool) -> str | None:
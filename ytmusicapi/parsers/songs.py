@@ -18,15 +18,26 @@ def parse_song_artists(data: JsonDict, index: int) -> JsonList:
 
 # leading views word ("조회수 17억회", "播放次數：4505") or bidi mark (ur), up to the first digit  # noqa: RUF003
 VIEWS_PREFIX = re.compile(r"^\D*?[\s:\uff1a\u200e-\u200f\u202a-\u202e]")
+LATIN = re.compile(r"[a-zA-Z]")
+DIGIT = re.compile(r"^\d")
+DURATION = re.compile(r"^(\d+:)*\d+:\d+$")
+YEAR = re.compile(r"^\d{4}$")
+
+_TEXT_RUN_BROWSE_ID = compile_path(TEXT_RUN + NAVIGATION_BROWSE_ID, True)
+_ICON_TYPE_DEFAULT = compile_path(["defaultIcon", "iconType"], True)
+_FEEDBACK_TOKENS = {
+    endpoint_type: compile_path([endpoint_type, *FEEDBACK_TOKEN], True)
+    for endpoint_type in ["defaultServiceEndpoint", "toggledServiceEndpoint", "serviceEndpoint"]
+}
 
 
 def parse_views(text: str) -> str | None:
     # only for non-latin scripts: "Maroon 5" is indistinguishable from a prefixed count
     prefixed = 0
-    if not re.search(r"[a-zA-Z]", text):
+    if not LATIN.search(text):
         text, prefixed = VIEWS_PREFIX.subn("", text)
 
-    if not re.match(r"^\d", text):
+    if not DIGIT.match(text):
         return None
 
     # a bare ASCII token like "2Pac" is an artist, not a view count with a stripped word
@@ -43,17 +54,17 @@ def parse_song_run(run: JsonDict) -> JsonDict:
     text = run["text"]
 
     if "navigationEndpoint" in run:  # artist or album
-        item = {"name": text, "id": nav(run, NAVIGATION_BROWSE_ID, True)}
+        item = {"name": text, "id": nav_browse_id(run)}
 
         if item["id"] and (item["id"].startswith("MPRE") or "release_detail" in item["id"]):  # album
             return {"type": "album", "data": item}
         else:  # artist
             return {"type": "artist", "data": item}
     else:
-        if re.match(r"^(\d+:)*\d+:\d+$", text):
+        if DURATION.match(text):
             return {"type": "duration", "data": text}
 
-        elif re.match(r"^\d{4}$", text):
+        elif YEAR.match(text):
             return {"type": "year", "data": text}
 
         elif (views := parse_views(text)) is not None:
@@ -83,10 +94,7 @@ def parse_song_runs(runs: JsonList, skip_type_spec: bool = False) -> JsonDict:
     ):
         runs = runs[2:]
 
-    for i, run in list(enumerate(runs)):
-        if i % 2:  # uneven items are always separators
-            continue
-
+    for run in runs[::2]:  # uneven items are always separators
         parsed_run = parse_song_run(run)
         data = parsed_run["data"]
         match parsed_run["type"]:
@@ -108,7 +116,7 @@ def parse_song_runs(runs: JsonList, skip_type_spec: bool = False) -> JsonDict:
 
 def parse_song_album(data: JsonDict, index: int) -> JsonDict | None:
     flex_item = get_flex_column_item(data, index)
-    browse_id = nav(flex_item, TEXT_RUN + NAVIGATION_BROWSE_ID, True)
+    browse_id = _TEXT_RUN_BROWSE_ID(flex_item)
     return None if not flex_item else {"name": get_item_text(data, index), "id": browse_id}
 
 
@@ -136,20 +144,18 @@ def parse_song_menu_data(data: JsonDict) -> JsonDict:
         return {}
 
     song_data: JsonDict = {}
-    for item in nav(data, MENU_ITEMS):
-        menu_item = nav(item, [TOGGLE_MENU], True) or nav(item, ["menuServiceItemRenderer"], True)
+    for item in nav_menu_items(data):
+        menu_item = item.get(TOGGLE_MENU) or item.get("menuServiceItemRenderer")
         if menu_item is None:
             continue
 
         song_data["inLibrary"] = song_data.get("inLibrary", False)
         song_data["pinnedToListenAgain"] = song_data.get("pinnedToListenAgain", False)
 
-        current_icon_type = nav(menu_item, ["defaultIcon", "iconType"], True) or nav(
-            menu_item, ["icon", "iconType"], True
-        )
+        current_icon_type = _ICON_TYPE_DEFAULT(menu_item) or nav_icon_type(menu_item)
 
         def feedback_token(endpoint_type: str, menu_item: JsonDict = menu_item) -> str | None:
-            return nav(menu_item, [endpoint_type, *FEEDBACK_TOKEN], True)
+            return _FEEDBACK_TOKENS[endpoint_type](menu_item)
 
         # YTM signals the current state with isToggled instead of swapping the default/toggled icons
         is_toggled = bool(menu_item.get("isToggled"))
@@ -0,0 +1,306 @@
+"""a pool of clients for several accounts, with a rate limit per account
+
+A :class:`ClientPool` owns one :class:`~ytmusicapi.YTMusic` per account and sends each call to the
+account that can send a request soonest. Every request of an account, including continuations and the
+requests of ``iter_*`` generators and executors, waits for a token of the account's :class:`TokenBucket`.
+Responses with status 429 or 503 pause the account for the time given by their ``Retry-After`` header,
+or for an exponentially growing backoff without it::
+
+    pool = ClientPool({user: YTMusic("browser.json", user=user) for user in brand_accounts}, rate=2, burst=5)
+    playlists = list(executor.map(pool.get_playlist, playlist_ids))
+    pool.stats()  # queue depth, throttled responses and pauses of each account
+
+Calls can be pinned to an account with ``account=``, i.e. for library methods.
+Only synchronous clients can be pooled.
+"""
+
+import functools
+import inspect
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+from requests import Response
+
+from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.retry import retry_after
+from ytmusicapi.transport import Transport, UploadData
+from ytmusicapi.type_alias import JsonDict
+from ytmusicapi.ytmusic import YTMusic
+
+#: status codes asking the client to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Allows ``rate`` requests per second on average, in bursts of up to ``burst`` requests
+
+    Tokens are reserved in order, so waiting requests are served first come, first served.
+    Thread-safe.
+
+    :param rate: Tokens added per second
+    :param burst: Maximum number of tokens, which are available at once after a pause
+    :param clock: Monotonic clock in seconds
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise YTMusicUserError("The rate must be positive and the burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(float(self.burst), self._tokens + (now - start) * self.rate)
+            self._updated = now
+
+    def delay(self) -> float:
+        """Returns the seconds until the next token is available, without reserving it"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return self._wait(now, self._tokens)
+
+    def reserve(self) -> float:
+        """Reserves the next token and returns the seconds to wait before it may be used"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = self._wait(now, self._tokens)
+            self._tokens -= 1
+            return wait
+
+    def _wait(self, now: float, tokens: float) -> float:
+        start = max(now, self._paused_until)
+        return start - now + max(0.0, (1 - tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Adds no tokens for the next ``seconds``. Tokens reserved before are still owed after the pause"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if now + seconds > self._paused_until:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = self._paused_until = now + seconds
+
+    @property
+    def paused_until(self) -> float:
+        """clock time until which no tokens are added"""
+        return self._paused_until
+
+
+@dataclass
+class AccountStats:
+    """Snapshot of the activity of an account in a :class:`ClientPool`"""
+
+    #: requests waiting for a token
+    queue_depth: int = 0
+    #: calls dispatched to the account which have not returned yet
+    in_flight: int = 0
+    calls: int = 0
+    requests: int = 0
+    #: responses with a status in :data:`THROTTLE_STATUS_CODES`
+    throttled: int = 0
+    #: total seconds requests waited for tokens
+    waited: float = 0.0
+    #: seconds until the account is no longer paused, 0 if it is not paused
+    paused_for: float = 0.0
+
+
+class RateLimitedTransport:
+    """Sends requests through another transport once a token of ``bucket`` is available
+
+    Pauses the bucket when a response asks to slow down, for the time given by its ``Retry-After``
+    header, or else for ``backoff`` seconds, doubled with each consecutive throttled response up to
+    ``max_backoff``.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        bucket: TokenBucket,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.transport = transport
+        self.bucket = bucket
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = AccountStats()
+        self._sleep = sleep
+        self._consecutive_throttles = 0
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        self._acquire()
+        return self._observe(self.transport.post(url, body, headers, cookies, proxies))
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        self._acquire()
+        return self._observe(self.transport.get(url, params, headers, cookies, proxies))
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        self._acquire()
+        return self._observe(self.transport.upload(url, data, headers, proxies))
+
+    def _acquire(self) -> None:
+        """Waits for a token of the bucket"""
+        wait = self.bucket.reserve()
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.waited += wait
+            self.stats.queue_depth += 1
+        try:
+            if wait > 0:
+                self._sleep(wait)
+        finally:
+            with self._lock:
+                self.stats.queue_depth -= 1
+
+    def _observe(self, response: Response) -> Response:
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            with self._lock:
+                self._consecutive_throttles = 0
+            return response
+        with self._lock:
+            self.stats.throttled += 1
+            self._consecutive_throttles += 1
+            backoff = min(self.max_backoff, self.backoff * 2 ** (self._consecutive_throttles - 1))
+        seconds = retry_after(response)
+        self.bucket.pause(backoff if seconds is None else seconds)
+        return response
+
+
+class ClientPool:
+    """
+    Dispatches calls across the clients of several accounts, each limited to ``rate`` requests per second.
+
+    Public methods of :class:`~ytmusicapi.YTMusic` can be called on the pool, and accept an additional
+    ``account`` argument to pin the call to an account. Otherwise the call is sent to the account whose
+    next token is available soonest, preferring the account with fewer calls in flight, and taking turns
+    among equal accounts.
+
+    The pool replaces the transport of each client with a :class:`RateLimitedTransport`,
+    so the clients should not be used outside of the pool.
+
+    :param clients: Clients by account name
+    :param rate: Requests per second allowed for each account
+    :param burst: Requests each account may send at once after being idle
+    :param backoff: Seconds to pause an account after a throttled response without ``Retry-After``,
+        doubled for each consecutive throttled response
+    :param max_backoff: Maximum seconds of an exponential backoff
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, YTMusic],
+        rate: float = 1.0,
+        burst: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not clients:
+            raise YTMusicUserError("A client pool needs at least one client")
+        if invalid := [name for name, client in clients.items() if not isinstance(client, YTMusic)]:
+            raise YTMusicUserError(f"The clients of {', '.join(invalid)} are not YTMusic instances")
+        self.clients = dict(clients)
+        self._clock = clock
+        self._transports: dict[str, RateLimitedTransport] = {}
+        for name, client in self.clients.items():
+            transport = RateLimitedTransport(
+                client._transport, TokenBucket(rate, burst, clock), backoff, max_backoff, sleep
+            )
+            client._transport = self._transports[name] = transport
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    def call(self, method: str, /, *args: Any, account: str | None = None, **kwargs: Any) -> Any:
+        """Calls a method of the client of ``account``, or of the account available soonest"""
+        if method.startswith("_") or not callable(getattr(YTMusic, method, None)):
+            raise YTMusicUserError(f"{method} is not a method of YTMusic")
+        if account is not None and account not in self.clients:
+            raise YTMusicUserError(f"Unknown account {account}, must be one of {', '.join(self.clients)}")
+        with self._lock:
+            name = account if account is not None else self._next_account()
+            stats = self._transports[name].stats
+            stats.calls += 1
+            stats.in_flight += 1
+        try:
+            result = getattr(self.clients[name], method)(*args, **kwargs)
+        except BaseException:
+            self._done(stats)
+            raise
+        if inspect.isgenerator(result):
+            return self._consume(result, stats)
+        self._done(stats)
+        return result
+
+    def _consume(self, generator: Iterator[Any], stats: AccountStats) -> Iterator[Any]:
+        """Yields from the generator of an ``iter_*`` method, which is in flight until it is closed"""
+        try:
+            yield from generator
+        finally:
+            self._done(stats)
+
+    def _done(self, stats: AccountStats) -> None:
+        with self._lock:
+            stats.in_flight -= 1
+
+    def _next_account(self) -> str:
+        names = list(self.clients)
+        offset = next(self._turn) % len(names)
+        names = names[offset:] + names[:offset]
+        return min(
+            names,
+            key=lambda name: (self._transports[name].bucket.delay(), self._transports[name].stats.in_flight),
+        )
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(YTMusic, name, None)):
+            raise AttributeError(name)
+        return functools.partial(self.call, name)
+
+    def stats(self) -> dict[str, AccountStats]:
+        """Returns a snapshot of the activity of each account"""
+        now = self._clock()
+        snapshot = {}
+        with self._lock:
+            for name, transport in self._transports.items():
+                with transport._lock:
+                    stats = replace(transport.stats)
+                stats.paused_for = max(0.0, transport.bucket.paused_until - now)
+                snapshot[name] = stats
+        return snapshot
+
+    @property
+    def queue_depth(self) -> int:
+        """number of requests waiting for a token across all accounts"""
+        return sum(transport.stats.queue_depth for transport in self._transports.values())
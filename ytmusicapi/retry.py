@@ -0,0 +1,158 @@
+"""retrying requests which failed for transient reasons
+
+Pass a :class:`RetryPolicy` as ``retry`` to resend requests after connection errors, timeouts and
+responses with status codes like 429 or 503, waiting for an exponentially growing, randomized delay,
+or for the time given by the ``Retry-After`` header of the response::
+
+    ytmusic = YTMusic(retry=RetryPolicy(max_attempts=5, backoff=1.0))
+    ytmusic.get_playlist("PL...", limit=None)
+    ytmusic.retry_stats.retries  # number of requests resent, by reason in retry_stats.reasons
+
+Requests to endpoints modifying data, i.e. adding tracks to a playlist, are only resent after a 429
+response, which the server rejected without processing it, unless ``retry_writes`` is set.
+Uploads are never resent, as their data may be streamed from a file.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests import Response
+
+#: status codes of transient errors retried by default
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+#: exceptions of transports retried by default
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (requests.ConnectionError, requests.Timeout)
+
+
+def retry_after(response: Response, now: float | None = None) -> float | None:
+    """Returns the seconds to wait given by the ``Retry-After`` header of a response, or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which requests to resend, how often, and how long to wait before each attempt"""
+
+    #: attempts per request including the first one
+    max_attempts: int = 4
+    status_codes: frozenset[int] = RETRY_STATUS_CODES
+    exceptions: tuple[type[Exception], ...] = RETRY_EXCEPTIONS
+    #: delay before the first retry in seconds, doubled for each further retry
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    #: fraction of the delay which is randomized, so that clients failing together do not retry together.
+    #: 1 waits for a random time between 0 and the delay, 0 for exactly the delay
+    jitter: float = 1.0
+    #: whether to wait for the time given by the ``Retry-After`` header instead of the backoff
+    respect_retry_after: bool = True
+    #: longest ``Retry-After`` to wait for. Responses asking to wait longer are not retried
+    max_retry_after: float = 120.0
+    #: whether requests modifying data are resent for any of the ``status_codes`` and ``exceptions``,
+    #: not only after a 429 response
+    retry_writes: bool = False
+    #: waits between attempts, replaced by :class:`~ytmusicapi.async_ytmusic.AsyncYTMusic` to not block
+    #: the event loop
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False, compare=False)
+
+    def delay(self, attempt: int, response: Response | None = None) -> float | None:
+        """Returns the seconds to wait after a failed ``attempt`` (starting at 1) before the next one,
+        or None if the request should not be retried"""
+        if attempt >= self.max_attempts:
+            return None
+        if response is not None and self.respect_retry_after:
+            seconds = retry_after(response)
+            if seconds is not None:
+                return seconds if seconds <= self.max_retry_after else None
+        delay = min(self.max_backoff, self.backoff * 2.0 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+@dataclass
+class RetryStats:
+    """Counters of the retries of a client, for monitoring. Updated from all threads using the client"""
+
+    #: requests sent at least once
+    requests: int = 0
+    #: requests resent
+    retries: int = 0
+    #: retries by reason, the status code or the name of the exception
+    reasons: Counter[str] = field(default_factory=Counter)
+    #: requests which failed after retries or whose ``Retry-After`` was too long
+    exhausted: int = 0
+    #: total seconds waited before retries
+    waited: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def _record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+            self.waited += delay
+
+    def _record_request(self, exhausted: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.exhausted += exhausted
+
+
+def send_with_retries(
+    send: Callable[[], Response], policy: RetryPolicy | None, stats: RetryStats, write: bool = False
+) -> tuple[Response, int]:
+    """
+    Sends a request until it succeeds or the policy gives up
+
+    :param send: Sends the request once
+    :param policy: Default: the request is sent once
+    :param stats: Counters to update
+    :param write: Whether the request modifies data
+    :return: The last response and the number of retries.
+        Responses with an error status are returned, exceptions of the last attempt are raised.
+    """
+    attempt = 1
+    while True:
+        try:
+            response = send()
+        except Exception as e:
+            if policy is None or (write and not policy.retry_writes) or not isinstance(e, policy.exceptions):
+                stats._record_request(exhausted=False)
+                raise
+            delay = policy.delay(attempt)
+            if delay is None:
+                stats._record_request(exhausted=True)
+                raise
+            reason = type(e).__name__
+        else:
+            status = response.status_code
+            if (
+                policy is None
+                or status not in policy.status_codes
+                or (write and not policy.retry_writes and status != 429)
+            ):
+                stats._record_request(exhausted=False)
+                return response, attempt - 1
+            delay = policy.delay(attempt, response)
+            if delay is None:
+                stats._record_request(exhausted=True)
+                return response, attempt - 1
+            reason = str(status)
+        stats._record_retry(reason, delay)
+        policy.sleep(delay)
+        attempt += 1
@@ -0,0 +1,59 @@
+"""coalescing of identical calls in flight
+
+When several threads send the same request at the same time, i.e. workers fetching a popular album,
+only the first one sends it and the others wait for its result. Calls are only coalesced while in flight,
+finished results are not kept, see :py:mod:`ytmusicapi.cache` for that.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def wait_for(future: "Future[T]") -> T:
+    """Blocks until the future is done and returns its result"""
+    return future.result()
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs a function once for concurrent calls with the same key, sharing its result or exception
+
+    :param wait: Waits for the future of the call in flight. Replaced by
+        :class:`~ytmusicapi.async_ytmusic.AsyncYTMusic` to wait without blocking the event loop
+    """
+
+    def __init__(self, wait: Callable[["Future[T]"], T] = wait_for):
+        self._wait = wait
+        self._flights: dict[Hashable, Future[T]] = {}
+        self._lock = threading.Lock()
+        #: number of calls which shared the result of a call in flight
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Returns the result of ``fn``, and whether it was shared with an identical call in flight"""
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if future is None:
+                future = self._flights[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return self._wait(future), True
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key)
+            future.set_exception(e)
+            raise
+        self._land(key)
+        future.set_result(result)
+        return result, False
+
+    def _land(self, key: Hashable) -> None:
+        with self._lock:
+            del self._flights[key]
@@ -0,0 +1,183 @@
+"""incremental synchronisation of playlists
+
+:py:meth:`~ytmusicapi.YTMusic.sync_playlist` compares a playlist with a compact :class:`PlaylistSnapshot` of
+an earlier sync and returns the next snapshot with a :class:`PlaylistDiff`, which lists the added, removed,
+moved and changed items, and the changes of the header. Snapshots can be stored as JSON in between::
+
+    snapshot, diff = ytmusic.sync_playlist(playlistId)
+    store(snapshot.to_dict())
+    ...
+    snapshot, diff = ytmusic.sync_playlist(playlistId, PlaylistSnapshot.from_dict(load()))
+    for position, track in diff.added: ...
+
+Pagination stops once a page matches the snapshot at the positions it must have if all edits happened
+before it, and the track count confirms that, so unchanged playlists and playlists with edits near the top
+only cost one or a few requests. Edits which keep the track count and only affect pages after the first
+matching one, like swapping two tracks at the end of a long playlist, are only found by a ``full`` sync.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, NamedTuple
+
+from ytmusicapi.helpers import longest_increasing_subsequence
+from ytmusicapi.type_alias import JsonDict
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotItem(NamedTuple):
+    """An item of a playlist, with the fields that change without the item being re-added"""
+
+    videoId: str | None
+    setVideoId: str | None
+    likeStatus: str | None = None
+    voteStatus: str | None = None
+    netVoteValue: int | None = None
+
+    @property
+    def key(self) -> str | None:
+        """identifies the item within the playlist, unless it has no ``setVideoId``
+        and its video is in the playlist more than once, see :func:`item_keys`"""
+        return self.setVideoId or self.videoId
+
+    @classmethod
+    def from_track(cls, track: Mapping[str, Any]) -> "SnapshotItem | None":
+        """Returns the item of a track, or None if it cannot be identified"""
+        if not track.get("setVideoId") and not track.get("videoId"):
+            return None
+        vote = track.get("communityVoteStatus") or {}
+        status = vote.get("status")
+        return cls(
+            track.get("videoId"),
+            track.get("setVideoId"),
+            track.get("likeStatus"),
+            status.value if isinstance(status, Enum) else status,
+            vote.get("netVoteValue"),
+        )
+
+
+@dataclass
+class PlaylistSnapshot:
+    """The state of a playlist after a sync. Positions are the indices of ``items``"""
+
+    playlistId: str
+    #: compact metadata, i.e. ``title``, ``privacy`` and ``trackCount``
+    header: JsonDict
+    items: list[SnapshotItem]
+
+    def to_dict(self) -> JsonDict:
+        """Returns the snapshot as JSON-serializable dictionary"""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "playlistId": self.playlistId,
+            "header": self.header,
+            "items": [list(item) for item in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, data: JsonDict) -> "PlaylistSnapshot":
+        """Restores a snapshot returned by :meth:`to_dict`"""
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {data.get('version')}")
+        return cls(data["playlistId"], data["header"], [SnapshotItem(*item) for item in data["items"]])
+
+
+@dataclass
+class PlaylistDiff:
+    """Changes of a playlist since a snapshot. Positions refer to the old and the new snapshot"""
+
+    #: changed header fields with their old and new values
+    header: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    #: new position and the parsed track of each added item
+    added: list[tuple[int, JsonDict]] = field(default_factory=list)
+    removed: list[SnapshotItem] = field(default_factory=list)
+    #: items which changed their position relative to the others, with their old and new positions
+    moved: list[tuple[SnapshotItem, int, int]] = field(default_factory=list)
+    #: old and new state of items whose like or vote status changed
+    changed: list[tuple[SnapshotItem, SnapshotItem]] = field(default_factory=list)
+    #: number of pages requested
+    pages: int = 0
+    #: False if pagination stopped early, because the remaining pages were assumed to match the snapshot
+    complete: bool = True
+
+    def __bool__(self) -> bool:
+        return bool(self.header or self.added or self.removed or self.moved or self.changed)
+
+
+def item_keys(items: Sequence[SnapshotItem]) -> list[tuple[str | None, int]]:
+    """
+    Keys identifying each item within the playlist, also in playlists without ``setVideoId``,
+    like playlists of other users: the :attr:`SnapshotItem.key` and the number of earlier items
+    with the same key, so that the copies of a video added twice are distinct items
+    """
+    occurrences: dict[str | None, int] = {}
+    keys = []
+    for item in items:
+        occurrence = occurrences.get(item.key, 0)
+        occurrences[item.key] = occurrence + 1
+        keys.append((item.key, occurrence))
+    return keys
+
+
+def remaining_items(
+    snapshot: PlaylistSnapshot, header: JsonDict, items: list[SnapshotItem], page_start: int
+) -> list[SnapshotItem] | None:
+    """
+    Returns the items of the snapshot expected after ``items``, if the last page of ``items`` shows that
+    they are unchanged, or None if further pages must be requested
+
+    The last page matches if each of its items is unchanged and at its old position shifted by the change
+    of the track count, and the track count is reached with the remaining items of the snapshot.
+    """
+    track_count, old_track_count = header.get("trackCount"), snapshot.header.get("trackCount")
+    if track_count is None or old_track_count is None or page_start >= len(items):
+        return None
+    shift = track_count - old_track_count
+    for position in range(page_start, len(items)):
+        old_position = position - shift
+        if not 0 <= old_position < len(snapshot.items) or snapshot.items[old_position] != items[position]:
+            return None
+    rest = snapshot.items[len(items) - shift :]
+    if len(items) + len(rest) != track_count:
+        return None
+    return rest
+
+
+def diff_playlist(
+    old: PlaylistSnapshot | None, new: PlaylistSnapshot, tracks: Mapping[str | None, JsonDict]
+) -> PlaylistDiff:
+    """
+    Compares two snapshots of a playlist
+
+    :param tracks: parsed tracks of the new snapshot by :attr:`SnapshotItem.key`, which must contain the added items.
+        Copies of a track without ``setVideoId`` share their parsed track
+    """
+    diff = PlaylistDiff()
+    old_header = old.header if old is not None else {}
+    for key in old_header.keys() | new.header.keys():
+        if old_header.get(key) != new.header.get(key):
+            diff.header[key] = (old_header.get(key), new.header.get(key))
+
+    old_items = old.items if old is not None else []
+    old_keys = item_keys(old_items)
+    old_positions = {key: position for position, key in enumerate(old_keys)}
+    new_keys = item_keys(new.items)
+    new_key_set = set(new_keys)
+    diff.removed = [item for item, item_key in zip(old_items, old_keys) if item_key not in new_key_set]
+
+    common: list[tuple[int, SnapshotItem, int]] = []
+    for position, (item, item_key) in enumerate(zip(new.items, new_keys)):
+        if item_key in old_positions:
+            common.append((position, item, old_positions[item_key]))
+        else:
+            diff.added.append((position, tracks[item.key]))
+
+    in_order = set(longest_increasing_subsequence([old_position for _, _, old_position in common]))
+    for index, (position, item, old_position) in enumerate(common):
+        if index not in in_order:
+            diff.moved.append((item, old_position, position))
+        if old_items[old_position][2:] != item[2:]:
+            diff.changed.append((old_items[old_position], item))
+    return diff
@@ -0,0 +1,108 @@
+"""network backends used to send requests to YouTube Music
+
+:class:`~ytmusicapi.YTMusic` sends all of its requests through a :class:`Transport`.
+The default :class:`RequestsTransport` uses a :class:`requests.Session`. Other backends,
+i.e. a HTTP/2 client, an instrumented client or a replaying test double, can be provided by
+implementing the three methods of :class:`Transport` and passing an instance as ``transport``.
+"""
+
+from collections.abc import Mapping
+from typing import BinaryIO, Protocol
+
+import requests
+from requests import Response
+
+from ytmusicapi.type_alias import JsonDict
+
+#: request body of an upload: raw bytes or a file object, which should be streamed
+UploadData = bytes | BinaryIO
+
+
+class Transport(Protocol):
+    """Sends requests to YouTube Music and returns the responses without raising for error codes"""
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        """Sends ``body`` serialized as JSON in a POST request"""
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        """Sends a GET request"""
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        """Sends ``data`` in a POST request. File objects should be streamed instead of read at once"""
+
+
+class AsyncTransport(Protocol):
+    """Asynchronous counterpart of :class:`Transport`, used by :class:`~ytmusicapi.async_ytmusic.AsyncYTMusic`"""
+
+    async def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        """Sends ``body`` serialized as JSON in a POST request"""
+
+    async def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        """Sends a GET request"""
+
+    async def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        """Sends ``data`` in a POST request. File objects should be streamed instead of read at once"""
+
+
+class RequestsTransport:
+    """Default transport, sending requests with a :class:`requests.Session` for connection pooling"""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def post(
+        self,
+        url: str,
+        body: JsonDict,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self.session.post(url, json=body, headers=headers, cookies=dict(cookies), proxies=proxies)
+
+    def get(
+        self,
+        url: str,
+        params: JsonDict | None,
+        headers: Mapping[str, str],
+        cookies: Mapping[str, str],
+        proxies: dict[str, str] | None,
+    ) -> Response:
+        return self.session.get(url, params=params, headers=headers, cookies=dict(cookies), proxies=proxies)
+
+    def upload(
+        self, url: str, data: UploadData, headers: Mapping[str, str], proxies: dict[str, str] | None
+    ) -> Response:
+        return self.session.post(url, data=data, headers=headers, proxies=proxies)
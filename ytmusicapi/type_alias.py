@@ -8,3 +8,4 @@ RequestFuncType = Callable[[str], JsonDict]
 RequestFuncBodyType = Callable[[JsonDict], JsonDict]
 ParseFuncType = Callable[[JsonList], JsonList]
 ParseFuncDictType = Callable[[JsonDict], JsonDict]
+ParsePlaylistItemFuncType = Callable[[JsonDict, bool, bool], Any]
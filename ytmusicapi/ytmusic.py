@@ -3,10 +3,14 @@ from __future__ import annotations
 import gettext
 import json
 import locale
+import threading
 import time
 from collections.abc import Iterator
+from concurrent.futures import Executor
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from functools import cached_property, partial
+from hashlib import sha256
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING
@@ -22,12 +26,14 @@ from ytmusicapi.helpers import (
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
     YTM_BASE_API,
+    YTM_DOMAIN,
     YTM_PARAMS,
     YTM_PARAMS_KEY,
     get_authorization,
-    get_visitor_id,
     initialize_context,
     initialize_headers,
+    parse_basejs_url,
+    parse_visitor_id,
     sapisid_from_cookie,
 )
 from ytmusicapi.mixins.browsing import BrowsingMixin
@@ -45,9 +51,21 @@ from .auth.auth_parse import determine_auth_type, parse_auth_str
 from .auth.oauth import OAuthCredentials, RefreshingToken
 from .auth.oauth.token import Token
 from .auth.types import AuthType
+from .cache import ResponseCache, is_write
+from .decoder import JsonDecoder, get_decoder
 from .exceptions import YTMusicServerError, YTMusicUserError
+from .instrumentation import MetricsCallback, current_call, instrument, mixin_methods, record_request
+from .retry import RetryPolicy, RetryStats, send_with_retries
+from .singleflight import SingleFlight
+from .transport import RequestsTransport, Transport
 from .type_alias import JsonDict
 
+#: client of the Android app, which :meth:`YTMusicBase.as_mobile` sends requests as
+MOBILE_CLIENT = {"clientName": "ANDROID_MUSIC", "clientVersion": "7.21.50"}
+
+#: ids of the instances in :meth:`YTMusicBase.as_mobile` in the current thread or task
+_mobile_instances: ContextVar[frozenset[int]] = ContextVar("ytmusicapi_mobile_instances", default=frozenset())
+
 
 class YTMusicBase:
     def __init__(
@@ -59,6 +77,13 @@ class YTMusicBase:
         language: str = "en",
         location: str = "",
         oauth_credentials: OAuthCredentials | None = None,
+        transport: Transport | None = None,
+        cache: ResponseCache | None = None,
+        executor: Executor | None = None,
+        metrics: MetricsCallback | None = None,
+        json_decoder: JsonDecoder | None = None,
+        retry: RetryPolicy | None = None,
+        coalesce: bool | SingleFlight[tuple[Response, int]] = True,
     ):
         """
         Create a new instance to interact with YouTube Music.
@@ -93,9 +118,48 @@ class YTMusicBase:
             Available languages can be checked in the FAQ.
         :param oauth_credentials: Optional. Used to specify a different oauth client to be
             used for authentication flow.
+        :param transport: Optional. Network backend used to send all requests,
+            see :py:class:`ytmusicapi.transport.Transport`.
+            Default: a :py:class:`ytmusicapi.transport.RequestsTransport` using ``requests_session``.
+        :param cache: Optional. Caches responses of read-only endpoints like ``browse``,
+            see :py:class:`ytmusicapi.cache.ResponseCache`. Default: no caching.
+        :param executor: Optional. Used to send requests concurrently within a single call, i.e. to fetch
+            the next page of a playlist while the current page is parsed, or a playlist's suggestions and
+            related playlists alongside its tracks. A ``concurrent.futures.ThreadPoolExecutor(4)`` works well.
+            The executor is not shut down by this instance. Default: all requests are sent one after another.
+        :param metrics: Optional. Called with the timings and sizes of each call of a public method and
+            its requests, see :py:class:`ytmusicapi.instrumentation.CallMetrics`. Default: no instrumentation.
+        :param json_decoder: Optional. Decodes the bytes of JSON responses, see :py:mod:`ytmusicapi.decoder`.
+            Default: orjson or msgspec if installed, otherwise the standard library.
+        :param retry: Optional. Resends requests failing with transient errors like 429 or 503 responses and
+            connection resets, see :py:class:`ytmusicapi.retry.RetryPolicy`. Retries are counted in
+            :py:attr:`retry_stats`. Default: requests are sent once.
+        :param coalesce: Optional. Whether identical read requests sent by several threads at the same time,
+            including downloads of the homepage and player script, share one network call,
+            see :py:mod:`ytmusicapi.singleflight`. Each caller still decodes and parses the response on its own.
+            A :py:class:`~ytmusicapi.singleflight.SingleFlight` is used to coalesce the requests, i.e. to wait
+            for them in another way. Default: True
         """
         #: request session for connection pooling
         self._session = self._prepare_session(requests_session)
+        self._base_headers: CaseInsensitiveDict[str] | None = None
+        self._base_headers_lock = threading.Lock()
+        #: network backend all requests are sent with
+        self._transport: Transport = transport or RequestsTransport(self._session)
+        #: opt-in response cache
+        self.cache = cache
+        self._executor = executor
+        self._decode_json = json_decoder or get_decoder()
+        #: opt-in retry policy
+        self.retry = retry
+        #: counters of requests and retries
+        self.retry_stats = RetryStats()
+        self._flights: SingleFlight[tuple[Response, int]] | None = (
+            coalesce if isinstance(coalesce, SingleFlight) else SingleFlight() if coalesce else None
+        )
+        if metrics is not None:
+            for name, _ in mixin_methods(type(self)):
+                setattr(self, name, instrument(getattr(self, name), name, metrics))
         self.proxies: dict[str, str] | None = proxies  #: params for session modification
         # see google cookie docs: https://policies.google.com/technologies/cookies
         # value from https://github.com/yt-dlp/yt-dlp/blob/2023.09.24/yt_dlp/extractor/youtube.py#L502
@@ -162,22 +226,64 @@ class YTMusicBase:
             except KeyError:
                 raise YTMusicUserError("Your cookie is missing the required value __Secure-3PAPISID")
 
-    @cached_property
+    @property
     def base_headers(self) -> CaseInsensitiveDict[str]:
-        headers = (
-            self._auth_headers
-            if self.auth_type == AuthType.BROWSER or self.auth_type == AuthType.OAUTH_CUSTOM_FULL
-            else initialize_headers()
-        )
+        """headers shared by all requests, which must not be modified. The visitor id is requested
+        on first use, once even if several threads send their first requests at the same time"""
+        return self._init_base_headers()
+
+    def _init_base_headers(self) -> CaseInsensitiveDict[str]:
+        """initializes the base headers on first use and returns them. Without a cached visitor id,
+        this requests the homepage, which also caches the URL of the player script"""
+        if self._base_headers is None:
+            with self._base_headers_lock:
+                if self._base_headers is None:
+                    headers = (
+                        self._auth_headers
+                        if self.auth_type == AuthType.BROWSER or self.auth_type == AuthType.OAUTH_CUSTOM_FULL
+                        else initialize_headers()
+                    )
 
-        if "X-Goog-Visitor-Id" not in headers:
-            headers.update(get_visitor_id(partial(self._send_get_request, use_base_headers=True)))
+                    if "X-Goog-Visitor-Id" not in headers:
+                        visitor_id = self.cache.get_visitor_id() if self.cache is not None else None
+                        if visitor_id is None:
+                            visitor_id = self._fetch_visitor_id()
+                        headers["X-Goog-Visitor-Id"] = visitor_id
+
+                    self._base_headers = headers
+        return self._base_headers
+
+    def _fetch_visitor_id(self) -> str:
+        """requests the visitor id from the homepage and stores it in the cache,
+        along with the URL of the player script referenced by the homepage"""
+        html = self._send_get_request(YTM_DOMAIN, use_base_headers=True).text
+        visitor_id = parse_visitor_id(html)
+        if self.cache is not None:
+            self.cache.set_visitor_id(visitor_id)
+            if (basejs_url := parse_basejs_url(html)) is not None:
+                self.cache.set_basejs_url(basejs_url)
+        return visitor_id
+
+    def refresh_visitor_id(self) -> str:
+        """
+        Requests a new visitor id and stores it in the cache, so that other instances and processes
+        using the same cache backend do not request it themselves. Running this in a deployment step
+        or a periodic job before the cached visitor id expires means that workers never request it.
 
-        return headers
+        :return: The new visitor id
+        """
+        visitor_id = self._fetch_visitor_id()
+        with self._base_headers_lock:
+            if self._base_headers is not None:
+                headers = self._base_headers.copy()  # requests in flight may be using the current headers
+                headers["X-Goog-Visitor-Id"] = visitor_id
+                self._base_headers = headers
+        return visitor_id
 
     @property
     def headers(self) -> CaseInsensitiveDict[str]:
-        headers = self.base_headers
+        """headers of a request, a copy of the base headers with the authorization of this request"""
+        headers = self.base_headers.copy()
 
         # keys updated each use, custom oauth implementations left untouched
         if self.auth_type == AuthType.BROWSER:
@@ -194,15 +300,12 @@ class YTMusicBase:
     @contextmanager
     def as_mobile(self) -> Iterator[None]:
         """
-        Not thread-safe!
-        ----------------
-
         Temporarily changes the `context` to enable different results
         from the API, meant for the Android mobile-app.
         All calls inside the `with`-statement with emulate mobile behavior.
 
-        This context-manager has no `enter_result`, as it operates in-place
-        and only temporarily alters the underlying `YTMusic`-object.
+        This context-manager has no `enter_result`. It only affects calls in the current thread or task,
+        so other threads can keep using the same `YTMusic`-object as the web-app meanwhile.
 
 
         Example::
@@ -213,17 +316,18 @@ class YTMusicBase:
             yt._send_request(...)  # back to normal, like web-app
 
         """
-
-        # change the context to emulate a mobile-app (Android)
-        copied_context_client = self.context["context"]["client"].copy()
-        self.context["context"]["client"].update({"clientName": "ANDROID_MUSIC", "clientVersion": "7.21.50"})
-
-        # this will not catch errors
+        token = _mobile_instances.set(_mobile_instances.get() | {id(self)})
         try:
             yield None
         finally:
-            # safely restore the old context
-            self.context["context"]["client"] = copied_context_client
+            _mobile_instances.reset(token)
+
+    def _request_context(self) -> JsonDict:
+        """the context sent with requests, which is a copy with the mobile client inside :meth:`as_mobile`"""
+        if id(self) not in _mobile_instances.get():
+            return self.context
+        context = self.context["context"]
+        return {"context": {**context, "client": {**context["client"], **MOBILE_CLIENT}}}
 
     def _prepare_session(self, requests_session: requests.Session | None) -> requests.Session:
         """Prepare requests session or use user-provided requests_session"""
@@ -233,34 +337,112 @@ class YTMusicBase:
         self._session.request = partial(self._session.request, timeout=30)  # type: ignore[method-assign]
         return self._session
 
-    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
-        body.update(self.context)
+    @cached_property
+    def _auth_identity(self) -> str:
+        """Hash identifying the authenticated account, without containing its credentials"""
+        if self.auth_type == AuthType.UNAUTHORIZED:
+            return ""
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            credential = self._token.refresh_token
+        else:
+            credential = self._auth_headers.get("cookie", "") + self._auth_headers.get("authorization", "")
+        credential += self._auth_headers.get("x-goog-authuser", "")
+        return sha256(credential.encode("utf-8")).hexdigest()
+
+    def _cache_namespace(self) -> str:
+        """Identifies the client state responses depend on, to be included in cache keys"""
+        context = self._request_context()["context"]
+        client = context["client"]
+        user = context["user"].get("onBehalfOfUser", "")
+        return "/".join([client["clientName"], client["hl"], client.get("gl", ""), user, self._auth_identity])
 
-        response = self._session.post(
+    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
+        call = current_call()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(endpoint, body, additionalParams, self._cache_namespace())
+            if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+                if call is not None:
+                    record_request(call, endpoint, body, additionalParams, None, cache="hit")
+                return cached
+
+        body = {**body, **self._request_context()}  # the caller's body may be shared with other threads
+
+        start = time.perf_counter()
+        send = partial(
+            self._transport.post,
             YTM_BASE_API + endpoint + self.params + additionalParams,
-            json=body,
+            body,
             headers=self.headers,
-            proxies=self.proxies,
             cookies=self.cookies,
+            proxies=self.proxies,
         )
-        response_text: JsonDict = json.loads(response.text)
+        write = is_write(endpoint, body)
+        shared = False
+        if self._flights is None or write:
+            response, retries = send_with_retries(send, self.retry, self.retry_stats, write)
+        else:
+            flight = json.dumps([endpoint + additionalParams, body], sort_keys=True)
+            (response, retries), shared = self._flights.do(
+                flight, partial(send_with_retries, send, self.retry, self.retry_stats)
+            )
+        received = time.perf_counter()
+        if self.cache is not None and cache_key is None:
+            self.cache.invalidate(endpoint, body)
+        decode_start = time.perf_counter()
+        try:
+            response_text: JsonDict = self._decode_json(response.content)
+        except ValueError:
+            if response.status_code < 400:
+                raise
+            response_text = {}  # i.e. an HTML error page of a proxy
+        if call is not None:
+            stored = cache_key is not None and response.status_code < 400
+            timings = (received - start, time.perf_counter() - decode_start)
+            record_request(
+                call,
+                endpoint,
+                body,
+                additionalParams,
+                response,
+                *timings,
+                cache="miss" if stored else None,
+                retries=retries,
+                shared=shared,
+            )
         if response.status_code >= 400:
             message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
-            error = response_text.get("error", {}).get("message")
+            error = response_text.get("error", {}).get("message", "")
             raise YTMusicServerError(message + error)
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, endpoint, body, response_text)
         return response_text
 
     def _send_get_request(
-        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
+        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False, write: bool = False
     ) -> Response:
-        response = self._session.get(
+        start = time.perf_counter()
+        send = partial(
+            self._transport.get,
             url,
-            params=params,
+            params,
             # handle first-use x-goog-visitor-id fetching
             headers=initialize_headers() if use_base_headers else self.headers,
-            proxies=self.proxies,
             cookies=self.cookies,
+            proxies=self.proxies,
         )
+        shared = False
+        if self._flights is None or write:
+            response, retries = send_with_retries(send, self.retry, self.retry_stats, write)
+        else:
+            flight = json.dumps(["GET", url, params], sort_keys=True)
+            (response, retries), shared = self._flights.do(
+                flight, partial(send_with_retries, send, self.retry, self.retry_stats)
+            )
+        if (call := current_call()) is not None:
+            total = time.perf_counter() - start
+            record_request(call, url, params, "", response, total, retries=retries, shared=shared)
         return response
 
     def _check_auth(self) -> None: